@@ -0,0 +1 @@
+"""Benchmarks for the game hot paths. Run with: python -m benchmarks.run"""
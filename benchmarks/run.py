@@ -0,0 +1,221 @@
+# benchmarks/run.py
+"""
+Micro and macro benchmarks for the game hot paths.
+
+Micro: complete_card, NumberDrawer.draw_next, Player.mark_number, check_line,
+check_bingo, bot_play_turn and print_pretty_card (seconds per call, median of
+--repeat runs).
+Macro: full GameEngine games (scripted human + bots, no output) at several
+hall sizes (seconds per game, median of at least 3 runs).
+
+Results are written as JSON. With --baseline, every benchmark present in both
+files is compared and the run fails (exit code 1) when one is slower than the
+baseline by more than --threshold. benchmarks/baseline.json is the committed
+reference; regenerate it with --save-baseline when the hardware or an intended
+speed trade-off changes. Even medians of repeated runs (with the GC off)
+moved by up to 1.8x between runs on a shared VM, so the default threshold is
+100%: it catches real slowdowns, not noise. Lower it on quiet hardware.
+
+Run:
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json
+    python -m benchmarks.run --save-baseline benchmarks/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+from src.game.bingo_card import complete_card, generate_cards
+from src.game.engine import GameEngine, ScriptedProvider
+from src.game.number_draw import NumberDrawer
+from src.game.player import Player
+from src.main import print_pretty_card
+
+DEFAULT_SIZES = (5, 10, 20, 1_000, 100_000)
+DEFAULT_THRESHOLD = 1.00
+
+
+def median_per_call(fn: Callable[[], object], *, number: int, repeat: int) -> float:
+    """Median seconds per call of fn over `repeat` runs of `number` calls (GC off, like timeit)."""
+    runs = []
+    for _ in range(repeat):
+        with _gc_paused():
+            t0 = time.perf_counter()
+            for _ in range(number):
+                fn()
+            runs.append((time.perf_counter() - t0) / number)
+    return statistics.median(runs)
+
+
+@contextlib.contextmanager
+def _gc_paused() -> Iterator[None]:
+    enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def micro_benchmarks(repeat: int = 7) -> Dict[str, float]:
+    rng = random.Random(0)
+    card = complete_card(rng)
+    numbers = [n for row in card for n in row]
+    player = Player("P", card, is_bot=True)
+    for n in numbers[:7]:
+        player.mark_number(n)
+    results: Dict[str, float] = {}
+
+    results["complete_card"] = median_per_call(lambda: complete_card(rng), number=2_000, repeat=repeat)
+
+    drawer = NumberDrawer(rng=rng)
+
+    def draw_all() -> None:
+        drawer.seek(0)
+        for _ in range(90):
+            drawer.draw_next()
+
+    results["NumberDrawer.draw_next"] = median_per_call(draw_all, number=200, repeat=repeat) / 90
+
+    cycle = list(range(1, 91))
+    it = iter(())
+
+    def next_number() -> int:
+        nonlocal it
+        n = next(it, None)
+        if n is None:
+            it = iter(cycle)
+            n = next(it)
+        return n
+
+    results["Player.mark_number"] = median_per_call(
+        lambda: player.mark_number(next_number()), number=20_000, repeat=repeat)
+    results["Player.check_line"] = median_per_call(player.check_line, number=20_000, repeat=repeat)
+    results["Player.check_bingo"] = median_per_call(player.check_bingo, number=20_000, repeat=repeat)
+
+    def bot_turn() -> None:
+        n = next_number()
+        if n == 1:  # fresh card state every pass over the pool
+            bot.marked = set()
+            bot.has_line = bot.has_bingo = False
+        bot.bot_play_turn(n)
+
+    bot = Player("B", card, is_bot=True)
+    results["Player.bot_play_turn"] = median_per_call(bot_turn, number=20_000, repeat=repeat)
+
+    sink = io.StringIO()
+
+    def render() -> None:
+        sink.seek(0)
+        with contextlib.redirect_stdout(sink):
+            print_pretty_card(card, player.marked, title="Your card right now:")
+
+    results["print_pretty_card"] = median_per_call(render, number=2_000, repeat=repeat)
+    return results
+
+
+def game_benchmark(n_players: int, repeat: int) -> float:
+    """
+    Median seconds per full game with 1 scripted human + (n_players - 1) bots.
+    Every repetition replays the same seeded game so runs are comparable.
+    """
+    runs = []
+    for _ in range(repeat):
+        rng = random.Random(n_players)
+        cards = generate_cards(n_players, rng=rng)
+        players = [Player("You", cards[0], points=100)]
+        players += [Player(f"Bot-{i+1}", c, is_bot=True, points=100) for i, c in enumerate(cards[1:])]
+        engine = GameEngine(players, NumberDrawer(rng=rng), providers={0: ScriptedProvider()})
+        with _gc_paused():
+            t0 = time.perf_counter()
+            engine.run()
+            runs.append(time.perf_counter() - t0)
+    return statistics.median(runs)
+
+
+def run_all(sizes: Sequence[int] = DEFAULT_SIZES, repeat: int = 7) -> Dict[str, float]:
+    results = micro_benchmarks(repeat)
+    for n in sizes:
+        reps = 3 if n >= 10_000 else max(3, repeat) if n >= 1_000 else 10 * repeat
+        results[f"game[{n}]"] = game_benchmark(n, repeat=reps)
+    return results
+
+
+def compare(
+    results: Dict[str, float],
+    baseline: Dict[str, float],
+    threshold: float,
+) -> List[str]:
+    """Names (with ratios) of benchmarks slower than baseline * (1 + threshold)."""
+    regressions = []
+    for name, seconds in sorted(results.items()):
+        base = baseline.get(name)
+        if base and seconds > base * (1 + threshold):
+            regressions.append(f"{name}: {seconds / base:.2f}x baseline ({seconds:.3e}s vs {base:.3e}s)")
+    return regressions
+
+
+def _document(results: Dict[str, float]) -> Dict[str, object]:
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Mini Bingo hot paths.")
+    parser.add_argument("--sizes", default=",".join(str(n) for n in DEFAULT_SIZES),
+                        help="Comma-separated player counts for full games.")
+    parser.add_argument("--repeat", type=int, default=7, help="Runs per benchmark (the median is kept).")
+    parser.add_argument("--output", default=None, help="Write results JSON here (default: stdout).")
+    parser.add_argument("--baseline", default=None, help="Fail on regressions against this results file.")
+    parser.add_argument("--save-baseline", default=None, help="Also write the results as a new baseline.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown before failing (1.00 = 100%%).")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    doc = _document(run_all(sizes, repeat=args.repeat))
+    text = json.dumps(doc, indent=2)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(doc["results"], baseline, args.threshold)
+        if regressions:
+            print("Performance regressions:", file=sys.stderr)
+            for line in regressions:
+                print(f"  - {line}", file=sys.stderr)
+            return 1
+        print(f"No regressions above {args.threshold:.0%}.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
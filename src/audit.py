@@ -0,0 +1,90 @@
+# src/audit.py
+"""
+Audit a card distribution for identical cards, shared rows and near-duplicates.
+
+Reads a card bank, or deals a hall with complete_card() or random_cards(),
+and runs game.audit.audit_cards() over it. Exits with status 1 when anything
+was found, so it can gate a card bank before it goes live.
+
+Run:
+    python -m src.audit --bank cards.bnk
+    python -m src.audit --deal 10000 --seed 1          # complete_card() hall
+    python -m src.audit --random 1000000 --min-shared 13 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .game.audit import audit_cards, lsh_recall
+from .game.batch import cards_to_array, random_cards
+from .game.bingo_card import complete_card
+from .game.card_bank import CardBank
+from .game.rng import rng_stream
+
+
+def print_report(summary: Dict[str, object], seconds: float, recall: float) -> None:
+    print(f"Cards audited:        {summary['cards']} ({seconds:.1f}s)")
+    print(f"Identical cards:      {summary['identical_cards']} in {summary['identical_groups']} groups")
+    print(f"Shared full rows:     {summary['shared_row_pairs']} pairs over {summary['cards_with_shared_rows']} cards")
+    print(
+        f"Sharing >= {summary['min_shared']} numbers: {summary['overlap_pairs']} pairs "
+        f"({summary['candidates_checked']} candidates checked, recall at threshold {recall:.2f})"
+    )
+    examples = summary["examples"]
+    for group in examples["identical"]:
+        print(f"  identical: cards {', '.join(map(str, group))}")
+    for a, row_a, b, row_b in examples["shared_rows"]:
+        print(f"  shared row: card {a} row {row_a + 1} = card {b} row {row_b + 1}")
+    for a, b, shared in examples["overlaps"]:
+        print(f"  overlap: cards {a} and {b} share {shared} numbers")
+    print("OK" if summary["ok"] else "FINDINGS")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Audit bingo cards for duplicates and overlaps.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--bank", help="Card bank file to audit.")
+    source.add_argument("--deal", type=int, help="Audit this many cards dealt with complete_card().")
+    source.add_argument("--random", type=int, help="Audit this many cards from batch.random_cards().")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for --deal/--random and the MinHash permutations.")
+    parser.add_argument("--min-shared", type=int, default=12, help="Report pairs sharing at least this many numbers.")
+    parser.add_argument("--bands", type=int, default=64, help="LSH bands (more = higher recall, slower).")
+    parser.add_argument("--limit", type=int, default=20, help="Examples to print per finding.")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON.")
+    args = parser.parse_args(argv)
+
+    bank = None
+    if args.bank:
+        bank = CardBank(args.bank)
+        cards = bank.as_array()
+    elif args.deal is not None:
+        rng = rng_stream(args.seed, "audit")
+        cards = cards_to_array([complete_card(rng=rng) for _ in range(args.deal)])
+    else:
+        cards = random_cards(args.random, np.random.default_rng(args.seed))
+
+    card_size = int(np.count_nonzero(cards[0])) if len(cards) else 0
+    start = time.perf_counter()
+    try:
+        report = audit_cards(cards, min_shared=args.min_shared, bands=args.bands, seed=args.seed)
+    finally:
+        del cards
+        if bank is not None:
+            bank.close()
+    seconds = time.perf_counter() - start
+    summary = report.summary(args.limit)
+    if args.json:
+        print(json.dumps({**summary, "seconds": round(seconds, 3)}, indent=2))
+    else:
+        print_report(summary, seconds, lsh_recall(args.min_shared, card_size, bands=args.bands))
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,151 @@
+# src/game/batch.py
+"""
+Vectorized batch engine: settle a whole game for N cards at once.
+
+Cards are stored as a (N, BOARD_ROWS, BOARD_COLS) uint8 array. Given the draw
+order of a game (e.g. NumberDrawer.sequence()), every card's line and bingo
+turns come out of one pass:
+
+    turn of each cell  = position of its number in the draw order
+    row complete turn  = max over the row's cells
+    first line turn    = min over rows
+    bingo turn         = max over rows
+
+No per-card Python loop is involved, so millions of cards are settled in the
+time the Player loop needs for a few hundred.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from .bingo_card import BOARD_ROWS, BOARD_COLS, CARD_SIZE, NUMBER_RANGE
+
+# Turn value reported for cards that never complete within the given draws.
+NEVER = 0
+
+
+def cards_to_array(cards: Sequence[Sequence[Sequence[int]]]) -> np.ndarray:
+    """Pack cards from complete_card() into a (N, BOARD_ROWS, BOARD_COLS) uint8 array."""
+    arr = np.asarray(cards, dtype=np.uint8)
+    if arr.ndim != 3 or arr.shape[1:] != (BOARD_ROWS, BOARD_COLS):
+        raise ValueError(f"expected shape (N, {BOARD_ROWS}, {BOARD_COLS}), got {arr.shape}")
+    return arr
+
+
+def random_cards(
+    n: int,
+    rng: Optional[np.random.Generator] = None,
+    *,
+    chunk: int = 100_000,
+) -> np.ndarray:
+    """
+    Generate n valid cards directly as a (n, BOARD_ROWS, BOARD_COLS) uint8 array.
+
+    Each card is the first CARD_SIZE entries of an independent random permutation
+    of NUMBER_RANGE (numbers and layout distributed like complete_card()),
+    produced in chunks to keep temporary memory bounded.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    low, high = NUMBER_RANGE
+    width = high - low + 1
+    out = np.empty((n, CARD_SIZE), dtype=np.uint8)
+    for start in range(0, n, chunk):
+        stop = min(start + chunk, n)
+        keys = rng.random((stop - start, width))
+        picked = np.argpartition(keys, CARD_SIZE, axis=1)[:, :CARD_SIZE]
+        # argpartition leaves the picked numbers in no particular order: sort them
+        # by their keys so the layout on the card is uniformly random too.
+        order = np.argsort(np.take_along_axis(keys, picked, axis=1), axis=1)
+        out[start:stop] = np.take_along_axis(picked, order, axis=1) + low
+    return out.reshape(n, BOARD_ROWS, BOARD_COLS)
+
+
+def draw_positions(draws: Sequence[int]) -> np.ndarray:
+    """
+    Lookup table number -> turn it was drawn (1-based).
+
+    Numbers that are not in `draws` get len(draws) + 1, i.e. "after the game".
+    """
+    draws_arr = np.asarray(draws, dtype=np.int64)
+    high = max(NUMBER_RANGE[1], int(draws_arr.max(initial=0)))
+    pos = np.full(high + 1, len(draws_arr) + 1, dtype=np.uint16)
+    pos[draws_arr] = np.arange(1, len(draws_arr) + 1, dtype=np.uint16)
+    return pos
+
+
+def turn_groups(turns: np.ndarray) -> Dict[int, np.ndarray]:
+    """Group card indices by turn: {turn: indices}. Cards marked NEVER are left out."""
+    order = np.argsort(turns, kind="stable")
+    sorted_turns = turns[order]
+    values, starts = np.unique(sorted_turns, return_index=True)
+    groups = np.split(order, starts[1:])
+    return {int(t): g for t, g in zip(values, groups) if t != NEVER}
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a game for a batch of cards. Turns are 1-based; NEVER (0) = not reached."""
+
+    line_turns: np.ndarray
+    bingo_turns: np.ndarray
+
+    @staticmethod
+    def _first(turns: np.ndarray) -> int:
+        reached = turns[turns != NEVER]
+        return int(reached.min()) if reached.size else NEVER
+
+    @property
+    def line_turn(self) -> int:
+        """Turn on which the first line of the hall is completed."""
+        return self._first(self.line_turns)
+
+    @property
+    def bingo_turn(self) -> int:
+        """Turn on which the first bingo of the hall is completed."""
+        return self._first(self.bingo_turns)
+
+    @property
+    def line_winners(self) -> np.ndarray:
+        """Indices of the cards completing a line on line_turn (several = tie)."""
+        t = self.line_turn
+        return np.flatnonzero(self.line_turns == t) if t != NEVER else np.empty(0, dtype=np.intp)
+
+    @property
+    def bingo_winners(self) -> np.ndarray:
+        """Indices of the cards completing bingo on bingo_turn (several = tie)."""
+        t = self.bingo_turn
+        return np.flatnonzero(self.bingo_turns == t) if t != NEVER else np.empty(0, dtype=np.intp)
+
+    def line_groups(self) -> Dict[int, np.ndarray]:
+        return turn_groups(self.line_turns)
+
+    def bingo_groups(self) -> Dict[int, np.ndarray]:
+        return turn_groups(self.bingo_turns)
+
+
+def resolve_batch(cards: np.ndarray, draws: Sequence[int]) -> BatchResult:
+    """
+    Compute every card's first-line and bingo turn for the given draw order.
+
+    Args:
+        cards: (N, BOARD_ROWS, BOARD_COLS) array, see cards_to_array().
+        draws: Draw order, e.g. NumberDrawer(seed=...).sequence(). May be partial.
+
+    Returns:
+        BatchResult with per-card turns plus hall winners and tie groups.
+    """
+    pos = draw_positions(draws)
+    never = len(draws) + 1
+
+    cell_turns = pos[cards]                    # (N, rows, cols)
+    row_turns = cell_turns.max(axis=2)         # (N, rows): turn each row completes
+    line_turns = row_turns.min(axis=1)
+    bingo_turns = row_turns.max(axis=1)
+
+    line_turns[line_turns == never] = NEVER
+    bingo_turns[bingo_turns == never] = NEVER
+    return BatchResult(line_turns=line_turns, bingo_turns=bingo_turns)
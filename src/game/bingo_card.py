@@ -2,13 +2,16 @@
 from __future__ import annotations
 
 import random
-from typing import List, Sequence
+from typing import List, Optional, Sequence, Set
+
+from .rng import rng_stream
 
 # --- Core constants (can be later loaded from config/settings.yaml) ---
 BOARD_ROWS = 3
 BOARD_COLS = 5
 NUMBER_RANGE = (1, 90)  # inclusive
 CARD_SIZE = BOARD_ROWS * BOARD_COLS  # 15
+BATCH_MIN = 64  # generate_cards() samples through NumPy from this many cards on
 
 
 def generate_empty() -> List[List[int | None]]:
@@ -20,38 +23,193 @@ def generate_empty() -> List[List[int | None]]:
     return [[None for _ in range(BOARD_COLS)] for _ in range(BOARD_ROWS)]
 
 
-def random_generated() -> List[int]:
+def random_generated(rng: Optional[random.Random] = None) -> List[int]:
     """
     Task (Elias): Generate 15 random unique numbers within the valid range (1–90).
 
+    Args:
+        rng: Optional private generator (see game.rng); defaults to the global `random`.
+
     Returns:
         A list of 15 unique integers sampled without replacement from NUMBER_RANGE.
     """
     low, high = NUMBER_RANGE
     population = range(low, high + 1)
-    return random.sample(population, CARD_SIZE)
+    r = rng if rng is not None else random
+    return r.sample(population, CARD_SIZE)
 
 
-def complete_card() -> List[List[int]]:
+def complete_card(rng: Optional[random.Random] = None) -> List[List[int]]:
     """
     Task (Gerard): Allocate the numbers from random_generated() into the empty bingo card slots.
 
+    Args:
+        rng: Optional private generator (see game.rng); defaults to the global `random`.
+
     Returns:
         A BOARD_ROWS x BOARD_COLS matrix filled with 15 unique random numbers.
     """
+    r = rng if rng is not None else random
     empty = generate_empty()
-    numbers = random_generated()
-    random.shuffle(numbers)  # random insertion order across the grid
+    numbers = random_generated(r)
+    r.shuffle(numbers)  # random insertion order across the grid
 
     idx = 0
-    for r in range(BOARD_ROWS):
+    for row in range(BOARD_ROWS):
         for c in range(BOARD_COLS):
-            empty[r][c] = numbers[idx]
+            empty[row][c] = numbers[idx]
             idx += 1
     # type: ignore[return-value]
     return empty  # now it's List[List[int]]
 
 
+def derive_card(series_seed: int | str, card_id: int) -> List[List[int]]:
+    """
+    Deterministically derive card `card_id` of a series, in O(1).
+
+    The card is complete_card() fed by rng_stream(series_seed, "card", card_id),
+    so any node can rebuild any card from (series_seed, card_id) without storing
+    or generating the other cards. Results are stable for a given Python version
+    (random.Random's reproducibility guarantee). Distinct ids are not guaranteed
+    distinct cards, but a collision has odds of about 1 in C(90, 15).
+    """
+    return complete_card(rng_stream(series_seed, "card", card_id))
+
+
+def verify_card(card: Sequence[Sequence[int]], series_seed: int | str, card_id: int) -> bool:
+    """True if `card` is exactly card `card_id` of the series (layout included)."""
+    return [list(row) for row in card] == derive_card(series_seed, card_id)
+
+
+def row_mask(row: Sequence[int | None]) -> int:
+    """Bitmask of a row's numbers: bit n is set when number n is in the row."""
+    mask = 0
+    for v in row:
+        if v is not None:
+            mask |= 1 << v
+    return mask
+
+
+def card_mask(card: Sequence[Sequence[int | None]]) -> int:
+    """Bitmask of all numbers on a card (bit n set <=> n is on the card)."""
+    mask = 0
+    for row in card:
+        mask |= row_mask(row)
+    return mask
+
+
+def card_key(card: Sequence[Sequence[int | None]]) -> int:
+    """
+    Canonical hash of a card: its number mask.
+
+    Two cards holding the same numbers get the same key whatever their layout,
+    since they would always complete bingo on the same turn.
+    """
+    return card_mask(card)
+
+
+def generate_cards(
+    n: int,
+    *,
+    rng: Optional[random.Random] = None,
+    max_overlap: Optional[int] = None,
+    max_attempts: Optional[int] = None,
+) -> List[List[List[int]]]:
+    """
+    Generate n cards at once, all with a different card_key().
+
+    Sampling is batched: the cards are drawn as one NumPy array
+    (batch.random_cards(), seeded from `rng`) and duplicates are dropped by
+    their packed number masks, so dealing a hall costs a few vectorized passes
+    instead of one Python sample per card. Every card is an independent sample
+    of the number range, like complete_card(), so the hall odds in game.odds are
+    exact for them. Small halls (under BATCH_MIN cards, where the array set-up
+    costs more than it saves) and installs without NumPy sample one card at a
+    time instead.
+
+    Args:
+        n: Number of cards.
+        rng: Optional private generator (see game.rng); defaults to the global `random`.
+        max_overlap: If set, no two cards share more than this many numbers.
+            Offending pairs are found with the MinHash/LSH index of game.audit
+            (linear in n, recall >= 0.999 per pair, see audit.lsh_banding()) and
+            the later card of each pair is redrawn. Needs NumPy. The cards are
+            then no longer independent, so the odds become an approximation.
+        max_attempts: Cap on candidate cards tried before giving up
+            (default: 10 * n + 100).
+
+    Raises:
+        ValueError: If the constraints cannot be met within max_attempts.
+    """
+    r = rng if rng is not None else random
+    limit = max_attempts if max_attempts is not None else 10 * n + 100
+    if n < BATCH_MIN and max_overlap is None:
+        return _sample_cards(n, r, limit)
+    try:
+        import numpy as np
+    except ImportError:
+        if max_overlap is not None:
+            raise
+        return _sample_cards(n, r, limit)
+
+    from .audit import audit_cards, lsh_banding, number_masks
+    from .batch import random_cards
+
+    gen = np.random.default_rng(r.getrandbits(64))
+    if max_overlap is not None:
+        bands, rows_per_band = lsh_banding(max_overlap + 1, CARD_SIZE)
+    cards = np.empty((0, BOARD_ROWS, BOARD_COLS), dtype=np.uint8)
+    attempts = 0
+    while len(cards) < n:
+        if attempts >= limit:
+            raise ValueError(f"could only generate {len(cards)} of {n} cards in {limit} attempts")
+        fresh = min(n - len(cards), limit - attempts)
+        attempts += fresh
+        cards = np.concatenate([cards, random_cards(fresh, gen)])
+
+        # Keep the first card of every number set (accepted cards come first).
+        lo, hi = number_masks(cards.reshape(len(cards), CARD_SIZE))
+        _, first = np.unique(np.stack([lo, hi], axis=1), axis=0, return_index=True)
+        cards = cards[np.sort(first)]
+
+        if max_overlap is not None and len(cards) > 1:
+            report = audit_cards(
+                cards, min_shared=max_overlap + 1, bands=bands, rows_per_band=rows_per_band,
+                seed=int(gen.integers(1 << 31)),
+            )
+            dropped = set()
+            for a, b, _shared in report.overlaps.tolist():
+                if a not in dropped and b not in dropped:
+                    dropped.add(b)
+            if dropped:
+                cards = np.delete(cards, sorted(dropped), axis=0)
+    return cards.tolist()
+
+
+def _sample_cards(n: int, r, limit: int) -> List[List[List[int]]]:
+    """generate_cards() without NumPy: one sample per card, duplicates skipped by key."""
+    low, high = NUMBER_RANGE
+    pool = range(low, high + 1)
+    cards: List[List[List[int]]] = []
+    seen: Set[int] = set()
+    attempts = 0
+    while len(cards) < n:
+        if attempts >= limit:
+            raise ValueError(f"could only generate {len(cards)} of {n} cards in {limit} attempts")
+        attempts += 1
+
+        numbers = r.sample(pool, CARD_SIZE)
+        key = 0
+        for v in numbers:
+            key |= 1 << v
+        if key in seen:
+            continue
+
+        seen.add(key)
+        cards.append([numbers[i * BOARD_COLS:(i + 1) * BOARD_COLS] for i in range(BOARD_ROWS)])
+    return cards
+
+
 def _format_row(values: Sequence[int | None]) -> str:
     """Helper: render one table row with proper spacing and borders."""
     # Width 2 or 3 depending on range; 1–90 fits width=2, add padding for readability
@@ -0,0 +1,143 @@
+# src/game/card_bank.py
+"""
+Binary card bank: pre-generated cards stored as fixed-size records.
+
+File layout (little-endian):
+    header  16 bytes   magic b"BINGOBNK", version u8, rows u8, cols u8, pad, count u32
+    records count * rows * cols bytes, one uint8 per cell, row-major
+
+A bank is opened with mmap, so loading a file of millions of cards is instant
+and cards are handed out as zero-copy views that Player, Hall and the printers
+can use like the nested lists from complete_card().
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from typing import Iterable, Iterator, Sequence
+
+from .bingo_card import BOARD_ROWS, BOARD_COLS
+
+MAGIC = b"BINGOBNK"
+VERSION = 1
+HEADER = struct.Struct("<8sBBBxI")
+
+
+class CardView:
+    """Read-only card backed by a slice of the bank; card[r][c] works like a nested list."""
+
+    __slots__ = ("_buf", "_cols")
+
+    def __init__(self, buf: memoryview, cols: int = BOARD_COLS) -> None:
+        self._buf = buf
+        self._cols = cols
+
+    def __len__(self) -> int:
+        return len(self._buf) // self._cols
+
+    def __getitem__(self, r: int) -> memoryview:
+        if not 0 <= r < len(self):
+            raise IndexError(r)
+        return self._buf[r * self._cols:(r + 1) * self._cols]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for r in range(len(self)):
+            yield self[r]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CardView):
+            return self._buf == other._buf
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"CardView({self.tolist()})"
+
+    def tolist(self) -> list:
+        return [list(row) for row in self]
+
+
+def write_card_bank(path: str, cards: Iterable[Sequence[Sequence[int]]]) -> int:
+    """
+    Write cards (from complete_card/generate_cards) to a bank file.
+
+    Cards are streamed, so any iterable works. Returns the number of cards written.
+    """
+    size = BOARD_ROWS * BOARD_COLS
+    count = 0
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, BOARD_ROWS, BOARD_COLS, 0))
+        for card in cards:
+            record = bytes(v for row in card for v in row)
+            if len(record) != size:
+                raise ValueError(f"card {count} has {len(record)} cells, expected {size}")
+            f.write(record)
+            count += 1
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, BOARD_ROWS, BOARD_COLS, count))
+    return count
+
+
+class CardBank:
+    """
+    Memory-mapped card bank. bank[card_id] returns a zero-copy CardView.
+
+    Views keep the mapping alive, so close() may be called while they are in use.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, rows, cols, count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path}: not a card bank (version {VERSION})")
+        if (rows, cols) != (BOARD_ROWS, BOARD_COLS):
+            self._mmap.close()
+            raise ValueError(f"{path}: bank holds {rows}x{cols} cards, game uses {BOARD_ROWS}x{BOARD_COLS}")
+        self.rows = rows
+        self.cols = cols
+        self.record_size = rows * cols
+        self._count = count
+        self._data = memoryview(self._mmap)[HEADER.size:HEADER.size + count * self.record_size]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def record(self, card_id: int) -> memoryview:
+        """Raw record bytes of card_id (zero-copy)."""
+        if not 0 <= card_id < self._count:
+            raise IndexError(card_id)
+        start = card_id * self.record_size
+        return self._data[start:start + self.record_size]
+
+    def __getitem__(self, card_id: int) -> CardView:
+        return CardView(self.record(card_id), self.cols)
+
+    def __iter__(self) -> Iterator[CardView]:
+        for i in range(self._count):
+            yield self[i]
+
+    def as_array(self):
+        """All cards as a (N, rows, cols) uint8 NumPy array sharing the mapped memory."""
+        import numpy as np
+
+        return np.frombuffer(self._data, dtype=np.uint8).reshape(self._count, self.rows, self.cols)
+
+    def close(self) -> None:
+        """
+        Release the bank's own mapping. Card views still held elsewhere (e.g.
+        by Players) stay valid; the file is unmapped when the last one is dropped.
+        """
+        try:
+            self._data.release()
+            self._mmap.close()
+        except BufferError:
+            pass  # views (or as_array() results) still export the memory
+
+    def __enter__(self) -> "CardBank":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
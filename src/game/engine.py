@@ -0,0 +1,390 @@
+# src/game/engine.py
+"""
+Headless game engine: the rules of play_game without print() or input().
+
+Human seats get their decisions from provider objects (terminal, scripted,
+replay) and everything that happens is reported as GameEvents to a sink, so the
+same engine drives the terminal game, automated matches and soak tests, the
+latter at full CPU speed.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Mapping, Optional, Protocol, Sequence, Tuple
+
+from . import rules
+from .hall import CountingHall, Hall
+from .journal import GameJournal
+from .metrics import COUNT_BUCKETS, GameMetrics
+from .number_draw import NumberDrawer
+from .patterns import Pattern, PatternIndex
+from .player import Player
+from .schedule import ClaimSchedule
+
+
+# ---------------- Events ---------------- #
+@dataclass
+class GameEvent:
+    """
+    Something that happened during a game.
+
+    kind is one of:
+      "draw"            number drawn for `turn`
+      "exhausted"       the pool ran out without a bingo
+      "bot_claim"       a bot was awarded `claim` ("L"/"B"), `delta` = reward
+      "card"            a human seat is about to decide (render their card)
+      "invalid_answer"  unreadable Y/N input, treated as N, `delta` = penalty
+      "answer"          Y/N resolved, `outcome` from game.rules, `delta` = penalty
+      "invalid_claim"   unreadable L/B/N input, treated as N
+      "claim"           L/B resolved, `outcome` from game.rules, `delta` = reward/penalty
+      "points"          end of a human seat's turn (show their points)
+      "pattern"         `player` completed the win pattern named in `claim`
+      "game_over"       the game ended, `player` = bingo winner or None
+    """
+
+    kind: str
+    turn: int
+    player: Optional[Player] = None
+    number: Optional[int] = None
+    claim: Optional[str] = None
+    outcome: Optional[str] = None
+    delta: int = 0
+
+
+class EventSink(Protocol):
+    """
+    Receives the engine's events. A sink that buffers output may also define
+    flush(); the engine calls it before every human decision and when the game
+    ends, outside the decision timing, so writing counts as render time.
+    """
+
+    def emit(self, event: GameEvent) -> None: ...
+
+
+def flush_sink(sink: object) -> None:
+    """Call sink.flush() if the sink has one."""
+    flush = getattr(sink, "flush", None)
+    if flush is not None:
+        flush()
+
+
+class NullSink:
+    """Discards every event (fastest for headless runs)."""
+
+    def emit(self, event: GameEvent) -> None:
+        pass
+
+
+class ListSink:
+    """Keeps every event in `events` (tests, debugging)."""
+
+    def __init__(self) -> None:
+        self.events: List[GameEvent] = []
+
+    def emit(self, event: GameEvent) -> None:
+        self.events.append(event)
+
+
+# ---------------- Decision providers ---------------- #
+class DecisionProvider(Protocol):
+    """
+    Decisions for a human seat. Both methods return the raw input text, which
+    the engine validates exactly like terminal input.
+    """
+
+    def answer(self, player: Player, drawn: int) -> str: ...
+
+    def claim(self, player: Player, drawn: int) -> str: ...
+
+
+class ScriptedProvider:
+    """
+    Plays a seat automatically like an honest bot; with `error_rate` > 0 each
+    answer is flipped and a random false claim made with that probability.
+    """
+
+    def __init__(self, error_rate: float = 0.0, rng: Optional[random.Random] = None) -> None:
+        self.error_rate = error_rate
+        self.rng = rng if rng is not None else random.Random()
+
+    def _slip(self) -> bool:
+        return self.error_rate > 0 and self.rng.random() < self.error_rate
+
+    def answer(self, player: Player, drawn: int) -> str:
+        yes = player.has_number(drawn)
+        if self._slip():
+            yes = not yes
+        return "Y" if yes else "N"
+
+    def claim(self, player: Player, drawn: int) -> str:
+        if (not player.has_bingo) and player.check_bingo():
+            return "B"
+        if (not player.has_line) and player.check_line():
+            return "L"
+        if self._slip():
+            return self.rng.choice("LB")
+        return "N"
+
+
+class ReplayProvider:
+    """
+    Replays recorded raw inputs in the order the terminal asks for them
+    (the Y/N answer, then the claim only after a Y). Returns "N" once exhausted.
+    """
+
+    def __init__(self, inputs: Iterable[str]) -> None:
+        self._inputs: Iterator[str] = iter(inputs)
+
+    def _next(self) -> str:
+        return next(self._inputs, "N")
+
+    def answer(self, player: Player, drawn: int) -> str:
+        return self._next()
+
+    def claim(self, player: Player, drawn: int) -> str:
+        return self._next()
+
+
+# ---------------- Metrics wrappers ---------------- #
+class _TimedSink:
+    """Forwards events and adds the time spent in the sink to the engine's render time."""
+
+    def __init__(self, sink: EventSink, engine: "GameEngine") -> None:
+        self.sink = sink
+        self.engine = engine
+
+    def emit(self, event: GameEvent) -> None:
+        t0 = time.perf_counter()
+        self.sink.emit(event)
+        self.engine._render_time += time.perf_counter() - t0
+
+    def flush(self) -> None:
+        t0 = time.perf_counter()
+        flush_sink(self.sink)
+        self.engine._render_time += time.perf_counter() - t0
+
+
+class _TimedProvider:
+    """Forwards decisions and adds the time spent waiting for them to the engine."""
+
+    def __init__(self, provider: DecisionProvider, engine: "GameEngine") -> None:
+        self.provider = provider
+        self.engine = engine
+
+    def answer(self, player: Player, drawn: int) -> str:
+        t0 = time.perf_counter()
+        try:
+            return self.provider.answer(player, drawn)
+        finally:
+            self.engine._wait_time += time.perf_counter() - t0
+
+    def claim(self, player: Player, drawn: int) -> str:
+        t0 = time.perf_counter()
+        try:
+            return self.provider.claim(player, drawn)
+        finally:
+            self.engine._wait_time += time.perf_counter() - t0
+
+
+# ---------------- Engine ---------------- #
+class GameEngine:
+    """
+    One game: bots are resolved through the Hall index (or a precomputed
+    ClaimSchedule), human seats through their providers, in seating order.
+
+    Args:
+        players: All seats; bots have is_bot=True.
+        drawer: Number source for the game.
+        providers: Seat index -> DecisionProvider, required for every human seat.
+        sink: Receives GameEvents (default: NullSink).
+        precompute_bots: Use a ClaimSchedule instead of per-draw bot dispatch.
+        metrics: Optional GameMetrics. When given, every turn records wall time,
+            bot-phase time, human-wait time, render (sink) time, marks and checks
+            per draw and claim counts. When None nothing is measured. Marks and
+            checks are counted where they are made (a CountingHall for the bots,
+            the human answers and claims); with precompute_bots the bots make none.
+        leaderboard: Keep hall.leaderboard ("N to go" buckets) up to date.
+            Needs per-draw bot dispatch, so it cannot be combined with precompute_bots.
+        patterns: Extra win patterns (game.patterns) to watch. Each completion is
+            reported once per card as a "pattern" event; points are not affected.
+        journal: Optional GameJournal recording the game (header, inputs, points,
+            turn boundaries) for replay() and resume().
+    """
+
+    def __init__(
+        self,
+        players: List[Player],
+        drawer: NumberDrawer,
+        *,
+        providers: Optional[Mapping[int, DecisionProvider]] = None,
+        sink: Optional[EventSink] = None,
+        precompute_bots: bool = False,
+        metrics: Optional[GameMetrics] = None,
+        leaderboard: bool = False,
+        patterns: Sequence[Pattern] = (),
+        journal: Optional[GameJournal] = None,
+    ) -> None:
+        if leaderboard and precompute_bots:
+            raise ValueError("leaderboard tracking needs per-draw bot dispatch")
+        self.players = players
+        self.drawer = drawer
+        self.providers = dict(providers or {})
+        self.sink: EventSink = sink if sink is not None else NullSink()
+        self.humans = [seat for seat, p in enumerate(players) if not p.is_bot]
+        missing = [seat for seat in self.humans if seat not in self.providers]
+        if missing:
+            raise ValueError(f"no decision provider for human seats {missing}")
+
+        self.pool_total = sum(p.points for p in players)
+        hall = Hall if metrics is None else CountingHall
+        self.hall = None if precompute_bots else hall(players, leaderboard=leaderboard)
+        self.schedule = ClaimSchedule(players, drawer.sequence()) if precompute_bots else None
+        self.patterns = PatternIndex(players, patterns) if patterns else None
+
+        self.turn = 1
+        self.winner: Optional[Player] = None
+        self.finished = False
+
+        self.metrics = metrics
+        self._render_time = 0.0
+        self._wait_time = 0.0
+        # marks and checks made for human seats, metrics only (CountingHall counts the bots')
+        self._marks = 0
+        self._checks = 0
+        if metrics is not None:
+            self.sink = _TimedSink(self.sink, self)
+            self.providers = {seat: _TimedProvider(p, self) for seat, p in self.providers.items()}
+        self.journal: Optional[GameJournal] = None
+        if journal is not None:
+            journal.attach(self)
+
+    def _emit(self, kind: str, **data: object) -> None:
+        self.sink.emit(GameEvent(kind, self.turn, **data))
+
+    def _finish(self) -> None:
+        self.finished = True
+        self._emit("game_over", player=self.winner)
+        flush_sink(self.sink)
+        if self.journal is not None:
+            self.journal.end(self.players.index(self.winner) if self.winner is not None else -1)
+
+    def _human_turn(self, player: Player, provider: DecisionProvider, drawn: int) -> None:
+        self._emit("card", player=player, number=drawn)
+
+        flush_sink(self.sink)  # the output goes out before waiting for input
+        ans = provider.answer(player, drawn).strip().upper()
+        if ans not in ("Y", "N"):
+            before = player.points
+            player.penalize_wrong_number()
+            self._emit("invalid_answer", player=player, number=drawn, delta=player.points - before)
+            ans = "N"
+
+        outcome, delta = rules.resolve_answer(player, drawn, ans == "Y")
+        if outcome == rules.MARKED:
+            if self.metrics is not None:
+                self._marks += 1
+            if self.hall is not None:
+                self.hall.note_mark(player)
+            if self.patterns is not None:
+                self._emit_patterns(self.patterns.mark(player, drawn), drawn)
+        self._emit("answer", player=player, number=drawn, outcome=outcome, delta=delta)
+
+        if ans == "Y":
+            flush_sink(self.sink)
+            c = provider.claim(player, drawn).strip().upper()
+            if c not in ("L", "B", "N"):
+                self._emit("invalid_claim", player=player, number=drawn)
+                c = "N"
+            if c in ("L", "B"):
+                if self.metrics is not None and not (player.has_line if c == "L" else player.has_bingo):
+                    self._checks += 1  # resolve_claim checks the card
+                outcome, delta = rules.resolve_claim(player, c, self.pool_total)
+                self._emit("claim", player=player, number=drawn, claim=c, outcome=outcome, delta=delta)
+                if self.metrics is not None:
+                    self.metrics.inc("claims_total", kind=outcome)
+                if outcome == rules.BINGO and self.winner is None:
+                    self.winner = player
+
+        self._emit("points", player=player)
+
+    def _emit_patterns(self, completed: List[Tuple[Player, Pattern]], drawn: int) -> None:
+        for player, pattern in completed:
+            self._emit("pattern", player=player, number=drawn, claim=pattern.name)
+
+    def _play_bots(self, drawn: int) -> None:
+        if self.patterns is not None:
+            self._emit_patterns(self.patterns.draw(drawn, bots_only=True), drawn)
+        if self.schedule is not None:
+            bot_claims = self.schedule.pop_due(self.turn)
+        else:
+            bot_claims = self.hall.dispatch(drawn)
+        for bot, claim in bot_claims:
+            reward = rules.award_bot_claim(bot, claim, self.pool_total)
+            if reward is None:
+                continue
+            self._emit("bot_claim", player=bot, number=drawn, claim=claim, delta=reward)
+            if self.metrics is not None:
+                self.metrics.inc("claims_total", kind="bot_line" if claim == "L" else "bot_bingo")
+            if claim == "B" and self.winner is None:
+                self.winner = bot
+
+    def _work(self) -> Tuple[int, int]:
+        """Marks and checks made so far, bots (hall dispatch) and humans together."""
+        if self.hall is None:
+            return self._marks, self._checks
+        return self._marks + self.hall.marks, self._checks + self.hall.checks
+
+    def step(self) -> bool:
+        """Play one turn. Returns False once the game is over."""
+        if self.finished:
+            return False
+        m = self.metrics
+        if m is not None:
+            t_turn = time.perf_counter()
+            self._render_time = self._wait_time = 0.0
+            marks, checks = self._work()
+
+        drawn = self.drawer.draw_next()
+        if drawn is None:
+            self._emit("exhausted")
+            self._finish()
+            return False
+        self._emit("draw", number=drawn)
+
+        # --- Bots play ---
+        if m is not None:
+            t_bots = time.perf_counter()
+        self._play_bots(drawn)
+        if m is not None:
+            m.observe("bot_phase_seconds", time.perf_counter() - t_bots)
+
+        # --- Human seats ---
+        if self.winner is None:
+            for seat in self.humans:
+                self._human_turn(self.players[seat], self.providers[seat], drawn)
+            self.turn += 1
+
+        if m is not None:
+            m.observe("turn_seconds", time.perf_counter() - t_turn)
+            m.observe("human_wait_seconds", self._wait_time)
+            m.observe("render_seconds", self._render_time)
+            marks_now, checks_now = self._work()
+            m.observe("marks_per_draw", marks_now - marks, COUNT_BUCKETS)
+            m.observe("checks_per_draw", checks_now - checks, COUNT_BUCKETS)
+            m.inc("draws_total")
+        if self.journal is not None:
+            self.journal.end_turn(self.drawer.turn)
+
+        if self.winner is not None:
+            self._finish()
+            return False
+        return True
+
+    def run(self) -> Optional[Player]:
+        """Play until bingo or the pool is exhausted. Returns the bingo winner (or None)."""
+        while self.step():
+            pass
+        return self.winner
@@ -0,0 +1,116 @@
+# src/game/hall.py
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .leaderboard import Leaderboard
+from .player import Player
+
+
+class Hall:
+    """
+    All players of one match plus an inverted index: number -> [(player, row)].
+
+    The index is built once when the cards are dealt, so each draw only touches
+    the cards that actually hold the number instead of looping over every player.
+    With leaderboard=True the hall also keeps a Leaderboard of how many numbers
+    each player still needs, updated as cards are marked.
+    """
+
+    def __init__(self, players: Iterable[Player] = (), *, leaderboard: bool = False) -> None:
+        self.players: List[Player] = []
+        self.index: Dict[int, List[Tuple[Player, int]]] = {}
+        self.leaderboard: Optional[Leaderboard] = Leaderboard() if leaderboard else None
+        for p in players:
+            self.add_player(p)
+
+    def add_player(self, player: Player) -> None:
+        """
+        Seat a player and index every number of their cards, once per player
+        (a number on several of their cards points at its first global row).
+        """
+        self.players.append(player)
+        if self.leaderboard is not None:
+            self.leaderboard.add(player)
+        seen = set()
+        r = 0
+        for card in player.cards:
+            for row in card:
+                for v in row:
+                    if v is not None and v not in seen:
+                        seen.add(v)
+                        self.index.setdefault(v, []).append((player, r))
+                r += 1
+
+    def hits(self, n: int) -> List[Tuple[Player, int]]:
+        """(player, row) pairs holding number n, in seating order."""
+        return self.index.get(n, [])
+
+    def note_mark(self, player: Player) -> None:
+        """Report a mark made outside dispatch() (e.g. a human's Y answer)."""
+        if self.leaderboard is not None:
+            self.leaderboard.update(player)
+
+    def dispatch(self, n: int) -> List[Tuple[Player, str]]:
+        """
+        Play the bots' side of a draw.
+
+        Marks n on every bot card holding it and returns the (bot, claim) pairs
+        in seating order. Follows the same rules as Player.bot_play_turn: a bot
+        claims "B" when a card is full, otherwise "L" when a hit row is its
+        first full row. Human seats are left untouched.
+        """
+        claims: List[Tuple[Player, str]] = []
+        leaderboard = self.leaderboard
+        for player, _row in self.index.get(n, ()):
+            if not player.is_bot:
+                continue
+            player.mark_number(n)
+            if leaderboard is not None:
+                leaderboard.update(player)
+            # Only a row holding n can have just been completed.
+            if not player.line_through(n):
+                continue
+            if (not player.has_bingo) and player.check_bingo():
+                claims.append((player, "B"))
+            elif not player.has_line:
+                claims.append((player, "L"))
+        return claims
+
+
+class CountingHall(Hall):
+    """
+    A Hall whose dispatch() also keeps running totals of the marks and the
+    line/bingo checks it makes, for metrics. The engine only uses it when
+    metrics are on, so Hall.dispatch stays free of counting.
+    """
+
+    def __init__(self, players: Iterable[Player] = (), *, leaderboard: bool = False) -> None:
+        self.marks = 0
+        self.checks = 0
+        super().__init__(players, leaderboard=leaderboard)
+
+    def dispatch(self, n: int) -> List[Tuple[Player, str]]:
+        claims: List[Tuple[Player, str]] = []
+        leaderboard = self.leaderboard
+        marks = checks = 0
+        for player, _row in self.index.get(n, ()):
+            if not player.is_bot:
+                continue
+            player.mark_number(n)
+            marks += 1
+            if leaderboard is not None:
+                leaderboard.update(player)
+            checks += 1
+            if not player.line_through(n):
+                continue
+            if not player.has_bingo:
+                checks += 1
+                if player.check_bingo():
+                    claims.append((player, "B"))
+                    continue
+            if not player.has_line:
+                claims.append((player, "L"))
+        self.marks += marks
+        self.checks += checks
+        return claims
@@ -0,0 +1,349 @@
+# src/game/journal.py
+"""
+Append-only binary game journal: replay to any turn and resume after a crash.
+
+File layout (little-endian):
+    file header  9 bytes   magic b"BINGOJNL", version u8
+    records      length u32, kind u8, payload (length bytes)
+
+Record kinds and payloads:
+    HEADER  JSON: seed, precompute_bots, draw sequence, players (name, is_bot,
+            points, cards) -- written once, first
+    DRAW    turn u16, number u16
+    INPUT   seat u16, what u8 (0 = Y/N answer, 1 = L/B/N claim), raw text
+    POINTS  seat u16, delta i32
+    CLAIM   seat u16, claim char, outcome text
+    TURN    draws completed u16 -- the end of a turn
+    END     winner seat i16 (-1 = none)
+
+The game is deterministic given the header and the raw inputs, so replay()
+re-runs the engine with the recorded inputs instead of trusting derived state.
+POINTS and CLAIM records are kept for audits and to verify a replay.
+
+Records are buffered and flushed to the OS at the end of every turn; os.fsync
+runs every `sync_every` turns and at the end of the game. A flushed turn
+survives a crash of the process, but only a synced one survives a power loss
+or OS crash, so up to sync_every - 1 turns can be lost that way (sync_every=1
+syncs every turn). The "durable" turns below are those whose TURN record made
+it into the file: read_journal() ignores anything after the last one (e.g. a
+half-written record from a crash), and resume() cuts it off before appending.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Mapping, Optional, Tuple
+
+from .number_draw import NumberDrawer
+from .player import Player
+
+if TYPE_CHECKING:
+    from .engine import DecisionProvider, EventSink, GameEngine, GameEvent
+
+MAGIC = b"BINGOJNL"
+VERSION = 1
+FILE_HEADER = struct.Struct("<8sB")
+RECORD = struct.Struct("<IB")
+
+HEADER, DRAW, INPUT, POINTS, CLAIM, TURN, END = range(1, 8)
+ANSWER_INPUT, CLAIM_INPUT = 0, 1
+
+_DRAW = struct.Struct("<HH")
+_SEAT = struct.Struct("<H")
+_POINTS = struct.Struct("<Hi")
+_END = struct.Struct("<h")
+
+
+class JournalError(ValueError):
+    """The journal is malformed, or does not match what a replay produced."""
+
+
+# ---------------- Writing ---------------- #
+class GameJournal:
+    """
+    Writer side. Pass it to GameEngine(journal=...) (or use resume()); the
+    engine then records every decision, point change and turn boundary.
+    """
+
+    def __init__(self, path: str, *, seed: Optional[int] = None, sync_every: int = 8, append: bool = False) -> None:
+        self.path = path
+        self.seed = seed
+        self.sync_every = max(1, sync_every)
+        self._turns_since_sync = 0
+        self._seats: Dict[int, int] = {}
+        self._f: BinaryIO = open(path, "r+b" if append else "wb")
+        if append:
+            self._f.seek(0, os.SEEK_END)
+        else:
+            self._f.write(FILE_HEADER.pack(MAGIC, VERSION))
+
+    def _write(self, kind: int, payload: bytes) -> None:
+        self._f.write(RECORD.pack(len(payload), kind) + payload)
+
+    def _sync(self) -> None:
+        self._f.flush()
+        os.fsync(self._f.fileno())
+        self._turns_since_sync = 0
+
+    def attach(self, engine: "GameEngine", *, write_header: bool = True) -> None:
+        """Route the engine's sink and providers through the journal (called by GameEngine)."""
+        self._seats = {id(p): seat for seat, p in enumerate(engine.players)}
+        if write_header:
+            header = {
+                "seed": self.seed,
+                "precompute_bots": engine.schedule is not None,
+                "sequence": engine.drawer.sequence(),
+                "players": [
+                    {
+                        "name": p.name,
+                        "is_bot": p.is_bot,
+                        "points": p.points,
+                        "cards": [[[v for v in row] for row in card] for card in p.cards],
+                    }
+                    for p in engine.players
+                ],
+            }
+            self._write(HEADER, json.dumps(header, separators=(",", ":")).encode())
+            self._sync()
+        engine.sink = _JournalSink(engine.sink, self)
+        engine.providers = {
+            seat: _JournalProvider(provider, self, seat) for seat, provider in engine.providers.items()
+        }
+        engine.journal = self
+
+    # ---------- records ----------
+    def record_event(self, event: "GameEvent") -> None:
+        seat = self._seats.get(id(event.player), -1)
+        if event.kind == "draw":
+            self._write(DRAW, _DRAW.pack(event.turn, event.number))
+        if event.kind in ("claim", "bot_claim"):
+            outcome = event.outcome or ("line" if event.claim == "L" else "bingo")
+            self._write(CLAIM, _SEAT.pack(seat) + event.claim.encode() + outcome.encode())
+        if event.delta:
+            self._write(POINTS, _POINTS.pack(seat, event.delta))
+
+    def record_input(self, seat: int, what: int, raw: str) -> None:
+        self._write(INPUT, _SEAT.pack(seat) + bytes([what]) + raw.encode())
+
+    def end_turn(self, draws: int) -> None:
+        """Mark `draws` turns complete and flush; fsync only every sync_every turns."""
+        self._write(TURN, _SEAT.pack(draws))
+        self._turns_since_sync += 1
+        if self._turns_since_sync >= self.sync_every:
+            self._sync()
+        else:
+            self._f.flush()
+
+    def end(self, winner_seat: int) -> None:
+        self._write(END, _END.pack(winner_seat))
+        self._sync()
+
+    def close(self) -> None:
+        if not self._f.closed:
+            self._sync()
+            self._f.close()
+
+    def __enter__(self) -> "GameJournal":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class _JournalSink:
+    def __init__(self, sink: "EventSink", journal: GameJournal) -> None:
+        self.sink = sink
+        self.journal = journal
+
+    def emit(self, event: "GameEvent") -> None:
+        self.journal.record_event(event)
+        self.sink.emit(event)
+
+    def flush(self) -> None:
+        flush = getattr(self.sink, "flush", None)
+        if flush is not None:
+            flush()
+
+
+class _JournalProvider:
+    def __init__(self, provider: "DecisionProvider", journal: GameJournal, seat: int) -> None:
+        self.provider = provider
+        self.journal = journal
+        self.seat = seat
+
+    def answer(self, player: Player, drawn: int) -> str:
+        raw = self.provider.answer(player, drawn)
+        self.journal.record_input(self.seat, ANSWER_INPUT, raw)
+        return raw
+
+    def claim(self, player: Player, drawn: int) -> str:
+        raw = self.provider.claim(player, drawn)
+        self.journal.record_input(self.seat, CLAIM_INPUT, raw)
+        return raw
+
+
+# ---------------- Reading ---------------- #
+@dataclass
+class JournalLog:
+    """A parsed journal, cut at the last durable turn."""
+
+    header: Dict[str, object]
+    records: List[Tuple[int, object]] = field(default_factory=list)
+    durable_turns: int = 0   # turns whose TURN record is on disk
+    durable_offset: int = 0  # file offset just after the last TURN/END record
+    winner_seat: Optional[int] = None
+    ended: bool = False
+
+    def inputs(self, turns: int) -> Dict[int, List[str]]:
+        """Raw inputs per seat, in order, for the first `turns` turns."""
+        out: Dict[int, List[str]] = {}
+        if turns <= 0:
+            return out
+        for kind, data in self.records:
+            if kind == TURN and data >= turns:
+                break
+            if kind == INPUT:
+                seat, _what, raw = data
+                out.setdefault(seat, []).append(raw)
+        return out
+
+    def points(self, turns: int) -> List[int]:
+        """Every seat's points after `turns` turns, from the POINTS records."""
+        pts = [int(p["points"]) for p in self.header["players"]]
+        if turns <= 0:
+            return pts
+        for kind, data in self.records:
+            if kind == TURN and data >= turns:
+                break
+            if kind == POINTS:
+                seat, delta = data
+                pts[seat] += delta
+        return pts
+
+
+def read_journal(path: str) -> JournalLog:
+    """Parse a journal, ignoring a truncated or unfinished last turn."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < FILE_HEADER.size:
+        raise JournalError(f"{path}: not a game journal")
+    magic, version = FILE_HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise JournalError(f"{path}: not a game journal (or unsupported version {version})")
+
+    log: Optional[JournalLog] = None
+    pending: List[Tuple[int, object]] = []
+    pos = FILE_HEADER.size
+    while pos + RECORD.size <= len(data):
+        length, kind = RECORD.unpack_from(data, pos)
+        start = pos + RECORD.size
+        end = start + length
+        if end > len(data):
+            break  # torn write
+        payload = data[start:end]
+        pos = end
+        if kind == HEADER:
+            log = JournalLog(json.loads(payload), durable_offset=pos)
+            continue
+        if log is None:
+            raise JournalError(f"{path}: records before the header")
+        if kind == DRAW:
+            pending.append((kind, _DRAW.unpack(payload)))
+        elif kind == INPUT:
+            pending.append((kind, (_SEAT.unpack_from(payload)[0], payload[2], payload[3:].decode())))
+        elif kind == POINTS:
+            pending.append((kind, _POINTS.unpack(payload)))
+        elif kind == CLAIM:
+            pending.append((kind, (_SEAT.unpack_from(payload)[0], payload[2:3].decode(), payload[3:].decode())))
+        elif kind in (TURN, END):
+            value = (_SEAT if kind == TURN else _END).unpack(payload)[0]
+            pending.append((kind, value))
+            log.records.extend(pending)
+            pending = []
+            log.durable_offset = pos
+            if kind == TURN:
+                log.durable_turns = value
+            else:
+                log.ended = True
+                log.winner_seat = None if value < 0 else value
+        else:
+            raise JournalError(f"{path}: unknown record kind {kind}")
+    if log is None:
+        raise JournalError(f"{path}: no header record")
+    return log
+
+
+# ---------------- Replay / resume ---------------- #
+def _players(header: Mapping[str, object]) -> List[Player]:
+    return [
+        Player.with_cards(p["name"], p["cards"], is_bot=p["is_bot"], points=p["points"])
+        for p in header["players"]
+    ]
+
+
+def replay(source: str | JournalLog, turn: Optional[int] = None, *, verify: bool = True) -> "GameEngine":
+    """
+    Rebuild the game after `turn` turns (default: the last durable turn) by
+    re-running the engine with the recorded inputs. Returns the engine; its
+    players hold the exact Player state at that turn.
+
+    Raises:
+        JournalError: If `turn` is past the durable end, or (verify=True) the
+            replayed points differ from the journal's POINTS records.
+    """
+    from .engine import GameEngine, ReplayProvider
+
+    log = source if isinstance(source, JournalLog) else read_journal(source)
+    turn = log.durable_turns if turn is None else turn
+    if not 0 <= turn <= log.durable_turns:
+        raise JournalError(f"turn {turn} is not in the journal (0..{log.durable_turns})")
+
+    players = _players(log.header)
+    inputs = log.inputs(turn)
+    engine = GameEngine(
+        players,
+        NumberDrawer.from_sequence(log.header["sequence"]),
+        providers={seat: ReplayProvider(inputs.get(seat, ())) for seat, p in enumerate(players) if not p.is_bot},
+        precompute_bots=bool(log.header["precompute_bots"]),
+    )
+    for _ in range(turn):
+        if not engine.step():
+            break
+    if verify and [p.points for p in players] != log.points(turn):
+        raise JournalError(f"replay to turn {turn} does not match the recorded points")
+    return engine
+
+
+def resume(
+    path: str,
+    providers: Mapping[int, "DecisionProvider"],
+    *,
+    sink: Optional["EventSink"] = None,
+    sync_every: int = 8,
+) -> "GameEngine":
+    """
+    Restart a crashed game from its last durable turn.
+
+    The journal is cut back to that turn, the state is rebuilt with replay(),
+    and the engine continues with the live `providers` and `sink`, appending
+    to the same journal (engine.journal; close it when done).
+
+    Raises:
+        JournalError: If the game in the journal already ended.
+    """
+    from .engine import NullSink
+
+    log = read_journal(path)
+    if log.ended:
+        raise JournalError(f"{path}: the game already ended")
+    engine = replay(log)
+    engine.providers = dict(providers)
+    engine.sink = sink if sink is not None else NullSink()
+    with open(path, "r+b") as f:
+        f.truncate(log.durable_offset)
+    journal = GameJournal(path, seed=log.header.get("seed"), sync_every=sync_every, append=True)
+    journal.attach(engine, write_header=False)
+    return engine
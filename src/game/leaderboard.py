@@ -0,0 +1,83 @@
+# src/game/leaderboard.py
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Tuple
+
+from .player import Player
+
+LINE = "line"
+BINGO = "bingo"
+
+
+class Leaderboard:
+    """
+    Hall-wide buckets of players by how many numbers they still need.
+
+    Two bucket sets are kept, keyed by Player.line_to_go() and
+    Player.bingo_to_go(). update() re-reads the player's row tallies (every row
+    of every card they hold) and moves them between buckets in O(1), so "who is
+    one away?" reads a single bucket and "top k closest" walks k players and at
+    most one bucket per possible count, i.e. the numbers on the largest card + 1
+    (16 for classic, 25 for 75-ball), never the whole hall.
+    """
+
+    def __init__(self, players: Iterable[Player] = ()) -> None:
+        # kind -> to_go -> {id(player): player}, in the order players entered the bucket
+        self._buckets: Dict[str, Dict[int, Dict[int, Player]]] = {LINE: {}, BINGO: {}}
+        self._pos: Dict[int, Tuple[int, int]] = {}
+        for p in players:
+            self.add(p)
+
+    def __len__(self) -> int:
+        return len(self._pos)
+
+    def _put(self, kind: str, to_go: int, player: Player) -> None:
+        self._buckets[kind].setdefault(to_go, {})[id(player)] = player
+
+    def _drop(self, kind: str, to_go: int, player: Player) -> None:
+        bucket = self._buckets[kind][to_go]
+        del bucket[id(player)]
+        if not bucket:
+            del self._buckets[kind][to_go]
+
+    def add(self, player: Player) -> None:
+        line, bingo = player.line_to_go(), player.bingo_to_go()
+        self._pos[id(player)] = (line, bingo)
+        self._put(LINE, line, player)
+        self._put(BINGO, bingo, player)
+
+    def update(self, player: Player) -> None:
+        """Re-bucket a player after their marks changed."""
+        old_line, old_bingo = self._pos[id(player)]
+        line, bingo = player.line_to_go(), player.bingo_to_go()
+        if line != old_line:
+            self._drop(LINE, old_line, player)
+            self._put(LINE, line, player)
+        if bingo != old_bingo:
+            self._drop(BINGO, old_bingo, player)
+            self._put(BINGO, bingo, player)
+        self._pos[id(player)] = (line, bingo)
+
+    def at(self, kind: str, to_go: int) -> List[Player]:
+        """Players needing exactly `to_go` numbers for a `kind` ("line"/"bingo")."""
+        return list(self._buckets[kind].get(to_go, {}).values())
+
+    def one_away(self, kind: str = BINGO) -> List[Player]:
+        return self.at(kind, 1)
+
+    def count(self, kind: str, to_go: int) -> int:
+        return len(self._buckets[kind].get(to_go, ()))
+
+    def closest(self, kind: str = BINGO, k: int = 10) -> List[Tuple[Player, int]]:
+        """
+        Up to k (player, to_go) pairs, closest first. Ties come out in the order
+        the players reached that count (seating order until their first move).
+        """
+        out: List[Tuple[Player, int]] = []
+        buckets = self._buckets[kind]
+        for to_go in sorted(buckets):
+            for player in buckets[to_go].values():
+                if len(out) == k:
+                    return out
+                out.append((player, to_go))
+        return out
@@ -0,0 +1,273 @@
+# src/game/ledger.py
+"""
+Points ledger: every points movement as an entry, persisted to SQLite in bulk.
+
+    store = PointsStore("points.db")          # one per process, shared by rooms
+    ledger = PointsLedger("room-7:1", store)  # one per game
+    ledger.open_balances(players)             # opening balance of every seat
+    ledger.record("You", -1, "not_on_card", turn=4)
+    ...
+    ledger.reconcile(pool_total, players)     # {"ok": True, ...}
+    ledger.close()
+
+The turn loop only appends tuples to a list. Full batches (and whatever is
+pending at end_turn()/close()) are handed to the store, whose writer thread
+inserts them with one prepared executemany per transaction on a WAL database,
+so disk I/O never blocks a game.
+
+LedgerSink records the engine's events, so a GameEngine gets a ledger by
+wrapping its sink; server rooms call record() directly.
+"""
+
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from .player import Player
+
+if TYPE_CHECKING:
+    from .engine import EventSink, GameEvent
+
+# (game_id, seq, player, delta, reason, turn, unix_ns)
+Entry = Tuple[str, int, str, int, str, int, int]
+
+OPENING = "opening"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ledger (
+    game_id TEXT    NOT NULL,
+    seq     INTEGER NOT NULL,
+    player  TEXT    NOT NULL,
+    delta   INTEGER NOT NULL,
+    reason  TEXT    NOT NULL,
+    turn    INTEGER NOT NULL,
+    ts_ns   INTEGER NOT NULL,
+    PRIMARY KEY (game_id, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ledger_player ON ledger (player);
+"""
+_INSERT = "INSERT INTO ledger (game_id, seq, player, delta, reason, turn, ts_ns) VALUES (?, ?, ?, ?, ?, ?, ?)"
+
+_STOP = object()
+
+
+class PointsStore:
+    """
+    SQLite persistence with a background writer thread.
+
+    submit() only enqueues a batch; the writer inserts each batch in a single
+    transaction. flush() blocks until everything submitted is committed.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._queue: "queue.Queue[object]" = queue.Queue()
+        self._error: Optional[BaseException] = None
+        conn = self._connect()
+        conn.executescript(_SCHEMA)
+        conn.close()
+        self._thread = threading.Thread(target=self._writer, name="points-store", daemon=True)
+        self._thread.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _writer(self) -> None:
+        conn = self._connect()
+        try:
+            while True:
+                batch = self._queue.get()
+                try:
+                    if batch is _STOP:
+                        return
+                    # Coalesce whatever else is already queued into the same transaction.
+                    batches = [batch]
+                    stop = False
+                    while True:
+                        try:
+                            more = self._queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        if more is _STOP:
+                            stop = True
+                            break
+                        batches.append(more)
+                    try:
+                        conn.execute("BEGIN")
+                        for b in batches:
+                            conn.executemany(_INSERT, b)
+                        conn.execute("COMMIT")
+                    except sqlite3.Error as e:
+                        if conn.in_transaction:  # BEGIN itself may have failed
+                            conn.execute("ROLLBACK")
+                        self._error = e
+                    for _ in batches[1:]:
+                        self._queue.task_done()
+                    if stop:
+                        self._queue.task_done()
+                        return
+                finally:
+                    self._queue.task_done()
+        finally:
+            conn.close()
+
+    def submit(self, entries: List[Entry]) -> None:
+        if entries:
+            self._queue.put(entries)
+
+    def flush(self) -> None:
+        """Wait until every submitted entry is committed. Raises the writer's error, if any."""
+        self._queue.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def close(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def __enter__(self) -> "PointsStore":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # ---------- queries (committed entries only; call flush() first) ----------
+    def _query(self, sql: str, args: Tuple[object, ...] = ()) -> List[Tuple]:
+        conn = sqlite3.connect(self.path)
+        try:
+            return conn.execute(sql, args).fetchall()
+        finally:
+            conn.close()
+
+    def balance(self, player: str, game_id: Optional[str] = None) -> int:
+        """Sum of a player's entries, in one game or across all games."""
+        if game_id is None:
+            rows = self._query("SELECT COALESCE(SUM(delta), 0) FROM ledger WHERE player = ?", (player,))
+        else:
+            rows = self._query(
+                "SELECT COALESCE(SUM(delta), 0) FROM ledger WHERE game_id = ? AND player = ?", (game_id, player)
+            )
+        return rows[0][0]
+
+    def balances(self, game_id: str) -> Dict[str, int]:
+        rows = self._query("SELECT player, SUM(delta) FROM ledger WHERE game_id = ? GROUP BY player", (game_id,))
+        return dict(rows)
+
+    def entries(self, game_id: str) -> List[Entry]:
+        return self._query(
+            "SELECT game_id, seq, player, delta, reason, turn, ts_ns FROM ledger WHERE game_id = ? ORDER BY seq",
+            (game_id,),
+        )
+
+
+class PointsLedger:
+    """
+    The entries of one game, with running balances kept in memory.
+
+    Args:
+        game_id: Unique id of the game in the store.
+        store: Optional PointsStore; without one the ledger is memory-only.
+        batch_size: Entries buffered before a batch is handed to the store.
+    """
+
+    def __init__(self, game_id: str, store: Optional[PointsStore] = None, *, batch_size: int = 512) -> None:
+        self.game_id = game_id
+        self.store = store
+        self.batch_size = batch_size
+        self.entries: List[Entry] = []
+        self._pending: List[Entry] = []
+        self._balances: Dict[str, int] = {}
+        self._opening: Dict[str, int] = {}
+
+    def record(self, player: str, delta: int, reason: str, turn: int = 0) -> None:
+        entry = (self.game_id, len(self.entries), player, delta, reason, turn, time.time_ns())
+        self.entries.append(entry)
+        self._balances[player] = self._balances.get(player, 0) + delta
+        if self.store is not None:
+            self._pending.append(entry)
+            if len(self._pending) >= self.batch_size:
+                self.end_turn()
+
+    def open_balances(self, players: Iterable[Player]) -> None:
+        """Record every seat's starting points as an opening entry."""
+        for p in players:
+            self._opening[p.name] = p.points
+            self.record(p.name, p.points, OPENING)
+
+    def end_turn(self) -> None:
+        """Hand pending entries to the store (non-blocking)."""
+        if self.store is not None and self._pending:
+            self.store.submit(self._pending)
+            self._pending = []
+
+    def close(self) -> None:
+        """Hand over what is pending and wait until the store has committed it."""
+        self.end_turn()
+        if self.store is not None:
+            self.store.flush()
+
+    def balance(self, player: str) -> int:
+        return self._balances.get(player, 0)
+
+    def reconcile(self, pool_total: int, players: Iterable[Player]) -> Dict[str, object]:
+        """
+        Check the ledger against the game: opening entries must add up to
+        `pool_total` (as computed in play_game) and every player's balance must
+        equal their points. Returns a report with "ok" and any mismatches.
+        """
+        opening_total = sum(self._opening.values())
+        mismatches = {
+            p.name: {"ledger": self.balance(p.name), "points": p.points}
+            for p in players
+            if self.balance(p.name) != p.points
+        }
+        closing_total = sum(self._balances.values())
+        return {
+            "ok": opening_total == pool_total and not mismatches,
+            "pool_total": pool_total,
+            "opening_total": opening_total,
+            "net_movement": closing_total - opening_total,
+            "closing_total": closing_total,
+            "entries": len(self.entries),
+            "mismatches": mismatches,
+        }
+
+
+class LedgerSink:
+    """
+    EventSink that records every points movement of a GameEngine in `ledger`
+    (reason = the event's outcome or kind) and forwards events to `sink`.
+    """
+
+    def __init__(self, ledger: PointsLedger, sink: Optional["EventSink"] = None) -> None:
+        self.ledger = ledger
+        self.sink = sink
+
+    def emit(self, event: "GameEvent") -> None:
+        if event.delta:
+            if event.kind == "bot_claim":
+                reason = "line" if event.claim == "L" else "bingo"
+            else:
+                reason = event.outcome or event.kind
+            self.ledger.record(event.player.name, event.delta, reason, event.turn)
+        elif event.kind in ("points", "game_over"):
+            self.ledger.end_turn()
+        if self.sink is not None:
+            self.sink.emit(event)
+
+    def flush(self) -> None:
+        flush = getattr(self.sink, "flush", None)
+        if flush is not None:
+            flush()
@@ -0,0 +1,117 @@
+# src/game/metrics.py
+"""
+Low-overhead game metrics: fixed-bucket histograms and labelled counters.
+
+Metrics are opt-in. The engine only touches a GameMetrics object when one is
+passed to it, so a game without metrics runs the exact same code path as before
+apart from one `is None` check per hook. Marks and checks are counted by
+hall.CountingHall, which the engine only uses when metrics are on, so Player
+and Hall.dispatch carry no hooks at all.
+
+Export on game end with write(path): *.json gives JSON, anything else the
+Prometheus text exposition format.
+"""
+
+from __future__ import annotations
+
+import json
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+# Seconds, from 1µs (a bot phase) to 10 min (a slow human).
+TIME_BUCKETS: Tuple[float, ...] = (
+    1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0, 5.0, 30.0, 120.0, 600.0,
+)
+# Per-draw counts (marks, checks) for halls from 5 to 100k players.
+COUNT_BUCKETS: Tuple[float, ...] = (0, 1, 2, 5, 10, 20, 50, 100, 1_000, 10_000, 100_000)
+
+
+class Histogram:
+    """Fixed upper-bound buckets plus sum and count, like a Prometheus histogram."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float] = TIME_BUCKETS) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # last bucket = +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(le, cumulative count) pairs, ending with "+Inf"."""
+        out = []
+        running = 0
+        for bound, c in zip(self.bounds + (float("inf"),), self.counts):
+            running += c
+            out.append(("+Inf" if bound == float("inf") else f"{bound:g}", running))
+        return out
+
+
+class GameMetrics:
+    """Named histograms and labelled counters for one game (or many, if reused)."""
+
+    def __init__(self, prefix: str = "bingo") -> None:
+        self.prefix = prefix
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], int] = {}
+
+    def observe(self, name: str, value: float, bounds: Sequence[float] = TIME_BUCKETS) -> None:
+        h = self.histograms.get(name)
+        if h is None:
+            h = self.histograms[name] = Histogram(bounds)
+        h.observe(value)
+
+    def inc(self, name: str, n: int = 1, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        self.counters[key] = self.counters.get(key, 0) + n
+
+    # ---------- export ----------
+    def to_json(self) -> Dict[str, object]:
+        return {
+            "histograms": {
+                name: {
+                    "count": h.count,
+                    "sum": h.sum,
+                    "buckets": dict(h.cumulative()),
+                }
+                for name, h in sorted(self.histograms.items())
+            },
+            "counters": [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self.counters.items())
+            ],
+        }
+
+    def to_prometheus(self) -> str:
+        lines: List[str] = []
+        for name, h in sorted(self.histograms.items()):
+            full = f"{self.prefix}_{name}"
+            lines.append(f"# TYPE {full} histogram")
+            for le, c in h.cumulative():
+                lines.append(f'{full}_bucket{{le="{le}"}} {c}')
+            lines.append(f"{full}_sum {h.sum:.9g}")
+            lines.append(f"{full}_count {h.count}")
+        typed = set()
+        for (name, labels), value in sorted(self.counters.items()):
+            full = f"{self.prefix}_{name}"
+            if full not in typed:
+                lines.append(f"# TYPE {full} counter")
+                typed.add(full)
+            label_text = ",".join(f'{k}="{v}"' for k, v in labels)
+            lines.append(f"{full}{{{label_text}}} {value}" if label_text else f"{full} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        """Write JSON if path ends in .json, Prometheus text otherwise."""
+        with open(path, "w", encoding="utf-8") as f:
+            if path.endswith(".json"):
+                json.dump(self.to_json(), f, indent=2)
+                f.write("\n")
+            else:
+                f.write(self.to_prometheus())
+
@@ -1,69 +1,284 @@
 # src/game/number_draw.py
 from __future__ import annotations
 
+import hashlib
 import random
+import sys
 import time
-from typing import Generator, Iterable, List, Optional, Set, Tuple
+from array import array
+from itertools import islice
+from typing import AbstractSet, Callable, Generator, Iterable, Iterator, List, Optional, Set, Tuple
 
-from .bingo_card import NUMBER_RANGE, BOARD_ROWS, BOARD_COLS
+from .bingo_card import NUMBER_RANGE
+from .render import SNAPSHOT, card_text
 
 
 class NumberDrawer:
     """
     Draw numbers one-by-one from the global pool without repetition.
+
+    Each drawer shuffles with its own generator: `rng` if given, else a private
+    random.Random(seed) when a seed is given, else the global `random` module.
+    Seeding never touches the global state, so games in one process stay independent.
+    `number_range` (inclusive) defaults to NUMBER_RANGE; pass a Variant's range
+    for other games.
     """
 
-    def __init__(self, *, seed: Optional[int] = None) -> None:
-        low, high = NUMBER_RANGE
+    def __init__(
+        self,
+        *,
+        seed: Optional[int] = None,
+        rng: Optional[random.Random] = None,
+        number_range: Tuple[int, int] = NUMBER_RANGE,
+    ) -> None:
+        low, high = number_range
         self._pool: List[int] = list(range(low, high + 1))
-        if seed is not None:
-            random.seed(seed)
-        random.shuffle(self._pool)
+        if rng is None and seed is not None:
+            rng = random.Random(seed)
+        (rng if rng is not None else random).shuffle(self._pool)
+        self._size = len(self._pool)
         self._idx = 0
         self.drawn: Set[int] = set()
 
+    def _number_at(self, index: int) -> int:
+        """Number drawn at 0-based position `index` of the game."""
+        return self._pool[index]
+
     def draw_next(self) -> Optional[int]:
         """Return the next number or None if exhausted."""
-        if self._idx >= len(self._pool):
+        if self._idx >= self._size:
             return None
-        n = self._pool[self._idx]
+        n = self._number_at(self._idx)
         self._idx += 1
         self.drawn.add(n)
         return n
 
+    @property
+    def turn(self) -> int:
+        """Number of draws made so far."""
+        return self._idx
+
+    def number_at(self, turn: int) -> int:
+        """Number drawn on `turn` (1-based), without drawing."""
+        if not 1 <= turn <= self._size:
+            raise IndexError(turn)
+        return self._number_at(turn - 1)
+
+    def seek(self, turn: int) -> None:
+        """Fast-forward or rewind so that exactly `turn` numbers have been drawn."""
+        if not 0 <= turn <= self._size:
+            raise IndexError(turn)
+        self._idx = turn
+        self.drawn = {self._number_at(i) for i in range(turn)}
+
+    def sequence(self) -> List[int]:
+        """The full draw order of this game (already decided at construction)."""
+        return [self._number_at(i) for i in range(self._size)]
+
+    @classmethod
+    def from_sequence(cls, sequence: Iterable[int]) -> "NumberDrawer":
+        """A drawer that replays a recorded draw order (e.g. from a game journal)."""
+        drawer = NumberDrawer.__new__(NumberDrawer)
+        drawer._pool = list(sequence)
+        drawer._size = len(drawer._pool)
+        drawer._idx = 0
+        drawer.drawn = set()
+        return drawer
+
+
+_M64 = (1 << 64) - 1
+
+
+def _mix64(x: int) -> int:
+    """SplitMix64 finalizer: a fast, well-distributed 64-bit hash."""
+    z = (x + 0x9E3779B97F4A7C15) & _M64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _M64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _M64
+    return z ^ (z >> 31)
+
+
+class CounterDrawer(NumberDrawer):
+    """
+    Drawer whose order is a keyed permutation of the pool, computed per position.
+
+    Position k of game `game_id` under `key` is a Feistel permutation of k
+    (with cycle-walking to stay inside the pool), so:
+      - number_at(k) costs O(1), no earlier draws needed;
+      - any node rebuilds the same sequence from (key, game_id) alone;
+      - seek() jumps to any turn, forwards or backwards.
+    """
+
+    ROUNDS = 4
+
+    def __init__(
+        self, key: int | str, game_id: int | str, *, number_range: Tuple[int, int] = NUMBER_RANGE
+    ) -> None:
+        low, high = number_range
+        self.key = key
+        self.game_id = game_id
+        self._low = low
+        self._size = high - low + 1
+        self._half = max(1, ((self._size - 1).bit_length() + 1) // 2)
+        digest = hashlib.sha256(f"{key}:{game_id}".encode()).digest()
+        self._round_keys = [
+            int.from_bytes(digest[8 * i:8 * i + 8], "little") for i in range(self.ROUNDS)
+        ]
+        self._idx = 0
+        self.drawn = set()
+
+    def _permute(self, index: int) -> int:
+        half = self._half
+        mask = (1 << half) - 1
+        x = index
+        while True:
+            left, right = x >> half, x & mask
+            for k in self._round_keys:
+                left, right = right, left ^ (_mix64(k ^ right) & mask)
+            x = (left << half) | right
+            if x < self._size:
+                return x
+
+    def _number_at(self, index: int) -> int:
+        return self._low + self._permute(index)
+
 
-def _marked_snapshot(card: List[List[int]], drawn: Set[int]) -> List[List[str]]:
+class DrawView(AbstractSet[int]):
     """
-    Render a snapshot of the card where matched numbers are visibly marked.
-    We mark hits by surrounding the number with brackets, e.g., [23].
+    Immutable view of the first `turn` draws of a DrawFeed.
+
+    It shares the feed's arrays instead of copying them: the feed only ever
+    writes past its current turn, so everything a view can see is frozen.
+    Works as a set of the drawn numbers (`n in view`, `len`, iteration in
+    draw order, comparisons with sets) and as a sequence by position
+    (`view[0]` is the first number drawn).
+
+    Attributes:
+        turn: Number of draws visible.
+        mask: Bitmask of the visible draws (bit n <=> number n).
     """
-    snap: List[List[str]] = []
-    for r in range(BOARD_ROWS):
-        row: List[str] = []
-        for c in range(BOARD_COLS):
-            v = card[r][c]
-            if v in drawn:
-                row.append(f"[{v:2d}]")
-            else:
-                row.append(f" {v:2d} ")
-        snap.append(row)
-    return snap
-
-
-def _print_snapshot(snapshot: List[List[str]]) -> None:
-    top = "┌" + ("────┬" * (BOARD_COLS - 1)) + "────┐"
-    mid = "├" + ("────┼" * (BOARD_COLS - 1)) + "────┤"
-    bot = "└" + ("────┴" * (BOARD_COLS - 1)) + "────┘"
-
-    def fmt_row(values: Iterable[str]) -> str:
-        return " │ " + " │ ".join(values) + " │"
-
-    print(top)
-    for r, row in enumerate(snapshot):
-        print(fmt_row(row))
-        if r < BOARD_ROWS - 1:
-            print(mid)
-    print(bot)
+
+    __slots__ = ("_order", "_position", "_turn", "_mask")
+
+    def __init__(self, order: array, position: array, turn: int, mask: int) -> None:
+        self._order = order
+        self._position = position
+        self._turn = turn
+        self._mask = mask
+
+    @property
+    def turn(self) -> int:
+        return self._turn
+
+    @property
+    def mask(self) -> int:
+        return self._mask
+
+    def __len__(self) -> int:
+        return self._turn
+
+    def __contains__(self, n: object) -> bool:
+        if not isinstance(n, int) or not 0 <= n < len(self._position):
+            return False
+        return 0 < self._position[n] <= self._turn
+
+    def __iter__(self) -> Iterator[int]:
+        order = self._order
+        return (order[i] for i in range(self._turn))
+
+    def __getitem__(self, index: int) -> int:
+        if index < 0:
+            index += self._turn
+        if not 0 <= index < self._turn:
+            raise IndexError(index)
+        return self._order[index]
+
+    def __repr__(self) -> str:
+        return f"DrawView(turn={self._turn})"
+
+    @property
+    def last(self) -> Optional[int]:
+        """The newest visible number (None before the first draw)."""
+        return self._order[self._turn - 1] if self._turn else None
+
+    def turn_of(self, n: int) -> Optional[int]:
+        """Turn (1-based) on which n was drawn, or None if it is not visible."""
+        return self._position[n] if n in self else None
+
+    def since(self, turn: int) -> Iterator[int]:
+        """Numbers drawn after `turn`, in draw order (what a consumer has not seen yet)."""
+        order = self._order
+        return (order[i] for i in range(max(0, turn), self._turn))
+
+
+DrawCallback = Callable[[int, DrawView], None]
+
+
+class DrawFeed:
+    """
+    A drawer as a stream: each draw yields the new number and a DrawView of
+    the history, and is pushed to every subscriber with that same view --
+    one shared record, no copies. check_card() draws through a feed; the
+    engine and the server rooms still call draw_next() themselves.
+
+        feed = DrawFeed(NumberDrawer(seed=3))
+        feed.subscribe(lambda n, view: ...)
+        for n, view in feed:
+            ...
+
+    The feed takes over drawing: once it exists, advance it rather than
+    calling drawer.draw_next() or seek() directly. Draws already made by the
+    drawer are part of the history.
+    """
+
+    def __init__(self, drawer: NumberDrawer) -> None:
+        self.drawer = drawer
+        # Preallocated; slots past the current turn are only written as draws happen.
+        self._order = array("H", bytes(2 * drawer._size))
+        self._position = array("H", bytes(2 * 128))  # number -> turn drawn (0 = not yet)
+        self._mask = 0
+        self._subscribers: List[DrawCallback] = []
+        for i in range(drawer.turn):
+            self._append(drawer._number_at(i), i)
+        self.view = DrawView(self._order, self._position, drawer.turn, self._mask)
+
+    def _append(self, n: int, index: int) -> None:
+        position = self._position
+        if n >= len(position):
+            position.frombytes(bytes(2 * (n + 1 - len(position))))
+        self._order[index] = n
+        position[n] = index + 1
+        self._mask |= 1 << n
+
+    def subscribe(self, callback: DrawCallback) -> Callable[[], None]:
+        """Call callback(n, view) after every draw. Returns a function that unsubscribes."""
+        self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback)
+
+    def advance(self) -> Optional[Tuple[int, DrawView]]:
+        """Draw the next number and notify the subscribers; None when the pool is exhausted."""
+        drawer = self.drawer
+        n = drawer.draw_next()
+        if n is None:
+            return None
+        turn = drawer._idx
+        if n < len(self._position):
+            self._order[turn - 1] = n
+            self._position[n] = turn
+            self._mask |= 1 << n
+        else:
+            self._append(n, turn - 1)
+        view = self.view = DrawView(self._order, self._position, turn, self._mask)
+        if self._subscribers:
+            for callback in tuple(self._subscribers):
+                callback(n, view)
+        return n, view
+
+    def __iter__(self) -> Iterator[Tuple[int, DrawView]]:
+        while True:
+            step = self.advance()
+            if step is None:
+                return
+            yield step
 
 
 def check_card(
@@ -72,15 +287,18 @@ def check_card(
     turns: Optional[int] = None,
     delay_seconds: float = 0.0,
     seed: Optional[int] = None,
+    rng: Optional[random.Random] = None,
     echo: bool = True,
-) -> Generator[Tuple[int, Set[int]], None, None]:
+) -> Generator[Tuple[int, DrawView], None, None]:
     """
     Task (Elias): Ensure numbers are drawn without repetition and visibly update each turn.
 
     Behavior:
       - Draws numbers one-by-one from the 1–90 pool with no repeats.
-      - After each draw, yields (number_drawn, all_drawn_so_far).
-      - If echo=True, prints an updated view of the card with matches marked.
+      - After each draw, yields (number_drawn, DrawView of all draws so far);
+        the view shares the feed's history instead of copying a set.
+      - If echo=True, prints an updated view of the card with matches marked
+        (hits in brackets, e.g. [23]), one write per draw.
       - `turns` limits the number of draws for demo/testing (None = draw until pool ends).
 
     Args:
@@ -88,25 +306,20 @@ def check_card(
         turns: Optional cap on the number of draws to perform.
         delay_seconds: Optional sleep between draws (visual pacing).
         seed: Optional RNG seed to make draws deterministic for tests.
+        rng: Optional private generator for the draws (takes precedence over seed).
         echo: If True, prints the updated card after each draw.
 
     Yields:
-        (drawn_number, drawn_set) after each draw.
+        (drawn_number, drawn_view) after each draw.
     """
-    drawer = NumberDrawer(seed=seed)
-    max_draws = turns if turns is not None else len(drawer._pool)
-
-    for _ in range(max_draws):
-        n = drawer.draw_next()
-        if n is None:
-            break
-
-        if echo:
-            print(f"\nNumber drawn: {n}")
-            snapshot = _marked_snapshot(card, drawer.drawn)
-            _print_snapshot(snapshot)
+    feed = DrawFeed(NumberDrawer(seed=seed, rng=rng))
+    if echo:
+        feed.subscribe(
+            lambda n, view: sys.stdout.write(f"\nNumber drawn: {n}\n" + card_text(card, view, style=SNAPSHOT))
+        )
 
+    for step in islice(feed, turns):
         if delay_seconds > 0:
             time.sleep(delay_seconds)
 
-        yield n, set(drawer.drawn)
+        yield step
@@ -0,0 +1,147 @@
+# src/game/odds.py
+"""
+Exact odds for line/bingo timing, from hypergeometric counting.
+
+The draw is a uniformly random order of the pool, so a fixed set of s numbers
+is fully drawn after t turns with probability C(t, s) / C(pool, s). From that:
+
+- one card's bingo turn:      P(B <= t) = C(t, 15) / C(90, 15)
+- one card's first line turn: inclusion-exclusion over the rows,
+                              P(L <= t) = sum over row subsets S of (-1)^(|S|+1) C(t, |S|) / C(90, |S|)
+                              (|S| = numbers in those rows)
+- first of N cards:           P(min <= t) = 1 - (1 - P(<= t))^N
+
+The last line is exact for cards dealt independently (complete_card() and
+generate_cards() without max_overlap, as in simulate, the server and the
+terminal game): given the drawn numbers, each card completes independently
+with a probability that only depends on how many were drawn.
+
+Single-card results are exact Fractions; N-card results are floats. Everything
+is memoized, so a full report takes milliseconds.
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+from functools import lru_cache
+from itertools import combinations
+from math import comb
+from typing import Dict, List, Sequence, Tuple
+
+from .bingo_card import BOARD_COLS, BOARD_ROWS, NUMBER_RANGE
+
+POOL = NUMBER_RANGE[1] - NUMBER_RANGE[0] + 1
+ROW_SIZES: Tuple[int, ...] = (BOARD_COLS,) * BOARD_ROWS
+
+
+@lru_cache(maxsize=None)
+def all_drawn(t: int, s: int, pool: int = POOL) -> Fraction:
+    """P(a fixed set of s numbers is fully drawn within the first t draws)."""
+    if t < s:
+        return Fraction(0)
+    return Fraction(comb(t, s), comb(pool, s))
+
+
+@lru_cache(maxsize=None)
+def bingo_cdf(pool: int = POOL, row_sizes: Tuple[int, ...] = ROW_SIZES) -> Tuple[Fraction, ...]:
+    """cdf[t] = P(one card is full after t draws), t = 0..pool."""
+    size = sum(row_sizes)
+    return tuple(all_drawn(t, size, pool) for t in range(pool + 1))
+
+
+@lru_cache(maxsize=None)
+def line_cdf(pool: int = POOL, row_sizes: Tuple[int, ...] = ROW_SIZES) -> Tuple[Fraction, ...]:
+    """cdf[t] = P(one card has a full row after t draws), t = 0..pool."""
+    # Inclusion-exclusion terms: (sign, numbers covered by the row subset).
+    terms: List[Tuple[int, int]] = []
+    for k in range(1, len(row_sizes) + 1):
+        sign = 1 if k % 2 else -1
+        for subset in combinations(row_sizes, k):
+            terms.append((sign, sum(subset)))
+    return tuple(sum((sign * all_drawn(t, s, pool) for sign, s in terms), Fraction(0)) for t in range(pool + 1))
+
+
+def first_of(cdf: Sequence[Fraction | float], n: int) -> List[float]:
+    """cdf of the first of n independent cards: 1 - (1 - cdf[t])^n."""
+    return [1.0 - (1.0 - float(p)) ** n for p in cdf]
+
+
+def pmf(cdf: Sequence[Fraction | float]) -> List[float]:
+    """pmf[t] = P(turn == t) from a cdf indexed by turn."""
+    return [float(cdf[0])] + [float(cdf[t]) - float(cdf[t - 1]) for t in range(1, len(cdf))]
+
+
+def mean(cdf: Sequence[Fraction | float]) -> float:
+    """Expected turn: sum over t of P(turn > t)."""
+    return sum(1.0 - float(p) for p in cdf[:-1])
+
+
+def percentile(cdf: Sequence[Fraction | float], q: float) -> int:
+    """Smallest turn t with P(turn <= t) >= q (same convention as simulate.percentile)."""
+    for t, p in enumerate(cdf):
+        if float(p) >= q - 1e-12:
+            return t
+    return len(cdf) - 1
+
+
+def _exactly_one_first(single: Sequence[Fraction | float], n: int) -> float:
+    """P(exactly one of n independent cards reaches the event on the first turn anyone does)."""
+    f = pmf(single)
+    return n * sum(f[t] * (1.0 - float(single[t])) ** (n - 1) for t in range(len(single)))
+
+
+def exact_report(
+    n_players: int,
+    *,
+    line_percent: float,
+    bingo_percent: float,
+    starting_points: int,
+    pool: int = POOL,
+    row_sizes: Tuple[int, ...] = ROW_SIZES,
+) -> Dict[str, object]:
+    """
+    The analytic counterpart of simulate.summarize(): same keys, with exact
+    expectations instead of sample averages ("histogram" holds probabilities).
+    """
+    line1, bingo1 = line_cdf(pool, row_sizes), bingo_cdf(pool, row_sizes)
+    line_n, bingo_n = first_of(line1, n_players), first_of(bingo1, n_players)
+    line_f, bingo_f = pmf(line1), pmf(bingo1)
+
+    # A card is paid a line if its first row completes no later than the first
+    # bingo, i.e. every other card is still short of bingo the turn before:
+    #   E[lines] = n * sum_t P(L = t) * P(B >= t)^(n-1)
+    # and a bingo if no other card finished earlier:
+    #   E[bingos] = n * sum_t P(B = t) * P(B >= t)^(n-1)
+    def still_open(t: int) -> float:
+        return 1.0 - float(bingo1[t - 1]) if t else 1.0
+
+    line_awards = n_players * sum(line_f[t] * still_open(t) ** (n_players - 1) for t in range(pool + 1))
+    bingo_awards = n_players * sum(bingo_f[t] * still_open(t) ** (n_players - 1) for t in range(pool + 1))
+
+    pool_total = starting_points * n_players
+    line_reward = int(pool_total * line_percent)
+    bingo_reward = int(pool_total * bingo_percent)
+    payout = line_awards * line_reward + bingo_awards * bingo_reward
+
+    def dist(cdf: List[float]) -> Dict[str, object]:
+        return {
+            "mean": round(mean(cdf), 3),
+            "p50": percentile(cdf, 0.50),
+            "p90": percentile(cdf, 0.90),
+            "p99": percentile(cdf, 0.99),
+            "histogram": {str(t): p for t, p in enumerate(pmf(cdf)) if p > 0},
+        }
+
+    return {
+        "games": None,
+        "players": n_players,
+        "pool_total": pool_total,
+        "line_turn": dist(line_n),
+        "bingo_turn": dist(bingo_n),
+        "line_tie_rate": 1.0 - _exactly_one_first(line1, n_players),
+        "bingo_tie_rate": 1.0 - _exactly_one_first(bingo1, n_players),
+        "line_awards_per_game": line_awards,
+        "bingo_awards_per_game": bingo_awards,
+        "expected_payout": payout,
+        "expected_payout_pct_of_pool": payout / pool_total if pool_total else 0.0,
+    }
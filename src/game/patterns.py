@@ -0,0 +1,279 @@
+# src/game/patterns.py
+"""
+Declarative win patterns compiled to bitmasks.
+
+A Pattern is a set of card cells (row, col). Compiling a list of patterns for a
+Variant gives each one a cell mask (bit r * cols + c) in that geometry; a
+PatternIndex then tracks one marked-cell mask per card and resolves "which
+patterns did this mark complete?" with a single memoized lookup on that mask,
+so checking 20 patterns per hit costs about the same as checking one.
+
+    patterns = [*rows(), *columns(), four_corners(), diagonal(), anti_diagonal()]
+    index = PatternIndex(players, patterns)
+    for player, pattern in index.draw(n):
+        ...
+
+Builders default to the classic 3x5 card; stock(variant) gives the stock
+patterns of another geometry (e.g. the real corners of a 75-ball card).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from .bingo_card import BOARD_COLS, BOARD_ROWS
+from .player import Player
+from .variants import CLASSIC, Variant, variant_for
+
+Cell = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class Pattern:
+    """A named set of (row, col) cells that wins once every cell is marked."""
+
+    name: str
+    cells: FrozenSet[Cell]
+
+    def cell_mask(self, cols: int = BOARD_COLS) -> int:
+        mask = 0
+        for r, c in self.cells:
+            mask |= 1 << (r * cols + c)
+        return mask
+
+    def number_mask(self, card: Sequence[Sequence[Optional[int]]]) -> int:
+        """Bit n set for every number of `card` the pattern covers (free cells skipped)."""
+        mask = 0
+        for r, c in self.cells:
+            v = card[r][c]
+            if v is not None:
+                mask |= 1 << v
+        return mask
+
+
+def pattern(name: str, cells: Iterable[Cell], rows: int = BOARD_ROWS, cols: int = BOARD_COLS) -> Pattern:
+    cells = frozenset(cells)
+    if not cells:
+        raise ValueError(f"pattern {name!r} has no cells")
+    for r, c in cells:
+        if not (0 <= r < rows and 0 <= c < cols):
+            raise ValueError(f"pattern {name!r}: cell {(r, c)} outside a {rows}x{cols} card")
+    return Pattern(name, cells)
+
+
+def from_shape(name: str, shape: str, rows: int = BOARD_ROWS, cols: int = BOARD_COLS) -> Pattern:
+    """
+    Pattern from ASCII art, one line per card row: "X" (or "#") marks a cell,
+    anything else is empty. E.g. a "T":
+
+        XXXXX
+        ..X..
+        ..X..
+    """
+    lines = [line.strip() for line in shape.strip().splitlines()]
+    if len(lines) != rows or any(len(line) != cols for line in lines):
+        raise ValueError(f"shape {name!r} must be {rows} lines of {cols} characters")
+    return pattern(
+        name,
+        ((r, c) for r, line in enumerate(lines) for c, ch in enumerate(line) if ch in "X#"),
+        rows,
+        cols,
+    )
+
+
+# ---------- stock patterns ----------
+def rows(rows: int = BOARD_ROWS, cols: int = BOARD_COLS) -> List[Pattern]:
+    return [pattern(f"row-{r + 1}", ((r, c) for c in range(cols)), rows, cols) for r in range(rows)]
+
+
+def columns(rows: int = BOARD_ROWS, cols: int = BOARD_COLS) -> List[Pattern]:
+    return [pattern(f"column-{c + 1}", ((r, c) for r in range(rows)), rows, cols) for c in range(cols)]
+
+
+def four_corners(rows: int = BOARD_ROWS, cols: int = BOARD_COLS) -> Pattern:
+    return pattern("four-corners", [(0, 0), (0, cols - 1), (rows - 1, 0), (rows - 1, cols - 1)], rows, cols)
+
+
+def _diagonal_cols(rows: int, cols: int) -> List[int]:
+    # On a non-square card the diagonal still runs corner to corner, one cell per row.
+    if rows == 1:
+        return [0]
+    return [round(r * (cols - 1) / (rows - 1)) for r in range(rows)]
+
+
+def diagonal(rows: int = BOARD_ROWS, cols: int = BOARD_COLS) -> Pattern:
+    """Top-left to bottom-right."""
+    return pattern("diagonal", enumerate(_diagonal_cols(rows, cols)), rows, cols)
+
+
+def anti_diagonal(rows: int = BOARD_ROWS, cols: int = BOARD_COLS) -> Pattern:
+    """Top-right to bottom-left."""
+    return pattern("anti-diagonal", ((r, cols - 1 - c) for r, c in enumerate(_diagonal_cols(rows, cols))), rows, cols)
+
+
+def full_house(rows: int = BOARD_ROWS, cols: int = BOARD_COLS) -> Pattern:
+    return pattern("full-house", ((r, c) for r in range(rows) for c in range(cols)), rows, cols)
+
+
+def stock(variant: Variant = CLASSIC) -> List[Pattern]:
+    """Rows, columns, four corners, both diagonals and full house in the variant's geometry."""
+    n_rows, n_cols = variant.rows, variant.cols
+    return [
+        *rows(n_rows, n_cols),
+        *columns(n_rows, n_cols),
+        four_corners(n_rows, n_cols),
+        diagonal(n_rows, n_cols),
+        anti_diagonal(n_rows, n_cols),
+        full_house(n_rows, n_cols),
+    ]
+
+
+# ---------- compiled evaluation ----------
+class CompiledPatterns:
+    """
+    Cell masks for a pattern list in a variant's geometry plus a memo: marked-cell
+    mask -> bitset of the patterns it completes (bit k = patterns[k]). The
+    variant's free cells count as marked.
+    """
+
+    def __init__(self, patterns: Sequence[Pattern], variant: Variant = CLASSIC) -> None:
+        if not patterns:
+            raise ValueError("no patterns to compile")
+        names = [p.name for p in patterns]
+        if len(set(names)) != len(names):
+            raise ValueError("pattern names must be unique")
+        self.patterns: Tuple[Pattern, ...] = tuple(patterns)
+        self.variant = variant
+        self.rows = variant.rows
+        self.cols = variant.cols
+        self.free_mask = variant.free_mask
+        for p in self.patterns:
+            pattern(p.name, p.cells, self.rows, self.cols)  # validate against the geometry
+        self.masks: Tuple[int, ...] = tuple(p.cell_mask(self.cols) for p in self.patterns)
+        self._done: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def completed(self, marked_cells: int) -> int:
+        """Bitset of every pattern whose cells are all in `marked_cells`."""
+        done = self._done.get(marked_cells)
+        if done is None:
+            done = 0
+            for k, m in enumerate(self.masks):
+                if marked_cells & m == m:
+                    done |= 1 << k
+            self._done[marked_cells] = done
+        return done
+
+    def names(self, bits: int) -> List[str]:
+        return [p.name for k, p in enumerate(self.patterns) if bits >> k & 1]
+
+
+class PatternIndex:
+    """
+    Per-draw pattern evaluation for a whole hall.
+
+    Every card of every player (player.cards, so strips too) gets a slot, keyed
+    by (seat, card index). number -> [(slot, cell bit)] is built once from the
+    cards; each slot keeps a marked-cell mask and a bitset of patterns already
+    won. A mark is one OR and one memo lookup, however many patterns are
+    active. Free cells (the variant's, and None cells) start marked. A
+    completion is reported once per card.
+
+    The geometry comes from `variant`, else from the compiled patterns, else
+    from the registered variant matching the first card's shape; every card
+    must have that shape.
+    """
+
+    def __init__(
+        self,
+        players: Iterable[Player] = (),
+        patterns: Sequence[Pattern] | CompiledPatterns = (),
+        variant: Optional[Variant] = None,
+    ) -> None:
+        players = list(players)
+        if isinstance(patterns, CompiledPatterns):
+            if variant is not None and variant is not patterns.variant:
+                raise ValueError("patterns were compiled for another variant")
+            self.compiled = patterns
+        else:
+            if variant is None:
+                variant = variant_for(players[0].card) if players else CLASSIC
+            self.compiled = CompiledPatterns(patterns, variant)
+        self.players: List[Player] = []
+        self.index: Dict[int, List[Tuple[int, int]]] = {}
+        self.slots: Dict[Tuple[int, int], int] = {}  # (seat, card index) -> slot
+        self._owner: List[Player] = []
+        self._player_slots: Dict[int, List[int]] = {}
+        self._bits: List[Dict[int, int]] = []
+        self._marked: List[int] = []
+        self._won: List[int] = []
+        for p in players:
+            self.add_player(p)
+
+    def add_player(self, player: Player) -> None:
+        seat = len(self.players)
+        rows, cols = self.compiled.rows, self.compiled.cols
+        for card in player.cards:
+            if len(card) != rows or any(len(row) != cols for row in card):
+                raise ValueError(f"{player.name}: card is not {rows}x{cols} like the compiled patterns")
+        self.players.append(player)
+        slots = self._player_slots[id(player)] = []
+        for k, card in enumerate(player.cards):
+            slot = len(self._owner)
+            self.slots[(seat, k)] = slot
+            self._owner.append(player)
+            slots.append(slot)
+            bits: Dict[int, int] = {}
+            free = self.compiled.free_mask
+            for r in range(rows):
+                for c in range(cols):
+                    v = card[r][c]
+                    bit = 1 << (r * cols + c)
+                    if v is None:
+                        free |= bit
+                    else:
+                        bits[v] = bit
+                        self.index.setdefault(v, []).append((slot, bit))
+            self._bits.append(bits)
+            self._marked.append(free)
+            self._won.append(self.compiled.completed(free))
+
+    def _mark(self, slot: int, bit: int, out: List[Tuple[Player, Pattern]]) -> None:
+        marked = self._marked[slot] | bit
+        self._marked[slot] = marked
+        new = self.compiled.completed(marked) & ~self._won[slot]
+        if new:
+            self._won[slot] |= new
+            player = self._owner[slot]
+            for k, p in enumerate(self.compiled.patterns):
+                if new >> k & 1:
+                    out.append((player, p))
+
+    def draw(self, n: int, *, bots_only: bool = False) -> List[Tuple[Player, Pattern]]:
+        """Mark `n` on every card holding it; returns newly completed (player, pattern) pairs."""
+        out: List[Tuple[Player, Pattern]] = []
+        owner = self._owner
+        for slot, bit in self.index.get(n, ()):
+            if bots_only and not owner[slot].is_bot:
+                continue
+            self._mark(slot, bit, out)
+        return out
+
+    def mark(self, player: Player, n: int) -> List[Tuple[Player, Pattern]]:
+        """Mark `n` for one player only (e.g. a human who answered Y)."""
+        out: List[Tuple[Player, Pattern]] = []
+        for slot in self._player_slots[id(player)]:
+            bit = self._bits[slot].get(n)
+            if bit is not None:
+                self._mark(slot, bit, out)
+        return out
+
+    def won(self, player: Player) -> List[str]:
+        """Names of the patterns `player` has completed so far, on any card."""
+        bits = 0
+        for slot in self._player_slots[id(player)]:
+            bits |= self._won[slot]
+        return self.compiled.names(bits)
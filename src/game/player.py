@@ -2,50 +2,180 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Set, Tuple
-import random
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, Sequence, Set, Tuple
 
-from .bingo_card import BOARD_ROWS, BOARD_COLS
+from .bingo_card import card_mask, row_mask
 
+if TYPE_CHECKING:
+    from .patterns import Pattern
 
-@dataclass
+
+@dataclass(slots=True)
 class Player:
+    """
+    A seat in the match and its card(s).
+
+    Marks are kept as bitmasks (bit n <=> number n), so membership, marking and
+    line/bingo detection are integer operations instead of grid scans. Per-row
+    counters of numbers still unmarked are updated on every mark, for "N to go"
+    queries. The card is treated as read-only once the player is created; its
+    geometry is taken from the card itself, with blank/free cells as None.
+
+    A player may hold more cards in `extra_cards` (see with_cards(), e.g. a
+    six-card strip). Rows are then numbered across all cards (card k, row r is
+    global row k * rows + r) and one aggregated index number -> global rows
+    lets a draw mark every card in a single lookup. A line is any full row of
+    any card, bingo any full card.
+    """
+
     name: str
     card: List[List[int]]
     is_bot: bool = False
     points: int = 0
 
-    marked: Set[int] = field(default_factory=set)
     has_line: bool = False
     has_bingo: bool = False
+    extra_cards: List[List[List[int]]] = field(default_factory=list, repr=False)
+
+    _card_mask: int = field(init=False, repr=False, compare=False)
+    _card_masks: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _row_masks: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _rows_of: Dict[int, Tuple[int, ...]] = field(init=False, repr=False, compare=False)
+    _marked_mask: int = field(init=False, repr=False, default=0)
+    _row_left: List[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        cards = self.cards
+        self._row_masks = tuple(row_mask(row) for card in cards for row in card)
+        self._card_masks = tuple(card_mask(card) for card in cards)
+        mask = 0
+        for m in self._card_masks:
+            mask |= m
+        self._card_mask = mask
+        rows_of: Dict[int, Tuple[int, ...]] = {}
+        r = 0
+        for card in cards:
+            for row in card:
+                for n in row:
+                    if n is not None:
+                        rows_of[n] = rows_of.get(n, ()) + (r,)
+                r += 1
+        self._rows_of = rows_of
+        self._row_left = [m.bit_count() for m in self._row_masks]
+
+    @classmethod
+    def with_cards(cls, name: str, cards: Sequence[List[List[int]]], **kwargs) -> "Player":
+        """A player holding every card in `cards` (at least one)."""
+        if not cards:
+            raise ValueError("a player needs at least one card")
+        return cls(name, cards[0], extra_cards=list(cards[1:]), **kwargs)
+
+    @property
+    def cards(self) -> List[List[List[int]]]:
+        return [self.card, *self.extra_cards]
+
+    @property
+    def marked(self) -> FrozenSet[int]:
+        """
+        Numbers marked so far, as a read-only snapshot of the marked mask.
+
+        Mark through mark_number() (or assign a whole set to `marked`); the
+        snapshot cannot be changed in place.
+        """
+        mask = self._marked_mask
+        return frozenset(n for n in self._rows_of if (mask >> n) & 1)
+
+    @marked.setter
+    def marked(self, numbers: Iterable[int]) -> None:
+        mask = 0
+        for n in numbers:
+            if n > 0:
+                mask |= 1 << n
+        self._marked_mask = mask & self._card_mask
+        self._row_left = [(m & ~self._marked_mask).bit_count() for m in self._row_masks]
 
     def card_numbers(self) -> Set[int]:
-        return {self.card[r][c] for r in range(BOARD_ROWS) for c in range(BOARD_COLS)}
+        return set(self._rows_of)
 
     def has_number(self, n: int) -> bool:
-        return n in self.card_numbers()
+        return n > 0 and (self._card_mask >> n) & 1 == 1
+
+    def locate(self, n: int) -> List[Tuple[int, int]]:
+        """(card index, row) of every cell holding n."""
+        rows = len(self.card)
+        return [divmod(r, rows) for r in self._rows_of.get(n, ())]
 
     def mark_number(self, n: int) -> bool:
-        """Mark number if on card. Returns True if marked."""
-        if self.has_number(n):
-            self.marked.add(n)
-            return True
+        """Mark number if on any card. Returns True if marked."""
+        if n <= 0:
+            return False
+        bit = 1 << n
+        if not self._card_mask & bit:
+            return False
+        if not self._marked_mask & bit:
+            self._marked_mask |= bit
+            row_left = self._row_left
+            for r in self._rows_of[n]:
+                row_left[r] -= 1
+        return True
+
+    def line_through(self, n: int) -> bool:
+        """True if a row holding n (on any card) is fully marked."""
+        row_left = self._row_left
+        for r in self._rows_of.get(n, ()):
+            if row_left[r] == 0:
+                return True
         return False
 
+    def row_to_go(self, r: int) -> int:
+        """Numbers of (global) row r still unmarked."""
+        return self._row_left[r]
+
+    def line_to_go(self) -> int:
+        """Fewest numbers still needed to complete a line (0 = has a full row)."""
+        return min(self._row_left)
+
+    def bingo_to_go(self) -> int:
+        """
+        Numbers still needed to complete the closest card (0 = bingo).
+
+        O(1) for one card; with extra cards every card's rows are summed.
+        """
+        left = self._row_left
+        if not self.extra_cards:
+            return sum(left)
+        rows = len(self.card)
+        return min(sum(left[k:k + rows]) for k in range(0, len(left), rows))
+
+    def row_complete(self, r: int) -> bool:
+        """True if (global) row r is fully marked."""
+        m = self._row_masks[r]
+        return self._marked_mask & m == m
+
     def check_line(self) -> bool:
         """True if any full row is marked."""
-        for r in range(BOARD_ROWS):
-            if all(self.card[r][c] in self.marked for c in range(BOARD_COLS)):
+        marked = self._marked_mask
+        for m in self._row_masks:
+            if marked & m == m:
                 return True
         return False
 
     def check_bingo(self) -> bool:
-        """True if full card is marked."""
-        for r in range(BOARD_ROWS):
-            for c in range(BOARD_COLS):
-                if self.card[r][c] not in self.marked:
-                    return False
-        return True
+        """True if a full card is marked."""
+        marked = self._marked_mask
+        for m in self._card_masks:
+            if marked & m == m:
+                return True
+        return False
+
+    def check_pattern(self, pattern: Pattern) -> bool:
+        """True if every number the win pattern covers on some card is marked."""
+        marked = self._marked_mask
+        for card in self.cards:
+            m = pattern.number_mask(card)
+            if marked & m == m:
+                return True
+        return False
 
     # ---------- Bot behavior ----------
     def bot_play_turn(self, drawn_number: int) -> Tuple[bool, str | None]:
@@ -0,0 +1,203 @@
+# src/game/render.py
+"""
+Card rendering with precomputed frames, buffered writes and diff updates.
+
+CardFrame holds everything that only depends on the geometry (borders, the row
+template, where each cell sits on screen) and is built once per
+(rows, cols, style) by frame(). Rendering a card is then one format() per row
+over cached cell strings.
+
+BoardView draws many cards on a full-screen terminal (spectator views). The
+first draw writes every frame; later updates move the cursor to the cells whose
+mark changed and rewrite only those, all in one write() per update. When the
+output is not a terminal (pipe, log file) it falls back to re-printing only the
+cards that changed. Terminal detection uses `rich` when it is installed and
+stream.isatty() otherwise; the escape codes are plain ANSI either way.
+"""
+
+from __future__ import annotations
+
+import sys
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Set, TextIO, Tuple
+
+Card = Sequence[Sequence[Optional[int]]]
+
+CELL_W = 4
+GRID = "grid"          # print_pretty_card: │ 12 │[34]│
+SNAPSHOT = "snapshot"  # check_card echo:    │  12  │ [34] │
+
+_PLAIN = tuple(f" {v:2d} " for v in range(256))
+_MARKED = tuple(f"[{v:2d}]" for v in range(256))
+_BLANK = " " * CELL_W
+
+
+def cell_text(v: Optional[int], marked: bool) -> str:
+    if v is None:
+        return _BLANK
+    if 0 <= v < 256:
+        return _MARKED[v] if marked else _PLAIN[v]
+    return f"[{v:2d}]" if marked else f" {v:2d} "
+
+
+class CardFrame:
+    """Borders, row template and cell positions for one geometry and style."""
+
+    def __init__(self, rows: int, cols: int, style: str = GRID) -> None:
+        self.rows = rows
+        self.cols = cols
+        self.style = style
+        horiz = "─" * CELL_W
+        if style == GRID:
+            self.top = "┌" + "┬".join([horiz] * cols) + "┐"
+            self.mid = "├" + "┼".join([horiz] * cols) + "┤"
+            self.bot = "└" + "┴".join([horiz] * cols) + "┘"
+            self.row_template = "│" + "│".join(["{}"] * cols) + "│"
+            first, step = 1, CELL_W + 1
+        elif style == SNAPSHOT:
+            self.top = "┌" + (horiz + "┬") * (cols - 1) + horiz + "┐"
+            self.mid = "├" + (horiz + "┼") * (cols - 1) + horiz + "┤"
+            self.bot = "└" + (horiz + "┴") * (cols - 1) + horiz + "┘"
+            self.row_template = " │ " + " │ ".join(["{}"] * cols) + " │"
+            first, step = 3, CELL_W + 3
+        else:
+            raise ValueError(f"unknown frame style {style!r}")
+        self.width = max(len(self.top), len(self.row_template.format(*[_BLANK] * cols)))
+        self.height = 2 * rows + 1
+        # (line, column) of cell (r, c) inside the frame, 0-based
+        self.cell_pos: Tuple[Tuple[Tuple[int, int], ...], ...] = tuple(
+            tuple((1 + 2 * r, first + c * step) for c in range(cols)) for r in range(rows)
+        )
+
+    def lines(self, card: Card, marked: Set[int] | frozenset = frozenset()) -> List[str]:
+        out = [self.top]
+        template = self.row_template
+        for r, row in enumerate(card):
+            if r:
+                out.append(self.mid)
+            out.append(template.format(*[cell_text(v, v in marked) for v in row]))
+        out.append(self.bot)
+        return out
+
+    def text(self, card: Card, marked: Set[int] | frozenset = frozenset(), title: Optional[str] = None) -> str:
+        """The whole card as one string, newline-terminated (with an optional title line first)."""
+        body = "\n".join(self.lines(card, marked)) + "\n"
+        return f"\n{title}\n{body}" if title else body
+
+
+@lru_cache(maxsize=None)
+def frame(rows: int, cols: int, style: str = GRID) -> CardFrame:
+    """The shared CardFrame for a geometry and style."""
+    return CardFrame(rows, cols, style)
+
+
+def card_text(card: Card, marked: Optional[Set[int]] = None, *, title: Optional[str] = None, style: str = GRID) -> str:
+    return frame(len(card), len(card[0]), style).text(card, marked or frozenset(), title)
+
+
+def _is_terminal(stream: TextIO) -> bool:
+    try:
+        from rich.console import Console  # type: ignore
+    except ImportError:
+        isatty = getattr(stream, "isatty", None)
+        return bool(isatty and isatty())
+    return Console(file=stream).is_terminal
+
+
+class BoardView:
+    """
+    Many cards laid out in a grid, redrawn by diff.
+
+    Args:
+        cards: The cards to show.
+        titles: Optional label per card (drawn above it, cut to the frame width).
+        stream: Output (default sys.stdout).
+        per_row: Cards per screen row (default: as many as fit in 120 columns).
+        ansi: Force cursor-addressed diff updates on/off (default: only on a terminal).
+    """
+
+    def __init__(
+        self,
+        cards: Sequence[Card],
+        *,
+        titles: Optional[Sequence[str]] = None,
+        stream: Optional[TextIO] = None,
+        per_row: Optional[int] = None,
+        ansi: Optional[bool] = None,
+    ) -> None:
+        self.cards = list(cards)
+        self.titles = list(titles) if titles is not None else [""] * len(self.cards)
+        self.stream = stream if stream is not None else sys.stdout
+        self.ansi = _is_terminal(self.stream) if ansi is None else ansi
+        self.frames = [frame(len(c), len(c[0])) for c in self.cards]
+        width = max((f.width for f in self.frames), default=1) + 2
+        height = max((f.height for f in self.frames), default=1) + 1  # + title line
+        self.per_row = per_row or max(1, 120 // width)
+        # Screen origin (1-based line, column) of every card's frame.
+        self.origins = [
+            (1 + (i // self.per_row) * height + 1, 1 + (i % self.per_row) * width) for i in range(len(self.cards))
+        ]
+        # number -> [(r, c)] per card, for turning mask changes into cells
+        self._cells: List[Dict[int, List[Tuple[int, int]]]] = []
+        for card in self.cards:
+            cells: Dict[int, List[Tuple[int, int]]] = {}
+            for r, row in enumerate(card):
+                for c, v in enumerate(row):
+                    if v is not None:
+                        cells.setdefault(v, []).append((r, c))
+            self._cells.append(cells)
+        self._card_masks = [self._mask(cells) for cells in self._cells]
+        self._shown: List[Optional[int]] = [None] * len(self.cards)
+        self.bytes_written = 0
+
+    def _write(self, text: str) -> None:
+        if text:
+            self.stream.write(text)
+            self.stream.flush()
+            self.bytes_written += len(text.encode())
+
+    @staticmethod
+    def _mask(marked: Iterable[int]) -> int:
+        mask = 0
+        for n in marked:
+            mask |= 1 << n
+        return mask
+
+    def draw(self, marked: Sequence[Set[int]]) -> None:
+        """Show every card with its marks (`marked[i]` for card i), changing only what differs."""
+        masks = [self._mask(m) & cm for m, cm in zip(marked, self._card_masks)]
+        out: List[str] = []
+        if not self.ansi:
+            for i, mask in enumerate(masks):
+                if mask != self._shown[i]:
+                    out.append(self.frames[i].text(self.cards[i], marked[i], self.titles[i] or None))
+                    self._shown[i] = mask
+            self._write("".join(out))
+            return
+
+        if all(s is None for s in self._shown):
+            out.append("\x1b[2J")  # first frame: clear the screen
+        for i, mask in enumerate(masks):
+            shown = self._shown[i]
+            line0, col0 = self.origins[i]
+            f = self.frames[i]
+            if shown is None:
+                if self.titles[i]:
+                    out.append(f"\x1b[{line0 - 1};{col0}H{self.titles[i][:f.width]}")
+                for k, text in enumerate(f.lines(self.cards[i], marked[i])):
+                    out.append(f"\x1b[{line0 + k};{col0}H{text}")
+            else:
+                changed = mask ^ shown
+                while changed:
+                    low = changed & -changed
+                    n = low.bit_length() - 1
+                    changed ^= low
+                    for r, c in self._cells[i].get(n, ()):
+                        line, col = f.cell_pos[r][c]
+                        out.append(f"\x1b[{line0 + line};{col0 + col}H{cell_text(n, bool(mask & low))}")
+            self._shown[i] = mask
+        if out:
+            rows = (len(self.cards) + self.per_row - 1) // self.per_row
+            bottom = 1 + rows * (max(f.height for f in self.frames) + 1) + 1
+            out.append(f"\x1b[{bottom};1H")  # park the cursor below the board
+        self._write("".join(out))
@@ -0,0 +1,25 @@
+# src/game/rng.py
+"""
+Independent random streams for games running side by side.
+
+Every game (or card, or worker) should draw from its own random.Random instead
+of the global `random` module, so concurrent games never disturb each other and
+each one can be reproduced from its seed alone.
+"""
+
+from __future__ import annotations
+
+import random
+
+
+def rng_stream(seed: int | str, *stream: int | str) -> random.Random:
+    """
+    Reproducible generator for the stream identified by (seed, *stream).
+
+    Example: rng_stream(42, "game", 7) always yields the same sequence, on any
+    node and process, and is independent from rng_stream(42, "game", 8).
+    String seeds are hashed with SHA-512 by random.Random, so neighbouring ids
+    give unrelated streams.
+    """
+    key = ":".join(str(part) for part in (seed, *stream))
+    return random.Random(key)
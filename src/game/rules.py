@@ -0,0 +1,70 @@
+# src/game/rules.py
+"""
+Turn rules shared by every front end (terminal game, server rooms, engines).
+
+The functions apply the points side effects on the Player and return an
+outcome code plus the points delta; displaying the result is up to the caller.
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+from .player import Player
+
+# Y/N answer outcomes
+MARKED = "marked"            # said Y, number on card -> marked
+NOT_ON_CARD = "not_on_card"  # said Y, number not on card -> penalty
+MISSED = "missed"            # said N, number was on card -> penalty
+CORRECT_NO = "correct_no"    # said N, number not on card
+
+# Claim outcomes
+LINE = "line"
+BINGO = "bingo"
+FALSE_LINE = "false_line"
+FALSE_BINGO = "false_bingo"
+
+
+def resolve_answer(player: Player, drawn: int, says_yes: bool) -> Tuple[str, int]:
+    """Apply a Y/N answer for `drawn`. Returns (outcome, points delta)."""
+    before = player.points
+    if player.has_number(drawn):
+        if says_yes:
+            player.mark_number(drawn)
+            return MARKED, 0
+        player.penalize_wrong_number()
+        return MISSED, player.points - before
+    if says_yes:
+        player.penalize_wrong_number()
+        return NOT_ON_CARD, player.points - before
+    return CORRECT_NO, 0
+
+
+def resolve_claim(player: Player, claim: str, pool_total: int) -> Tuple[str, int]:
+    """
+    Validate an "L"/"B" claim and award or penalize it.
+
+    A claim is valid only if the win is real and was not already awarded.
+    Returns (outcome, points delta).
+    """
+    before = player.points
+    if claim == "L":
+        if (not player.has_line) and player.check_line():
+            return LINE, player.award_line(pool_total)
+        player.penalize_false_claim()
+        return FALSE_LINE, player.points - before
+    if claim == "B":
+        if (not player.has_bingo) and player.check_bingo():
+            return BINGO, player.award_bingo(pool_total)
+        player.penalize_false_claim()
+        return FALSE_BINGO, player.points - before
+    raise ValueError(f"unknown claim: {claim!r}")
+
+
+def award_bot_claim(bot: Player, claim: str, pool_total: int) -> Optional[int]:
+    """Award an honest bot claim unless already awarded. Returns the reward, or None."""
+    if claim == "L" and not bot.has_line:
+        return bot.award_line(pool_total)
+    if claim == "B" and not bot.has_bingo:
+        return bot.award_bingo(pool_total)
+    return None
@@ -0,0 +1,59 @@
+# src/game/schedule.py
+from __future__ import annotations
+
+import heapq
+from typing import List, Sequence, Tuple
+
+from .player import Player
+
+
+class ClaimSchedule:
+    """
+    Every bot claim of a game, computed up front from the draw order.
+
+    Bots are honest and deterministic, so once the sequence is known each bot's
+    first line turn (min over rows of the row's last draw) and bingo turn (max
+    over rows; the earliest card for multi-card bots) are fixed. They are
+    stored as (turn, seat, claim) events in a heap; the game loop just pops the
+    events due on the current turn, so the per-turn cost no longer depends on
+    the number of bots.
+
+    Claims follow Player.bot_play_turn: when a bot completes its first line and
+    its bingo on the same turn, only "B" is claimed. Bots' `marked` state is not
+    updated in this mode.
+    """
+
+    def __init__(self, players: Sequence[Player], sequence: Sequence[int]) -> None:
+        self.players = list(players)
+        pos = {n: t for t, n in enumerate(sequence, start=1)}
+        never = len(sequence) + 1
+
+        self._events: List[Tuple[int, int, str]] = []
+        for seat, p in enumerate(self.players):
+            if not p.is_bot:
+                continue
+            line = bingo = never
+            for card in p.cards:
+                rows = [max(pos.get(n, never) for n in row if n is not None) for row in card]
+                line, bingo = min(line, *rows), min(bingo, max(rows))
+            if bingo < never:
+                self._events.append((bingo, seat, "B"))
+            if line < never and line != bingo:
+                self._events.append((line, seat, "L"))
+        heapq.heapify(self._events)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def next_turn(self) -> int | None:
+        """Turn of the next pending claim, or None when no claims are left."""
+        return self._events[0][0] if self._events else None
+
+    def pop_due(self, turn: int) -> List[Tuple[Player, str]]:
+        """(bot, claim) pairs due up to `turn`, in seating order within a turn."""
+        due: List[Tuple[Player, str]] = []
+        events = self._events
+        while events and events[0][0] <= turn:
+            _, seat, claim = heapq.heappop(events)
+            due.append((self.players[seat], claim))
+        return due
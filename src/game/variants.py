@@ -0,0 +1,318 @@
+# src/game/variants.py
+"""
+Card geometries and number ranges, one object per game variant.
+
+A Variant replaces the BOARD_ROWS / BOARD_COLS / NUMBER_RANGE constants for code
+that has to run several kinds of game in one process (e.g. one server hosting
+90-ball and 75-ball rooms). Everything derived from the geometry (the free-cell
+mask used by game.patterns, the number -> column table, the column pools) is
+computed once in the constructor, so dealing and validating cards costs the
+same as with the module constants. Player and Hall need no variant: they take
+the geometry from the cards themselves.
+
+Cards are plain lists of rows as everywhere else; blank and free cells are None
+and are skipped by the masks in bingo_card / Player / Hall.
+
+    CLASSIC      3x5, any of 1-90 anywhere (the original Mini Bingo card)
+    NINETY_BALL  3x9, 5 numbers per row, column c holds 10c..10c+9 (1-9, 80-90)
+    SEVENTY_FIVE 5x5, column c holds 15c+1..15c+15, free centre
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .bingo_card import BOARD_COLS, BOARD_ROWS, NUMBER_RANGE
+
+Card = List[List[Optional[int]]]
+
+MAX_ATTEMPTS = 10_000  # cap on the random retries of row layouts and strip splits
+
+
+class Variant:
+    """
+    One card geometry.
+
+    Args:
+        name: Registry name ("classic", "90-ball", ...).
+        rows, cols: Card size.
+        number_range: Inclusive (low, high) of the drawn numbers.
+        column_ranges: Optional inclusive (low, high) per column; numbers of a
+            column are then drawn from its range and sorted top to bottom.
+        free_cells: (row, col) cells that are free (None, always marked).
+        numbers_per_row: If set, each row holds exactly this many numbers and the
+            rest of the row is blank (None), 90-ball style.
+
+    Raises:
+        ValueError: If the geometry cannot produce a card.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rows: int,
+        cols: int,
+        number_range: Tuple[int, int],
+        *,
+        column_ranges: Optional[Sequence[Tuple[int, int]]] = None,
+        free_cells: Sequence[Tuple[int, int]] = (),
+        numbers_per_row: Optional[int] = None,
+    ) -> None:
+        low, high = number_range
+        if rows < 1 or cols < 1 or low < 0 or high < low:
+            raise ValueError(f"{name}: invalid geometry {rows}x{cols} over {number_range}")
+        self.name = name
+        self.rows = rows
+        self.cols = cols
+        self.number_range = (low, high)
+        self.free_cells = frozenset(free_cells)
+        self.numbers_per_row = numbers_per_row
+        for r, c in self.free_cells:
+            if not (0 <= r < rows and 0 <= c < cols):
+                raise ValueError(f"{name}: free cell {(r, c)} outside the card")
+        if numbers_per_row is not None and self.free_cells:
+            raise ValueError(f"{name}: numbers_per_row and free_cells cannot be combined")
+        if numbers_per_row is not None and not 1 <= numbers_per_row <= cols:
+            raise ValueError(f"{name}: numbers_per_row must be in 1..{cols}")
+
+        # free cells as a cell mask (bit r * cols + c), as game.patterns numbers cells
+        self.free_mask = sum(1 << (r * cols + c) for r, c in self.free_cells)
+
+        if numbers_per_row is not None:
+            self.card_size = rows * numbers_per_row
+        else:
+            self.card_size = rows * cols - len(self.free_cells)
+
+        # ---- number pools and number -> column table ----
+        self.pool: Tuple[int, ...] = tuple(range(low, high + 1))
+        self.column_of: Tuple[int, ...] = (-1,) * (high + 1)
+        self.column_pools: Optional[Tuple[Tuple[int, ...], ...]] = None
+        if column_ranges is not None:
+            if len(column_ranges) != cols:
+                raise ValueError(f"{name}: need {cols} column ranges, got {len(column_ranges)}")
+            column_of = [-1] * (high + 1)
+            pools = []
+            for c, (clo, chi) in enumerate(column_ranges):
+                if not low <= clo <= chi <= high:
+                    raise ValueError(f"{name}: column {c} range {(clo, chi)} outside {number_range}")
+                for n in range(clo, chi + 1):
+                    if column_of[n] != -1:
+                        raise ValueError(f"{name}: number {n} in two column ranges")
+                    column_of[n] = c
+                pools.append(tuple(range(clo, chi + 1)))
+            self.column_of = tuple(column_of)
+            self.column_pools = tuple(pools)
+            if numbers_per_row is None:
+                for c, pool in enumerate(pools):
+                    need = rows - sum(1 for fr, fc in self.free_cells if fc == c)
+                    if len(pool) < need:
+                        raise ValueError(f"{name}: column {c} range too small for {need} numbers")
+            else:
+                # Every column holds at least one number when the rows can cover
+                # them all, and at most min(rows, its range) numbers; the rows need
+                # rows * numbers_per_row in total.
+                least = 1 if rows * numbers_per_row >= cols else 0
+                for c, pool in enumerate(pools):
+                    if len(pool) < least:
+                        raise ValueError(f"{name}: column {c} range too small for {least} number")
+                if sum(min(rows, len(pool)) for pool in pools) < self.card_size:
+                    raise ValueError(
+                        f"{name}: column ranges cannot hold {numbers_per_row} numbers in each of {rows} rows"
+                    )
+        elif self.card_size > len(self.pool):
+            raise ValueError(f"{name}: {self.card_size} numbers per card but only {len(self.pool)} in range")
+
+    def __repr__(self) -> str:
+        return f"Variant({self.name!r}, {self.rows}x{self.cols}, {self.number_range})"
+
+    # ---------- dealing ----------
+    def generate_card(self, rng: Optional[random.Random] = None) -> Card:
+        """
+        A random valid card (None = blank or free cell).
+
+        Raises:
+            ValueError: If no row layout is found within MAX_ATTEMPTS tries.
+        """
+        r = rng if rng is not None else random
+        if self.column_pools is None:
+            return self._free_layout_card(r)
+        if self.numbers_per_row is None:
+            layout = [[(row, c) not in self.free_cells for c in range(self.cols)] for row in range(self.rows)]
+        else:
+            layout = self._row_layout(r)
+        card: Card = [[None] * self.cols for _ in range(self.rows)]
+        for c, pool in enumerate(self.column_pools):
+            cells = [row for row in range(self.rows) if layout[row][c]]
+            for row, n in zip(cells, sorted(r.sample(pool, len(cells)))):
+                card[row][c] = n
+        return card
+
+    def _free_layout_card(self, r) -> Card:
+        # Same draws as bingo_card.complete_card(): sample, shuffle, fill row-major.
+        numbers = r.sample(self.pool, self.card_size)
+        r.shuffle(numbers)
+        it = iter(numbers)
+        return [
+            [None if (row, c) in self.free_cells else next(it) for c in range(self.cols)]
+            for row in range(self.rows)
+        ]
+
+    def _row_layout(self, r) -> List[List[bool]]:
+        """Which cells hold numbers: numbers_per_row per row, every column used, within column capacity."""
+        cols = range(self.cols)
+        capacity = [len(p) for p in self.column_pools]
+        least = 1 if self.rows * self.numbers_per_row >= self.cols else 0
+        for _ in range(MAX_ATTEMPTS):
+            layout = [[False] * self.cols for _ in range(self.rows)]
+            for row in range(self.rows):
+                for c in r.sample(cols, self.numbers_per_row):
+                    layout[row][c] = True
+            counts = [sum(layout[row][c] for row in range(self.rows)) for c in cols]
+            if all(least <= counts[c] <= capacity[c] for c in cols):
+                return layout
+        raise ValueError(f"{self.name}: no row layout found in {MAX_ATTEMPTS} attempts")
+
+    def generate_strip(self, rng: Optional[random.Random] = None) -> List[Card]:
+        """
+        A strip: pool // card_size cards that together hold every number of the
+        pool exactly once (6 cards for classic and 90-ball).
+
+        Raises:
+            ValueError: If the pool is not an exact multiple of the card size,
+                the variant fixes column ranges without numbers_per_row (75-ball),
+                or no split is found within MAX_ATTEMPTS tries.
+        """
+        r = rng if rng is not None else random
+        n_cards, extra = divmod(len(self.pool), self.card_size)
+        if extra or not n_cards:
+            raise ValueError(f"{self.name}: {len(self.pool)} numbers do not split into cards of {self.card_size}")
+        if self.column_pools is None:
+            numbers = list(self.pool)
+            r.shuffle(numbers)
+            cards = []
+            for k in range(n_cards):
+                it = iter(numbers[k * self.card_size:(k + 1) * self.card_size])
+                cards.append([
+                    [None if (row, c) in self.free_cells else next(it) for c in range(self.cols)]
+                    for row in range(self.rows)
+                ])
+            return cards
+        if self.numbers_per_row is None:
+            raise ValueError(f"{self.name}: strips need numbers_per_row")
+
+        counts = self._strip_counts(r, n_cards)
+        cards = []
+        column_numbers = [r.sample(pool, len(pool)) for pool in self.column_pools]
+        for k in range(n_cards):
+            layout = self._layout_for_counts(r, counts[k])
+            card: Card = [[None] * self.cols for _ in range(self.rows)]
+            for c in range(self.cols):
+                taken = sorted(column_numbers[c][:counts[k][c]])
+                del column_numbers[c][:counts[k][c]]
+                cells = [row for row in range(self.rows) if layout[row][c]]
+                for row, n in zip(cells, taken):
+                    card[row][c] = n
+            cards.append(card)
+        return cards
+
+    def _strip_counts(self, r, n_cards: int) -> List[List[int]]:
+        """Numbers per (card, column): every column split over the cards, 1..rows each, card_size per card."""
+        cols = range(self.cols)
+        if any(len(pool) < n_cards or len(pool) > n_cards * self.rows for pool in self.column_pools):
+            raise ValueError(f"{self.name}: column ranges cannot be split over {n_cards} cards")
+        for _ in range(MAX_ATTEMPTS):
+            counts = [[1] * self.cols for _ in range(n_cards)]
+            totals = [self.cols] * n_cards
+            ok = True
+            for c in sorted(cols, key=lambda c: -len(self.column_pools[c])):
+                for _ in range(len(self.column_pools[c]) - n_cards):
+                    options = [k for k in range(n_cards) if totals[k] < self.card_size and counts[k][c] < self.rows]
+                    if not options:
+                        ok = False
+                        break
+                    k = r.choice(options)
+                    counts[k][c] += 1
+                    totals[k] += 1
+                if not ok:
+                    break
+            if ok:
+                return counts
+        raise ValueError(f"{self.name}: no strip split found in {MAX_ATTEMPTS} attempts")
+
+    def _layout_for_counts(self, r, counts: Sequence[int]) -> List[List[bool]]:
+        """Cells holding numbers, given numbers per column and numbers_per_row per row."""
+        left = [self.numbers_per_row] * self.rows
+        layout = [[False] * self.cols for _ in range(self.rows)]
+        # Fullest columns first, each into the rows with the most room left
+        # (random tie-break): the greedy order that always fits (Gale-Ryser).
+        order = sorted(range(self.cols), key=lambda c: (-counts[c], r.random()))
+        for c in order:
+            rows = sorted(range(self.rows), key=lambda row: (-left[row], r.random()))[:counts[c]]
+            for row in rows:
+                layout[row][c] = True
+                left[row] -= 1
+        return layout
+
+    def validate(self, card: Sequence[Sequence[Optional[int]]]) -> None:
+        """Raise ValueError unless `card` is a valid card of this variant."""
+        if len(card) != self.rows or any(len(row) != self.cols for row in card):
+            raise ValueError(f"expected a {self.rows}x{self.cols} card")
+        low, high = self.number_range
+        seen = set()
+        for r, row in enumerate(card):
+            present = 0
+            for c, v in enumerate(row):
+                if (r, c) in self.free_cells:
+                    if v is not None:
+                        raise ValueError(f"cell {(r, c)} must be free")
+                    continue
+                if v is None:
+                    continue
+                present += 1
+                if not low <= v <= high or v in seen:
+                    raise ValueError(f"invalid or repeated number {v}")
+                if self.column_pools is not None and self.column_of[v] != c:
+                    raise ValueError(f"{v} is not allowed in column {c}")
+                seen.add(v)
+            if self.numbers_per_row is not None and present != self.numbers_per_row:
+                raise ValueError(f"row {r} must hold {self.numbers_per_row} numbers")
+        if len(seen) != self.card_size:
+            raise ValueError(f"expected {self.card_size} numbers, got {len(seen)}")
+
+
+CLASSIC = Variant("classic", BOARD_ROWS, BOARD_COLS, NUMBER_RANGE)
+NINETY_BALL = Variant(
+    "90-ball",
+    3,
+    9,
+    (1, 90),
+    column_ranges=[(1, 9)] + [(10 * c, 10 * c + 9) for c in range(1, 8)] + [(80, 90)],
+    numbers_per_row=5,
+)
+SEVENTY_FIVE_BALL = Variant(
+    "75-ball",
+    5,
+    5,
+    (1, 75),
+    column_ranges=[(15 * c + 1, 15 * c + 15) for c in range(5)],
+    free_cells=[(2, 2)],
+)
+
+VARIANTS: Dict[str, Variant] = {v.name: v for v in (CLASSIC, NINETY_BALL, SEVENTY_FIVE_BALL)}
+
+
+def variant_for(card: Sequence[Sequence[Optional[int]]]) -> Variant:
+    """The registered variant with the card's rows x cols."""
+    shape = (len(card), len(card[0]))
+    for v in VARIANTS.values():
+        if (v.rows, v.cols) == shape:
+            return v
+    raise ValueError(f"no registered variant is {shape[0]}x{shape[1]}; pass the Variant explicitly")
+
+
+def get_variant(name: str) -> Variant:
+    try:
+        return VARIANTS[name]
+    except KeyError:
+        raise ValueError(f"unknown variant {name!r} (choose from {', '.join(VARIANTS)})") from None
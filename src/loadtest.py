@@ -0,0 +1,392 @@
+# src/loadtest.py
+"""
+Load generator for the multi-room server (src/server.py).
+
+Launches many simulated clients spread over rooms, plays every room to the end
+and reports:
+- draw broadcast latency (server send time -> client receive), p50/p99/p999
+- Y/N answer and L/B claim round-trip times, p50/p99/p999
+- rooms completed per CPU-second ("rooms per core") and per wall-second
+
+Client strategies are modelled on Player.bot_play_turn:
+- honest: answer Y exactly when the number is on the card, claim L/B as soon as
+  the card really has them;
+- noisy:  like honest, but every answer is flipped and a false claim is made
+  with probability --error-rate.
+
+Clients mark a number on their local card only when the server replies MARKED,
+and decide their real claims then, so their card always matches the server's.
+
+Without --connect/--unix the server runs in this process (in a thread when
+--procs > 1, so the client processes reach it over TCP).
+
+Run:
+    python -m src.loadtest --rooms 200 --clients-per-room 10 --interval 0.05
+    python -m src.loadtest --connect 127.0.0.1:7777 --rooms 1000 --procs 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .game.player import Player
+from .server import BingoServer
+
+# ("tcp", host, port) or ("unix", path, 0)
+Target = Tuple[str, str, int]
+
+
+@dataclass
+class LoadStats:
+    """Raw samples (milliseconds) and counters; merged across processes."""
+
+    draw_latency_ms: List[float] = field(default_factory=list)
+    answer_rtt_ms: List[float] = field(default_factory=list)
+    claim_rtt_ms: List[float] = field(default_factory=list)
+    rooms_completed: int = 0
+    clients: int = 0
+    errors: int = 0
+
+    def merge(self, other: "LoadStats") -> None:
+        self.draw_latency_ms.extend(other.draw_latency_ms)
+        self.answer_rtt_ms.extend(other.answer_rtt_ms)
+        self.claim_rtt_ms.extend(other.claim_rtt_ms)
+        self.rooms_completed += other.rooms_completed
+        self.clients += other.clients
+        self.errors += other.errors
+
+
+def percentiles(samples: Sequence[float], qs: Sequence[float] = (0.50, 0.99, 0.999)) -> Dict[str, float]:
+    """Nearest-rank percentiles, keyed "p50", "p99", "p999"."""
+    out: Dict[str, float] = {}
+    ordered = sorted(samples)
+    for q in qs:
+        key = "p" + f"{q * 100:g}".replace(".", "")
+        if not ordered:
+            out[key] = 0.0
+            continue
+        idx = min(len(ordered) - 1, max(0, int(q * len(ordered) + 0.5) - 1))
+        out[key] = round(ordered[idx], 3)
+    return out
+
+
+class _RoomSync:
+    """Lets one client of a room start the game once everyone else has joined or failed to."""
+
+    def __init__(self, expected: int) -> None:
+        self.expected = expected
+        self.joined = 0
+        self.ready = asyncio.Event()
+        self._started = False
+
+    def arrive(self) -> None:
+        self.joined += 1
+        if self.joined >= self.expected:
+            self.ready.set()
+
+    def fail(self) -> None:
+        """A client whose JOIN was refused: stop waiting for it."""
+        self.expected -= 1
+        if self.joined >= self.expected:
+            self.ready.set()
+
+    def take_start(self) -> bool:
+        """True for the first joined client to ask, which then sends START."""
+        if self._started:
+            return False
+        self._started = True
+        return True
+
+
+async def _open(target: Target) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    kind, addr, port = target
+    if kind == "unix":
+        return await asyncio.open_unix_connection(addr)
+    return await asyncio.open_connection(addr, port)
+
+
+async def run_client(
+    target: Target,
+    room_id: str,
+    name: str,
+    sync: _RoomSync,
+    stats: LoadStats,
+    *,
+    strategy: str = "honest",
+    error_rate: float = 0.0,
+    rng: Optional[random.Random] = None,
+) -> None:
+    """Play one client until the room ends."""
+    rng = rng if rng is not None else random.Random()
+    reader, writer = await _open(target)
+    # (send time, drawn number or None for a claim); the server replies in order.
+    pending: deque = deque()
+    player: Optional[Player] = None
+    starter = False
+
+    def send(line: str) -> None:
+        writer.write((line + "\n").encode())
+
+    try:
+        send(f"JOIN {room_id} {name}")
+        while True:
+            raw = await reader.readline()
+            if not raw:
+                stats.errors += 1
+                return
+            now_ns = time.time_ns()
+            now = time.perf_counter()
+            parts = raw.decode().split()
+            kind = parts[0]
+
+            if kind == "CARD":
+                card = [[None if v == "-" else int(v) for v in row.split(",")] for row in parts[1].split(";")]
+                player = Player(name, card)
+                sync.arrive()
+                await sync.ready.wait()
+                if sync.take_start():
+                    starter = True
+                    send("START")
+            elif kind == "DRAW" and player is not None:
+                drawn = int(parts[2])
+                stats.draw_latency_ms.append((now_ns - int(parts[3])) / 1e6)
+
+                says_yes = player.has_number(drawn)
+                if strategy == "noisy" and rng.random() < error_rate:
+                    says_yes = not says_yes
+                pending.append((time.perf_counter(), drawn))
+                send("Y" if says_yes else "N")
+                if strategy == "noisy" and rng.random() < error_rate:
+                    pending.append((time.perf_counter(), None))
+                    send(rng.choice("LB"))
+                await writer.drain()
+            elif kind in ("MARKED", "OK", "WRONG", "MISSED"):
+                if not pending:
+                    continue
+                sent, drawn = pending.popleft()
+                stats.answer_rtt_ms.append((now - sent) * 1e3)
+                # Mark only what the server marked, so the local card never
+                # runs ahead of the server's after a deliberately wrong answer.
+                if kind == "MARKED" and player is not None:
+                    player.mark_number(drawn)
+                    claim = None
+                    if (not player.has_bingo) and player.check_bingo():
+                        claim = "B"
+                    elif (not player.has_line) and player.check_line():
+                        claim = "L"
+                    if claim is not None:
+                        pending.append((time.perf_counter(), None))
+                        send(claim)
+                        await writer.drain()
+            elif kind in ("LINE", "BINGO", "FALSE"):
+                if pending:
+                    stats.claim_rtt_ms.append((now - pending.popleft()[0]) * 1e3)
+                if kind == "LINE" and player is not None:
+                    player.has_line = True
+                elif kind == "BINGO" and player is not None:
+                    player.has_bingo = True
+            elif kind == "END":
+                if starter:
+                    stats.rooms_completed += 1
+                return
+            elif kind == "ERR":
+                if player is None:
+                    # The JOIN was refused; let the room start without this client.
+                    stats.errors += 1
+                    sync.fail()
+                    return
+                if pending:
+                    pending.popleft()
+                # Late answers/claims after the room ended are expected; anything else is not.
+                if parts[1:3] != ["no", "draw"]:
+                    stats.errors += 1
+    finally:
+        writer.close()
+
+
+async def run_rooms(
+    target: Target,
+    room_ids: Sequence[str],
+    clients_per_room: int,
+    *,
+    strategy: str = "honest",
+    error_rate: float = 0.0,
+    seed: int = 0,
+) -> LoadStats:
+    """Run clients_per_room clients in each of room_ids concurrently."""
+    stats = LoadStats(clients=len(room_ids) * clients_per_room)
+    tasks = []
+    for room_id in room_ids:
+        sync = _RoomSync(clients_per_room)
+        for i in range(clients_per_room):
+            tasks.append(run_client(
+                target, room_id, f"c{i}", sync, stats,
+                strategy=strategy,
+                error_rate=error_rate,
+                rng=random.Random(f"{seed}:{room_id}:{i}"),
+            ))
+    await asyncio.gather(*tasks)
+    return stats
+
+
+def _client_process(args: Tuple[Target, List[str], int, str, float, int]) -> LoadStats:
+    target, room_ids, clients_per_room, strategy, error_rate, seed = args
+    return asyncio.run(run_rooms(
+        target, room_ids, clients_per_room, strategy=strategy, error_rate=error_rate, seed=seed,
+    ))
+
+
+def _start_server_thread(server: BingoServer, host: str) -> Tuple[int, threading.Thread]:
+    """Run the server on its own event loop in a daemon thread; returns its port."""
+    ready = threading.Event()
+    port: List[int] = []
+
+    async def main() -> None:
+        srv = await server.start_tcp(host, 0)
+        port.append(srv.sockets[0].getsockname()[1])
+        ready.set()
+        async with srv:
+            await srv.serve_forever()
+
+    thread = threading.Thread(target=asyncio.run, args=(main(),), daemon=True)
+    thread.start()
+    ready.wait()
+    return port[0], thread
+
+
+def _cpu_seconds() -> float:
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def run_load(
+    *,
+    rooms: int,
+    clients_per_room: int,
+    procs: int = 1,
+    target: Optional[Target] = None,
+    bots: int = 0,
+    interval: float = 0.05,
+    strategy: str = "honest",
+    error_rate: float = 0.0,
+    seed: int = 0,
+) -> Dict[str, object]:
+    """Run the load test and return the report dict."""
+    room_ids = [f"load-{seed}-{i}" for i in range(rooms)]
+    cpu0, wall0 = _cpu_seconds(), time.perf_counter()
+
+    if target is None and procs == 1:
+        async def in_process() -> LoadStats:
+            server = BingoServer(bots=bots, interval=interval, seed=seed)
+            srv = await server.start_tcp("127.0.0.1", 0)
+            port = srv.sockets[0].getsockname()[1]
+            try:
+                return await run_rooms(
+                    ("tcp", "127.0.0.1", port), room_ids, clients_per_room,
+                    strategy=strategy, error_rate=error_rate, seed=seed,
+                )
+            finally:
+                srv.close()
+
+        stats = asyncio.run(in_process())
+    else:
+        if target is None:
+            port, _ = _start_server_thread(BingoServer(bots=bots, interval=interval, seed=seed), "127.0.0.1")
+            target = ("tcp", "127.0.0.1", port)
+        shares = [room_ids[i::procs] for i in range(procs)]
+        work = [(target, share, clients_per_room, strategy, error_rate, seed) for share in shares if share]
+        stats = LoadStats()
+        with ProcessPoolExecutor(max_workers=len(work)) as pool:
+            for s in pool.map(_client_process, work):
+                stats.merge(s)
+
+    wall = time.perf_counter() - wall0
+    cpu = _cpu_seconds() - cpu0
+    return {
+        "rooms": rooms,
+        "clients": stats.clients,
+        "rooms_completed": stats.rooms_completed,
+        "errors": stats.errors,
+        "wall_seconds": round(wall, 3),
+        "cpu_seconds": round(cpu, 3),
+        "rooms_per_wall_second": round(stats.rooms_completed / wall, 3) if wall else 0.0,
+        "rooms_per_cpu_second": round(stats.rooms_completed / cpu, 3) if cpu else 0.0,
+        "draw_latency_ms": percentiles(stats.draw_latency_ms),
+        "answer_rtt_ms": percentiles(stats.answer_rtt_ms),
+        "claim_rtt_ms": percentiles(stats.claim_rtt_ms),
+        "samples": {
+            "draws": len(stats.draw_latency_ms),
+            "answers": len(stats.answer_rtt_ms),
+            "claims": len(stats.claim_rtt_ms),
+        },
+    }
+
+
+def print_report(report: Dict[str, object]) -> None:
+    print(f"\nRooms: {report['rooms_completed']}/{report['rooms']}   Clients: {report['clients']}"
+          f"   Errors: {report['errors']}")
+    print(f"Wall: {report['wall_seconds']}s   CPU: {report['cpu_seconds']}s")
+    print(f"Throughput → {report['rooms_per_cpu_second']} rooms/CPU-s   "
+          f"{report['rooms_per_wall_second']} rooms/s")
+    for key, label in (("draw_latency_ms", "Draw latency"), ("answer_rtt_ms", "Answer RTT"),
+                       ("claim_rtt_ms", "Claim RTT")):
+        p = report[key]
+        print(f"{label:12s} (ms) → p50 {p['p50']}  p99 {p['p99']}  p999 {p['p999']}")
+
+
+def _parse_target(args: argparse.Namespace) -> Optional[Target]:
+    if args.unix:
+        return ("unix", args.unix, 0)
+    if args.connect:
+        host, _, port = args.connect.rpartition(":")
+        return ("tcp", host or "127.0.0.1", int(port))
+    return None
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Load test for the Mini Bingo server.")
+    parser.add_argument("--rooms", type=int, default=100)
+    parser.add_argument("--clients-per-room", type=int, default=10)
+    parser.add_argument("--procs", type=int, default=1, help="Client processes.")
+    parser.add_argument("--connect", default=None, help="host:port of a running server.")
+    parser.add_argument("--unix", default=None, help="Unix socket of a running server.")
+    parser.add_argument("--bots", type=int, default=0, help="Bots per room (in-process server only).")
+    parser.add_argument("--interval", type=float, default=0.05,
+                        help="Seconds between draws (in-process server only).")
+    parser.add_argument("--strategy", choices=("honest", "noisy"), default="honest")
+    parser.add_argument("--error-rate", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+    args = parser.parse_args(argv)
+
+    report = run_load(
+        rooms=args.rooms,
+        clients_per_room=args.clients_per_room,
+        procs=args.procs or os.cpu_count() or 1,
+        target=_parse_target(args),
+        bots=args.bots,
+        interval=args.interval,
+        strategy=args.strategy,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,13 +18,36 @@ Run:
 
 from __future__ import annotations
 
+import argparse
+import contextlib
 import os
+import random
 import sys
+import uuid
 from typing import Dict, List, Optional, Set
 
-from game.bingo_card import complete_card, BOARD_ROWS, BOARD_COLS
-from game.number_draw import NumberDrawer
-from game.player import Player
+try:  # python -m src.main
+    from .game.bingo_card import generate_cards
+    from .game.number_draw import NumberDrawer
+    from .game.player import Player
+    from .game.card_bank import CardBank
+    from .game.engine import GameEngine, GameEvent
+    from .game.metrics import GameMetrics
+    from .game.journal import GameJournal, resume
+    from .game.ledger import LedgerSink, PointsLedger, PointsStore
+    from .game.render import card_text
+    from .game import rules
+except ImportError:  # python src/main.py
+    from game.bingo_card import generate_cards
+    from game.number_draw import NumberDrawer
+    from game.player import Player
+    from game.card_bank import CardBank
+    from game.engine import GameEngine, GameEvent
+    from game.metrics import GameMetrics
+    from game.journal import GameJournal, resume
+    from game.ledger import LedgerSink, PointsLedger, PointsStore
+    from game.render import card_text
+    from game import rules
 
 
 # ---------------- Settings loading ---------------- #
@@ -83,42 +106,23 @@ def exit_if_requested(text: str) -> None:
 
 # ---------------- PRETTY CARD PRINTER (NEW) ---------------- #
 def print_pretty_card(
-    card: List[List[int]],
+    card: List[List[Optional[int]]],
     marked: Optional[Set[int]] = None,
     *,
     title: Optional[str] = None,
 ) -> None:
     """
-    Print a perfectly aligned 3x5 bingo card.
+    Print a perfectly aligned bingo card (3x5, or any variant's geometry).
 
     - Each cell is width=4.
       Unmarked: ' 12 '
       Marked:   '[12]'
+      Blank/free (None): '    '
     - Borders are generated from the same width, so nothing spills out.
+    - The frame for the geometry is built once (game.render) and the whole
+      card goes out in a single write.
     """
-    if marked is None:
-        marked = set()
-
-    cell_w = 4
-    horiz = "─" * cell_w
-
-    top = "┌" + "┬".join([horiz] * BOARD_COLS) + "┐"
-    mid = "├" + "┼".join([horiz] * BOARD_COLS) + "┤"
-    bot = "└" + "┴".join([horiz] * BOARD_COLS) + "┘"
-
-    def cell(v: int) -> str:
-        return f"[{v:2d}]" if v in marked else f" {v:2d} "
-
-    if title:
-        print("\n" + title)
-
-    print(top)
-    for r in range(BOARD_ROWS):
-        row_cells = [cell(card[r][c]) for c in range(BOARD_COLS)]
-        print("│" + "│".join(row_cells) + "│")
-        if r < BOARD_ROWS - 1:
-            print(mid)
-    print(bot)
+    sys.stdout.write(card_text(card, marked, title=title))
 
 
 # ---------------- Instructions screen ---------------- #
@@ -182,7 +186,11 @@ def choose_mode() -> int:
         print("Invalid choice. Type 1, 2, or 3 (or 'exit' to quit).")
 
 
-def create_players(mode: int) -> List[Player]:
+def create_players(
+    mode: int,
+    rng: Optional[random.Random] = None,
+    bank: Optional[CardBank] = None,
+) -> List[Player]:
     bots_count = {
         1: int(SETTINGS["bots_easy"]),
         2: int(SETTINGS["bots_medium"]),
@@ -191,135 +199,194 @@ def create_players(mode: int) -> List[Player]:
 
     starting_points = int(SETTINGS["starting_points_per_player"])
 
+    # Deal every card of the hall at once so no two players share a card:
+    # distinct card ids from a pre-generated bank, or a fresh unique batch.
+    if bank is not None:
+        ids = (rng if rng is not None else random).sample(range(len(bank)), 1 + bots_count)
+        cards = [bank[i] for i in ids]
+    else:
+        cards = generate_cards(1 + bots_count, rng=rng)
+
     players: List[Player] = []
-    human_card = complete_card()
+    human_card = cards[0]
     human = Player(name="You", card=human_card, is_bot=False, points=starting_points)
     players.append(human)
 
     for i in range(bots_count):
-        bot_card = complete_card()
+        bot_card = cards[i + 1]
         bot = Player(name=f"Bot-{i+1}", card=bot_card, is_bot=True, points=starting_points)
         players.append(bot)
 
     return players
 
 
-# ---------------- Core game loop ---------------- #
-def play_game(seed: Optional[int] = None) -> None:
-    print_instructions()
-    mode = choose_mode()
-    players = create_players(mode)
+# ---------------- Terminal front end for the engine ---------------- #
+class TerminalProvider:
+    """Decisions for the human seat, typed in the terminal."""
+
+    def _prompt(self, text: str) -> str:
+        # The engine flushes the sink before asking, so the board is already out.
+        return input(text)
 
-    human = players[0]
-    pool_total = sum(p.points for p in players)
+    def answer(self, player: Player, drawn: int) -> str:
+        try:
+            ans = self._prompt(f"\nDo you have {drawn}? (Y/N): ")
+        except EOFError:
+            ans = "N"
+        exit_if_requested(ans)
+        return ans
 
-    #FIX: use pretty printer instead of print_complete_card
-    print_pretty_card(human.card, title="Your Bingo Card (3×5):")
+    def claim(self, player: Player, drawn: int) -> str:
+        try:
+            c = self._prompt("Claim Line/Bingo? (L/B/N): ")
+        except EOFError:
+            c = "N"
+        exit_if_requested(c)
+        return c
 
-    print(f"\nPlayers in this match: {len(players)} (You + {len(players)-1} bots)")
-    print(f"Starting points each: {SETTINGS['starting_points_per_player']}")
-    print(f"Total point pool: {pool_total}\n")
 
-    drawer = NumberDrawer(seed=seed)
+class PrintSink:
+    """
+    Prints engine events the way the terminal game always has.
 
-    turn = 1
-    bingo_winner: Optional[Player] = None
+    Lines are collected and written in one go by flush() (the engine flushes
+    before each prompt and at game over, play_game once more on the way out).
+    With quiet=True the bot claim lines are left out.
+    """
 
-    try:
-        while True:
-            drawn = drawer.draw_next()
-            if drawn is None:
-                print("\nNo more numbers left. Game over.")
-                break
-
-            print(f"\n========== TURN {turn} ==========")
-            print(f"Number drawn: {drawn}")
-
-            # --- Bots play ---
-            for bot in players[1:]:
-                has_num, claim = bot.bot_play_turn(drawn)
-                if claim == "L" and not bot.has_line:
-                    reward = bot.award_line(pool_total)
-                    print(f"{bot.name} claims a LINE! +{reward} points. (Total: {bot.points})")
-                if claim == "B" and not bot.has_bingo:
-                    reward = bot.award_bingo(pool_total)
-                    print(f"{bot.name} claims BINGO! +{reward} points. (Total: {bot.points})")
-                    bingo_winner = bot
-
-            if bingo_winner:
-                break
-
-            # --- Human turn ---
-            # FIX: use pretty printer for live view too
-            print_pretty_card(human.card, human.marked, title="Your card right now:")
-
-            try:
-                ans = input(f"\nDo you have {drawn}? (Y/N): ")
-            except EOFError:
-                ans = "N"
-
-            exit_if_requested(ans)
-            ans = ans.strip().upper()
-            if ans not in ("Y", "N"):
-                print("Invalid input. Treated as 'N' and -1 point penalty.")
-                human.penalize_wrong_number()
-                ans = "N"
-
-            actually_on_card = human.has_number(drawn)
-
-            if ans == "Y":
-                if actually_on_card:
-                    human.mark_number(drawn)
-                    print("Marked!")
-                else:
-                    print("That number is NOT on your card. -1 point.")
-                    human.penalize_wrong_number()
-            else:  # ans == "N"
-                if actually_on_card:
-                    print("It WAS on your card. Missed it! -1 point.")
-                    human.penalize_wrong_number()
-
-            claim: Optional[str] = None
-            if ans == "Y":
-                try:
-                    c = input("Claim Line/Bingo? (L/B/N): ")
-                except EOFError:
-                    c = "N"
-
-                exit_if_requested(c)
-                c = c.strip().upper()
-                if c not in ("L", "B", "N"):
-                    print("Invalid claim input. No claim.")
-                    c = "N"
-                if c in ("L", "B"):
-                    claim = c
-
-            # Validate claim
-            if claim == "L":
-                if (not human.has_line) and human.check_line():
-                    reward = human.award_line(pool_total)
-                    print(f"LINE COMPLETE! You gain +{reward} points.")
-                else:
-                    print("False Line claim. -3 points.")
-                    human.penalize_false_claim()
-
-            if claim == "B":
-                if (not human.has_bingo) and human.check_bingo():
-                    reward = human.award_bingo(pool_total)
-                    print(f"BINGO!!! You gain +{reward} points.")
-                    bingo_winner = human
-                else:
-                    print("False Bingo claim. -3 points.")
-                    human.penalize_false_claim()
-
-            print(f"\nYour points: {human.points}")
-            turn += 1
-
-            if bingo_winner:
-                break
+    def __init__(self, *, quiet: bool = False) -> None:
+        self.quiet = quiet
+        self._buf: List[str] = []
+
+    def _say(self, text: str) -> None:
+        self._buf.append(text + "\n")
+
+    def flush(self) -> None:
+        if self._buf:
+            sys.stdout.write("".join(self._buf))
+            self._buf = []
+        sys.stdout.flush()
+
+    def emit(self, event: GameEvent) -> None:
+        kind = event.kind
+        p = event.player
+        if kind == "draw":
+            self._say(f"\n========== TURN {event.turn} ==========")
+            self._say(f"Number drawn: {event.number}")
+        elif kind == "exhausted":
+            self._say("\nNo more numbers left. Game over.")
+        elif kind == "bot_claim":
+            if self.quiet:
+                pass
+            elif event.claim == "L":
+                self._say(f"{p.name} claims a LINE! +{event.delta} points. (Total: {p.points})")
+            else:
+                self._say(f"{p.name} claims BINGO! +{event.delta} points. (Total: {p.points})")
+        elif kind == "card":
+            self._buf.append(card_text(p.card, p.marked, title="Your card right now:"))
+        elif kind == "invalid_answer":
+            self._say("Invalid input. Treated as 'N' and -1 point penalty.")
+        elif kind == "answer":
+            if event.outcome == rules.MARKED:
+                self._say("Marked!")
+            elif event.outcome == rules.NOT_ON_CARD:
+                self._say("That number is NOT on your card. -1 point.")
+            elif event.outcome == rules.MISSED:
+                self._say("It WAS on your card. Missed it! -1 point.")
+        elif kind == "invalid_claim":
+            self._say("Invalid claim input. No claim.")
+        elif kind == "claim":
+            if event.outcome == rules.LINE:
+                self._say(f"LINE COMPLETE! You gain +{event.delta} points.")
+            elif event.outcome == rules.BINGO:
+                self._say(f"BINGO!!! You gain +{event.delta} points.")
+            elif event.outcome == rules.FALSE_LINE:
+                self._say("False Line claim. -3 points.")
+            else:
+                self._say("False Bingo claim. -3 points.")
+        elif kind == "points":
+            self._say(f"\nYour points: {p.points}")
 
+
+# ---------------- Core game loop ---------------- #
+def play_game(
+    seed: Optional[int] = None,
+    bank: Optional[CardBank] = None,
+    *,
+    precompute_bots: bool = False,
+    metrics_path: Optional[str] = None,
+    journal_path: Optional[str] = None,
+    resume_journal: bool = False,
+    ledger_path: Optional[str] = None,
+    quiet: bool = False,
+) -> None:
+    """
+    Play one terminal game. With journal_path every game is recorded to that
+    file; with resume_journal=True the crashed game in it is continued from its
+    last complete turn instead of starting a new one. With ledger_path every
+    points movement goes to that SQLite ledger and is reconciled at the end.
+    quiet=True leaves the bots' claim lines out of the turn output.
+
+    Raises:
+        ValueError: If metrics_path or ledger_path is combined with resume_journal.
+    """
+    if resume_journal and (metrics_path or ledger_path):
+        raise ValueError("metrics and ledger are not supported when resuming a journal")
+    metrics = GameMetrics() if metrics_path else None
+    ledger = None
+    if resume_journal:
+        sink = PrintSink(quiet=quiet)
+        engine = resume(journal_path, {0: TerminalProvider()}, sink=sink)
+        players = engine.players
+        human = players[0]
+        print(f"\nResuming game after turn {engine.drawer.turn}.")
+        print_pretty_card(human.card, human.marked, title="Your card right now:")
+        print(f"\nYour points: {human.points}")
+    else:
+        print_instructions()
+        mode = choose_mode()
+        players = create_players(mode, bank=bank)
+
+        human = players[0]
+        pool_total = sum(p.points for p in players)
+
+        #FIX: use pretty printer instead of print_complete_card
+        print_pretty_card(human.card, title="Your Bingo Card (3×5):")
+
+        print(f"\nPlayers in this match: {len(players)} (You + {len(players)-1} bots)")
+        print(f"Starting points each: {SETTINGS['starting_points_per_player']}")
+        print(f"Total point pool: {pool_total}\n")
+
+        sink = PrintSink(quiet=quiet)
+        engine_sink = sink
+        if ledger_path:
+            ledger = PointsLedger(uuid.uuid4().hex, PointsStore(ledger_path))
+            ledger.open_balances(players)
+            engine_sink = LedgerSink(ledger, sink)
+
+        engine = GameEngine(
+            players,
+            NumberDrawer(seed=seed),
+            providers={0: TerminalProvider()},
+            sink=engine_sink,
+            precompute_bots=precompute_bots,
+            metrics=metrics,
+            journal=GameJournal(journal_path, seed=seed) if journal_path else None,
+        )
+
+    try:
+        engine.run()
     except KeyboardInterrupt:
         print("\n\nGame interrupted by user.")
+    finally:
+        sink.flush()
+        if engine.journal is not None:
+            engine.journal.close()
+        # Also on the in-game 'exit' (SystemExit): persist what was recorded.
+        if ledger is not None:
+            ledger.close()
+            ledger.store.close()
+    bingo_winner = engine.winner
 
     # ---------------- End game summary ---------------- #
     print("\n================== GAME OVER ==================")
@@ -334,6 +401,56 @@ def play_game(seed: Optional[int] = None) -> None:
         print(f"  - {p.name:6s} {tag:5s} → {p.points} pts")
     print("===============================================")
 
+    if metrics is not None:
+        metrics.write(metrics_path)
+    if ledger is not None:
+        report = ledger.reconcile(engine.pool_total, players)
+        status = "reconciled" if report["ok"] else f"MISMATCH {report['mismatches']}"
+        print(f"Ledger {ledger.game_id}: {report['entries']} entries, {status}.")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Mini Bingo in the terminal.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for the number draws.")
+    parser.add_argument("--bank", default=None, help="Deal cards from this card bank file.")
+    parser.add_argument(
+        "--precompute-bots",
+        action="store_true",
+        help="Precompute every bot claim from the draw order instead of checking bots each turn.",
+    )
+    parser.add_argument(
+        "--metrics",
+        default=None,
+        help="Write per-turn metrics here on game end (.json, otherwise Prometheus text).",
+    )
+    parser.add_argument("--journal", default=None, help="Record the game to this journal file.")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the unfinished game recorded in --journal from its last complete turn.",
+    )
+    parser.add_argument("--ledger", default=None, help="Record every points movement in this SQLite database.")
+    parser.add_argument("--quiet", action="store_true", help="Do not print the bots' Line/Bingo claims.")
+    args = parser.parse_args(argv)
+    if args.resume and not args.journal:
+        parser.error("--resume needs --journal")
+    if args.resume and args.ledger:
+        parser.error("--ledger cannot be combined with --resume")
+    if args.resume and args.metrics:
+        parser.error("--metrics cannot be combined with --resume")
+    return args
+
 
 if __name__ == "__main__":
-    play_game(seed=None)
+    args = parse_args()
+    with CardBank(args.bank) if args.bank else contextlib.nullcontext() as bank:
+        play_game(
+            seed=args.seed,
+            bank=bank,
+            precompute_bots=args.precompute_bots,
+            metrics_path=args.metrics,
+            journal_path=args.journal,
+            resume_journal=args.resume,
+            ledger_path=args.ledger,
+            quiet=args.quiet,
+        )
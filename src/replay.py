@@ -0,0 +1,86 @@
+# src/replay.py
+"""
+Inspect a game journal written by `python -m src.main --journal FILE`.
+
+Rebuilds the exact player state at any turn by re-running the recorded game
+and prints it, with the human card(s) as they were marked at that turn.
+
+Run:
+    python -m src.replay game.jnl               # state at the last durable turn
+    python -m src.replay game.jnl --turn 12
+    python -m src.replay game.jnl --watch 0.3   # spectator view, turn by turn
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import List, Optional
+
+from .game.engine import GameEngine, ReplayProvider
+from .game.journal import JournalError, JournalLog, read_journal, replay
+from .game.render import BoardView
+from .main import print_pretty_card
+
+
+def watch(log: JournalLog, turn: int, delay: float) -> GameEngine:
+    """Play the journal back up to `turn`, redrawing every card after each draw."""
+    engine = replay(log, 0)
+    inputs = log.inputs(turn)
+    engine.providers = {seat: ReplayProvider(inputs.get(seat, ())) for seat in engine.providers}
+    cards, titles, owners = [], [], []
+    for p in engine.players:
+        for k, card in enumerate(p.cards):
+            cards.append(card)
+            titles.append(p.name if len(p.cards) == 1 else f"{p.name} #{k + 1}")
+            owners.append(p)
+    view = BoardView(cards, titles=titles)
+    view.draw([p.marked for p in owners])
+    while engine.drawer.turn < turn and engine.step():
+        view.draw([p.marked for p in owners])
+        if delay > 0:
+            time.sleep(delay)
+    return engine
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay a Mini Bingo game journal to any turn.")
+    parser.add_argument("journal")
+    parser.add_argument("--turn", type=int, default=None, help="Turn to rebuild (default: last durable turn).")
+    parser.add_argument(
+        "--watch",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Show every card and play the game back turn by turn, pausing SECONDS between draws.",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        log = read_journal(args.journal)
+        if args.watch is not None:
+            engine = watch(log, log.durable_turns if args.turn is None else args.turn, args.watch)
+        else:
+            engine = replay(log, args.turn)
+    except (OSError, JournalError) as e:
+        print(f"error: {e}")
+        return 1
+
+    status = "finished" if log.ended else "unfinished"
+    print(f"Journal: {args.journal} ({status}, {log.durable_turns} durable turns, seed {log.header['seed']})")
+    print(f"State after turn {engine.drawer.turn}; drawn: {', '.join(map(str, engine.drawer.sequence()[:engine.drawer.turn])) or '-'}")
+    for p in engine.players:
+        tag = "(Bot)" if p.is_bot else "(You)"
+        flags = " ".join(f for f, on in (("LINE", p.has_line), ("BINGO", p.has_bingo)) if on)
+        print(f"  - {p.name:6s} {tag:5s} → {p.points} pts  {p.bingo_to_go()} to go  {flags}".rstrip())
+    for p in engine.players:
+        if not p.is_bot:
+            for card in p.cards:
+                print_pretty_card(card, p.marked, title=f"Card of {p.name} at turn {engine.drawer.turn}:")
+    if engine.winner is not None:
+        print(f"\nWinner: {engine.winner.name}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,444 @@
+# src/server.py
+"""
+Multi-room Mini Bingo server on one asyncio event loop.
+
+Each room wraps a NumberDrawer, the room's Players (humans + bots, indexed in a
+Hall) and the shared turn rules from game.rules. Rooms run as independent
+tasks, so one process hosts thousands of them.
+
+Line protocol (ASCII, one command per line):
+
+  client -> server
+    JOIN <room> <name> [<variant>]
+                         join (and create) a room; answered by WELCOME and CARD.
+                         <variant> picks the card geometry of a new room
+                         (default: --variant); joining an existing room with
+                         another variant is an error
+    START                start the room's game (any seated player may do it)
+    Y | N                answer for the current draw (once per draw)
+    L | B                claim a Line / Bingo
+    QUIT                 leave
+
+  server -> client (replies to the client's own commands)
+    WELCOME <room> <seat> <variant>
+    CARD <r1>;<r2>;<r3>  rows as comma-separated numbers
+    MARKED | OK | WRONG <delta> | MISSED <delta>
+    LINE <reward> | BINGO <reward> | FALSE <delta>
+    ERR <reason>
+
+  server -> room (broadcasts)
+    START <players> <pool_total>
+    DRAW <turn> <number> <unix_ns>   unix_ns = send time, for latency measurement
+    CLAIM <name> <L|B> <reward>
+    END <winner name or ->
+
+Every room plays one game.variants Variant, chosen by the JOIN that creates it
+(--variant, default "classic", when none is given), so rooms of different
+variants run side by side. In CARD, blank and free cells are sent as "-".
+
+With --ledger, every points movement of every room goes to one SQLite points
+ledger (game.ledger); rooms only append in memory, a writer thread does the I/O.
+
+Draws that a client does not answer cost nothing. A client that stops reading
+is disconnected once its broadcasts stay unsent for --drain-timeout seconds. Claims may be sent at any
+time during the game and are validated against the card's marks.
+
+Run:
+    python -m src.server --port 7777 --bots 4 --interval 1.0
+    python -m src.server --unix /tmp/bingo.sock
+    python -m src.server --variant 75-ball
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import random
+import time
+import uuid
+from typing import Dict, List, Optional, Set
+
+from .game import rules
+from .game.bingo_card import card_key
+from .game.hall import Hall
+from .game.ledger import PointsLedger, PointsStore
+from .game.number_draw import NumberDrawer
+from .game.player import Player
+from .game.variants import CLASSIC, VARIANTS, Variant, get_variant
+from .main import SETTINGS
+
+
+def format_card(card) -> str:
+    return ";".join(",".join("-" if v is None else str(v) for v in row) for row in card)
+
+
+class Room:
+    """
+    One bingo game with its connected clients.
+
+    Broadcasts are written to every client at once; run() then drains them
+    together and drops clients still stuck after drain_timeout seconds, so a
+    slow reader cannot grow the room's buffers without bound.
+    """
+
+    def __init__(
+        self,
+        room_id: str,
+        *,
+        bots: int = 0,
+        interval: float = 1.0,
+        starting_points: int = 100,
+        rng: Optional[random.Random] = None,
+        variant: Variant = CLASSIC,
+        store: Optional[PointsStore] = None,
+        drain_timeout: float = 5.0,
+    ) -> None:
+        self.room_id = room_id
+        self.variant = variant
+        self.ledger = PointsLedger(f"{room_id}:{uuid.uuid4().hex}", store)
+        self.interval = interval
+        self.drain_timeout = drain_timeout
+        self.starting_points = starting_points
+        self.rng = rng if rng is not None else random.Random()
+
+        self.players: List[Player] = []
+        self.hall = Hall()
+        self._keys: Set[int] = set()
+        self.writers: Dict[int, asyncio.StreamWriter] = {}
+
+        self.drawer = NumberDrawer(rng=self.rng, number_range=variant.number_range)
+        self.pool_total = 0
+        self.turn = 0
+        self.current: Optional[int] = None
+        self.answered: Set[int] = set()
+        self.started = False
+        self.finished = False
+        self.winner: Optional[Player] = None
+        self._wake = asyncio.Event()
+
+        for i in range(bots):
+            self._seat(f"Bot-{i+1}", is_bot=True)
+
+    # ---------- seating ----------
+    def _seat(self, name: str, *, is_bot: bool) -> int:
+        card = self.variant.generate_card(self.rng)
+        while card_key(card) in self._keys:  # no two seats share a card
+            card = self.variant.generate_card(self.rng)
+        self._keys.add(card_key(card))
+        player = Player(name=name, card=card, is_bot=is_bot, points=self.starting_points)
+        self.players.append(player)
+        self.hall.add_player(player)
+        return len(self.players) - 1
+
+    def join(self, name: str, writer: Optional[asyncio.StreamWriter] = None) -> int:
+        """Seat a human client. Returns the seat index."""
+        if self.started:
+            raise ValueError("game already started")
+        seat = self._seat(name, is_bot=False)
+        if writer is not None:
+            self.writers[seat] = writer
+        return seat
+
+    def leave(self, seat: int) -> None:
+        self.writers.pop(seat, None)
+
+    # ---------- output ----------
+    def send(self, seat: int, line: str) -> str:
+        """Send a line to one seat (if connected) and return it."""
+        writer = self.writers.get(seat)
+        if writer is not None and not writer.is_closing():
+            writer.write((line + "\n").encode())
+        return line
+
+    def broadcast(self, line: str) -> None:
+        data = (line + "\n").encode()
+        for writer in self.writers.values():
+            if not writer.is_closing():
+                writer.write(data)
+
+    async def drain(self) -> None:
+        """Wait until the clients took their data; disconnect those stuck for drain_timeout."""
+        pending = [
+            (seat, writer) for seat, writer in self.writers.items()
+            if not writer.is_closing() and writer.transport.get_write_buffer_size()
+        ]
+        if not pending:
+            return
+        results = await asyncio.gather(
+            *(asyncio.wait_for(writer.drain(), self.drain_timeout) for _, writer in pending),
+            return_exceptions=True,
+        )
+        for (seat, writer), result in zip(pending, results):
+            if isinstance(result, (asyncio.TimeoutError, ConnectionError)):
+                # abort() drops the unsent data; the client's handler then sees the disconnect.
+                self.writers.pop(seat, None)
+                writer.transport.abort()
+
+    # ---------- game flow ----------
+    def start(self) -> None:
+        self.started = True
+        self.pool_total = sum(p.points for p in self.players)
+        self.ledger.open_balances(self.players)
+        self.broadcast(f"START {len(self.players)} {self.pool_total}")
+
+    def finish(self, winner: Optional[Player]) -> None:
+        self.finished = True
+        self.winner = winner
+        self.ledger.end_turn()
+        self.broadcast(f"END {winner.name if winner else '-'}")
+        self._wake.set()
+
+    def step(self) -> bool:
+        """Draw one number, play the bots and broadcast. Returns False once the game is over."""
+        if self.finished:
+            return False
+        drawn = self.drawer.draw_next()
+        if drawn is None:
+            self.finish(None)
+            return False
+        self.turn += 1
+        self.current = drawn
+        self.answered.clear()
+        self.broadcast(f"DRAW {self.turn} {drawn} {time.time_ns()}")
+
+        bingo: Optional[Player] = None
+        for bot, claim in self.hall.dispatch(drawn):
+            reward = rules.award_bot_claim(bot, claim, self.pool_total)
+            if reward is None:
+                continue
+            self.ledger.record(bot.name, reward, "line" if claim == "L" else "bingo", self.turn)
+            self.broadcast(f"CLAIM {bot.name} {claim} {reward}")
+            if claim == "B" and bingo is None:
+                bingo = bot
+        self.ledger.end_turn()
+        if bingo is not None:
+            self.finish(bingo)
+            return False
+        return True
+
+    def handle(self, seat: int, command: str) -> str:
+        """
+        Apply one command from the client in `seat`.
+
+        The reply is sent to the seat before any broadcast it triggers
+        (START, CLAIM, END) and is also returned.
+        """
+        player = self.players[seat]
+        if command == "START":
+            if self.started:
+                return self.send(seat, "ERR already started")
+            self.send(seat, "OK")
+            self.start()
+            return "OK"
+        if not self.started or self.finished or self.current is None:
+            return self.send(seat, "ERR no draw in progress")
+
+        if command in ("Y", "N"):
+            if seat in self.answered:
+                return self.send(seat, "ERR already answered")
+            self.answered.add(seat)
+            outcome, delta = rules.resolve_answer(player, self.current, command == "Y")
+            if delta:
+                self.ledger.record(player.name, delta, outcome, self.turn)
+            return self.send(seat, {
+                rules.MARKED: "MARKED",
+                rules.CORRECT_NO: "OK",
+                rules.NOT_ON_CARD: f"WRONG {delta}",
+                rules.MISSED: f"MISSED {delta}",
+            }[outcome])
+
+        if command in ("L", "B"):
+            outcome, delta = rules.resolve_claim(player, command, self.pool_total)
+            if delta:
+                self.ledger.record(player.name, delta, outcome, self.turn)
+            if outcome in (rules.FALSE_LINE, rules.FALSE_BINGO):
+                return self.send(seat, f"FALSE {delta}")
+            reply = self.send(seat, f"{outcome.upper()} {delta}")
+            self.broadcast(f"CLAIM {player.name} {command} {delta}")
+            if outcome == rules.BINGO:
+                self.finish(player)
+            return reply
+
+        return self.send(seat, "ERR unknown command")
+
+    async def run(self) -> None:
+        """Draw every `interval` seconds until someone completes bingo or the pool ends."""
+        while True:
+            more = self.step()
+            await self.drain()
+            if not more:
+                break
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+class BingoServer:
+    """Accepts clients and routes them to their rooms."""
+
+    def __init__(
+        self,
+        *,
+        bots: int = 0,
+        interval: float = 1.0,
+        starting_points: int = 100,
+        seed: Optional[int] = None,
+        variant: Variant = CLASSIC,
+        ledger_path: Optional[str] = None,
+        drain_timeout: float = 5.0,
+    ) -> None:
+        self.bots = bots
+        self.drain_timeout = drain_timeout
+        self.variant = variant
+        self.store = PointsStore(ledger_path) if ledger_path else None
+        self.interval = interval
+        self.starting_points = starting_points
+        self._seeder = random.Random(seed)
+        self.rooms: Dict[str, Room] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def room(self, room_id: str, variant: Optional[Variant] = None) -> Room:
+        """
+        The live room `room_id`, created with `variant` (default: the server's) if needed.
+
+        Raises:
+            ValueError: If the room exists and plays another variant.
+        """
+        room = self.rooms.get(room_id)
+        if room is not None and not room.finished:
+            if variant is not None and variant is not room.variant:
+                raise ValueError(f"room {room_id} plays {room.variant.name}")
+        else:
+            room = Room(
+                room_id,
+                bots=self.bots,
+                interval=self.interval,
+                starting_points=self.starting_points,
+                rng=random.Random(self._seeder.getrandbits(64)),
+                variant=variant or self.variant,
+                store=self.store,
+                drain_timeout=self.drain_timeout,
+            )
+            self.rooms[room_id] = room
+        return room
+
+    def _start_room(self, room: Room) -> None:
+        task = asyncio.create_task(room.run())
+        self._tasks.add(task)
+        task.add_done_callback(functools.partial(self._room_done, room))
+
+    def _room_done(self, room: Room, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if self.rooms.get(room.room_id) is room:
+            del self.rooms[room.room_id]
+
+    def _leave(self, room: Room, seat: int) -> None:
+        """Unseat a client; a room left without clients before START is removed."""
+        room.leave(seat)
+        if not room.started and not room.writers and self.rooms.get(room.room_id) is room:
+            del self.rooms[room.room_id]
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        room: Optional[Room] = None
+        seat = -1
+
+        def reply(line: str) -> None:
+            writer.write((line + "\n").encode())
+
+        try:
+            while True:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                parts = raw.decode(errors="replace").split()
+                if not parts:
+                    continue
+                command = parts[0].upper()
+
+                if command == "QUIT":
+                    break
+                if command == "JOIN":
+                    if room is not None:
+                        reply("ERR already joined")
+                    elif len(parts) not in (3, 4):
+                        reply("ERR usage: JOIN <room> <name> [<variant>]")
+                    else:
+                        try:
+                            variant = get_variant(parts[3]) if len(parts) == 4 else None
+                            candidate = self.room(parts[1], variant)
+                            seat = candidate.join(parts[2], writer)
+                        except ValueError as e:
+                            reply(f"ERR {e}")
+                        else:
+                            room = candidate
+                            reply(f"WELCOME {room.room_id} {seat} {room.variant.name}")
+                            reply(f"CARD {format_card(room.players[seat].card)}")
+                elif room is None:
+                    reply("ERR join a room first")
+                else:
+                    was_started = room.started
+                    room.handle(seat, command)
+                    if room.started and not was_started:
+                        self._start_room(room)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            if room is not None:
+                self._leave(room, seat)
+            writer.close()
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.handle_client, host, port)
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        return await asyncio.start_unix_server(self.handle_client, path)
+
+
+async def serve(args: argparse.Namespace) -> None:
+    server = BingoServer(
+        bots=args.bots,
+        interval=args.interval,
+        starting_points=int(SETTINGS["starting_points_per_player"]),
+        seed=args.seed,
+        variant=get_variant(args.variant),
+        ledger_path=args.ledger,
+        drain_timeout=args.drain_timeout,
+    )
+    if args.unix:
+        srv = await server.start_unix(args.unix)
+        print(f"Bingo server listening on {args.unix}")
+    else:
+        srv = await server.start_tcp(args.host, args.port)
+        host, port = srv.sockets[0].getsockname()[:2]
+        print(f"Bingo server listening on {host}:{port}")
+    try:
+        async with srv:
+            await srv.serve_forever()
+    finally:
+        if server.store is not None:
+            server.store.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Multi-room Mini Bingo server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--unix", default=None, help="Listen on this Unix socket path instead of TCP.")
+    parser.add_argument("--bots", type=int, default=int(SETTINGS["bots_easy"]), help="Bots per room.")
+    parser.add_argument("--interval", type=float, default=1.0, help="Seconds between draws.")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--drain-timeout", type=float, default=5.0, help="Seconds a client may lag before it is dropped.")
+    parser.add_argument("--ledger", default=None, help="Record all points movements in this SQLite database.")
+    parser.add_argument("--variant", choices=sorted(VARIANTS), default=CLASSIC.name, help="Card geometry of rooms whose JOIN names none.")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
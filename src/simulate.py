@@ -0,0 +1,298 @@
+# src/simulate.py
+"""
+Headless Monte Carlo simulator for line/bingo timing and payouts.
+
+Plays many all-bot games with the real game pieces (complete_card, NumberDrawer,
+Hall/Player win checks), spread over a process pool, and reports:
+- distribution of the first-line and bingo turns
+- tie rates (several players completing on the same winning turn)
+- expected points paid out per game under the line/bingo percentages
+
+Games are split into fixed-size chunks, each with its own seed derived from
+--seed, and every game draws from its own rng_stream(chunk seed, game), so
+results do not depend on the number of workers.
+
+--exact prints the same report computed analytically (game.odds) instead, in
+milliseconds; --check runs both and prints them side by side.
+
+Run:
+    python -m src.simulate --games 100000 --mode hard
+    python -m src.simulate --exact --mode hard
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .game import odds
+from .game.bingo_card import complete_card
+from .game.hall import Hall
+from .game.number_draw import NumberDrawer
+from .game.player import Player
+from .game.rng import rng_stream
+from .main import SETTINGS
+
+MODES = {"easy": "bots_easy", "medium": "bots_medium", "hard": "bots_hard"}
+
+
+@dataclass
+class SimStats:
+    """Aggregated results; chunks are merged with `merge`."""
+
+    games: int = 0
+    line_turns: Counter = field(default_factory=Counter)
+    bingo_turns: Counter = field(default_factory=Counter)
+    line_ties: int = 0
+    bingo_ties: int = 0
+    line_awards: int = 0
+    bingo_awards: int = 0
+
+    def merge(self, other: "SimStats") -> None:
+        self.games += other.games
+        self.line_turns.update(other.line_turns)
+        self.bingo_turns.update(other.bingo_turns)
+        self.line_ties += other.line_ties
+        self.bingo_ties += other.bingo_ties
+        self.line_awards += other.line_awards
+        self.bingo_awards += other.bingo_awards
+
+
+def play_bot_game(n_players: int, rng: Optional[random.Random] = None) -> Tuple[int, int, int, int, int]:
+    """
+    Play one all-bot game with the same award rules as play_game.
+    Cards and draws come from `rng` (global `random` if omitted).
+
+    Returns:
+        (first_line_turn, first_line_claims, bingo_turn, bingo_claims, line_awards)
+        Turns are 0 when not reached.
+    """
+    players = [Player(name=f"Bot-{i+1}", card=complete_card(rng), is_bot=True) for i in range(n_players)]
+    hall = Hall(players)
+    drawer = NumberDrawer(rng=rng)
+
+    line_turn = line_claims = line_awards = 0
+    turn = 0
+    while True:
+        drawn = drawer.draw_next()
+        if drawn is None:
+            return line_turn, line_claims, 0, 0, line_awards
+        turn += 1
+
+        lines = bingos = 0
+        for bot, claim in hall.dispatch(drawn):
+            if claim == "L":
+                bot.has_line = True
+                lines += 1
+            elif claim == "B":
+                bot.has_bingo = True
+                bingos += 1
+
+        if lines:
+            line_awards += lines
+            if not line_turn:
+                line_turn, line_claims = turn, lines
+        if bingos:
+            return line_turn, line_claims, turn, bingos, line_awards
+
+
+def run_chunk(args: Tuple[int, int, int]) -> SimStats:
+    """Worker entry point: play `games` games of `n_players` from one seed."""
+    seed, games, n_players = args
+    stats = SimStats(games=games)
+    for g in range(games):
+        line_turn, line_claims, bingo_turn, bingo_claims, line_awards = play_bot_game(
+            n_players, rng_stream(seed, g)
+        )
+        stats.line_turns[line_turn] += 1
+        stats.bingo_turns[bingo_turn] += 1
+        stats.line_ties += line_claims > 1
+        stats.bingo_ties += bingo_claims > 1
+        stats.line_awards += line_awards
+        stats.bingo_awards += bingo_claims
+    return stats
+
+
+def chunk_plan(games: int, n_players: int, seed: int, chunk: int) -> List[Tuple[int, int, int]]:
+    """Split the run into (seed, games, players) chunks with deterministic seeds."""
+    seeder = random.Random(seed)
+    plan = []
+    for start in range(0, games, chunk):
+        plan.append((seeder.getrandbits(64), min(chunk, games - start), n_players))
+    return plan
+
+
+def run_simulation(
+    games: int,
+    n_players: int,
+    *,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    chunk: int = 500,
+) -> SimStats:
+    """Play `games` games across `workers` processes (1 = in-process)."""
+    plan = chunk_plan(games, n_players, seed, chunk)
+    total = SimStats()
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        results = map(run_chunk, plan)
+        for s in results:
+            total.merge(s)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for s in pool.map(run_chunk, plan):
+                total.merge(s)
+    return total
+
+
+def percentile(hist: Counter, q: float) -> int:
+    """q-th percentile (0..1) of a turn histogram, ignoring unreached (0) entries."""
+    items = sorted((t, c) for t, c in hist.items() if t)
+    total = sum(c for _, c in items)
+    if not total:
+        return 0
+    need = q * total
+    seen = 0
+    for t, c in items:
+        seen += c
+        if seen >= need:
+            return t
+    return items[-1][0]
+
+
+def summarize(
+    stats: SimStats,
+    n_players: int,
+    *,
+    line_percent: float,
+    bingo_percent: float,
+    starting_points: int,
+) -> Dict[str, object]:
+    """Turn raw stats into a report dict (JSON-friendly)."""
+    pool_total = starting_points * n_players
+    line_reward = int(pool_total * line_percent)
+    bingo_reward = int(pool_total * bingo_percent)
+    games = max(stats.games, 1)
+
+    def dist(hist: Counter) -> Dict[str, object]:
+        reached = {t: c for t, c in hist.items() if t}
+        n = sum(reached.values())
+        mean = sum(t * c for t, c in reached.items()) / n if n else 0.0
+        return {
+            "mean": round(mean, 3),
+            "p50": percentile(hist, 0.50),
+            "p90": percentile(hist, 0.90),
+            "p99": percentile(hist, 0.99),
+            "histogram": {str(t): c for t, c in sorted(reached.items())},
+        }
+
+    payout = stats.line_awards * line_reward + stats.bingo_awards * bingo_reward
+    return {
+        "games": stats.games,
+        "players": n_players,
+        "pool_total": pool_total,
+        "line_turn": dist(stats.line_turns),
+        "bingo_turn": dist(stats.bingo_turns),
+        "line_tie_rate": stats.line_ties / games,
+        "bingo_tie_rate": stats.bingo_ties / games,
+        "line_awards_per_game": stats.line_awards / games,
+        "bingo_awards_per_game": stats.bingo_awards / games,
+        "expected_payout": payout / games,
+        "expected_payout_pct_of_pool": payout / games / pool_total if pool_total else 0.0,
+    }
+
+
+CHECKED = (
+    ("line_turn", "mean"),
+    ("bingo_turn", "mean"),
+    ("line_tie_rate", None),
+    ("bingo_tie_rate", None),
+    ("line_awards_per_game", None),
+    ("bingo_awards_per_game", None),
+    ("expected_payout", None),
+)
+
+
+def cross_check(simulated: Dict[str, object], exact: Dict[str, object]) -> Dict[str, Tuple[float, float]]:
+    """Headline figures of a simulated and an exact report: name -> (exact, simulated)."""
+    out = {}
+    for key, sub in CHECKED:
+        a, b = exact[key], simulated[key]
+        if sub is not None:
+            a, b = a[sub], b[sub]
+        out[key if sub is None else f"{key}.{sub}"] = (float(a), float(b))
+    return out
+
+
+def print_check(check: Dict[str, Tuple[float, float]]) -> None:
+    print(f"\n{'':28s} {'exact':>10s} {'simulated':>10s}")
+    for name, (a, b) in check.items():
+        print(f"{name:28s} {a:10.4f} {b:10.4f}")
+
+
+def print_report(report: Dict[str, object]) -> None:
+    games = report["games"] if report["games"] is not None else "exact"
+    print(f"\nGames: {games}   Players: {report['players']}   Pool: {report['pool_total']}")
+    for key, label in (("line_turn", "First line"), ("bingo_turn", "Bingo")):
+        d = report[key]
+        print(f"{label:10s} turn → mean {d['mean']:.2f}  p50 {d['p50']}  p90 {d['p90']}  p99 {d['p99']}")
+    print(f"Tie rate   → line {report['line_tie_rate']:.2%}  bingo {report['bingo_tie_rate']:.2%}")
+    print(
+        f"Awards/game → lines {report['line_awards_per_game']:.2f}  "
+        f"bingos {report['bingo_awards_per_game']:.2f}"
+    )
+    print(
+        f"Expected payout/game → {report['expected_payout']:.1f} pts "
+        f"({report['expected_payout_pct_of_pool']:.1%} of pool)"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Monte Carlo simulation of Mini Bingo games.")
+    parser.add_argument("--games", type=int, default=10_000)
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--mode", choices=sorted(MODES), default="easy",
+                       help="Players = 1 + bots of this mode (default: easy).")
+    group.add_argument("--players", type=int, help="Explicit number of players.")
+    parser.add_argument("--workers", type=int, default=None, help="Processes (default: all cores).")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk", type=int, default=500, help="Games per work item.")
+    parser.add_argument("--line-percent", type=float, default=float(SETTINGS["line_percent"]))
+    parser.add_argument("--bingo-percent", type=float, default=float(SETTINGS["bingo_percent"]))
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+    how = parser.add_mutually_exclusive_group()
+    how.add_argument("--exact", action="store_true", help="Compute the report analytically instead of simulating.")
+    how.add_argument("--check", action="store_true", help="Simulate and compare against the exact figures.")
+    args = parser.parse_args(argv)
+
+    n_players = args.players or 1 + int(SETTINGS[MODES[args.mode]])
+    pricing = dict(
+        line_percent=args.line_percent,
+        bingo_percent=args.bingo_percent,
+        starting_points=int(SETTINGS["starting_points_per_player"]),
+    )
+    if args.exact:
+        report = odds.exact_report(n_players, **pricing)
+    else:
+        stats = run_simulation(args.games, n_players, seed=args.seed, workers=args.workers, chunk=args.chunk)
+        report = summarize(stats, n_players, **pricing)
+    if args.check:
+        check = cross_check(report, odds.exact_report(n_players, **pricing))
+        if args.json:
+            print(json.dumps(check, indent=2))
+        else:
+            print_check(check)
+    elif args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
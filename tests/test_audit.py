@@ -0,0 +1,68 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.audit import main
+from src.game.audit import audit_bank, audit_cards, lsh_banding, lsh_recall
+from src.game.batch import cards_to_array, random_cards
+from src.game.bingo_card import card_mask, complete_card, generate_cards
+from src.game.card_bank import CardBank, write_card_bank
+
+
+def test_identical_and_shared_rows():
+    rng = random.Random(3)
+    cards = [complete_card(rng=rng) for _ in range(200)]
+    cards[50] = [cards[10][2], cards[10][0], cards[10][1]]   # same numbers, rows moved
+    cards[60] = [cards[20][0], cards[61][1], cards[61][2]]   # one row copied
+    report = audit_cards(cards_to_array(cards))
+    assert [g.tolist() for g in report.identical] == [[10, 50]]
+    assert [20, 0, 60, 0] in report.shared_rows.tolist()
+    assert [10, 2, 50, 0] in report.shared_rows.tolist()
+    assert not report.ok
+
+
+def test_overlaps_match_brute_force():
+    cards = random_cards(1500, np.random.default_rng(5))
+    masks = [card_mask(c.tolist()) for c in cards]
+    brute = {
+        (i, j)
+        for i in range(len(masks))
+        for j in range(i + 1, len(masks))
+        if (masks[i] & masks[j]).bit_count() >= 8
+    }
+    report = audit_cards(cards, min_shared=8, bands=400, rows_per_band=2)
+    found = {(a, b) for a, b, _ in report.overlaps.tolist()}
+    assert found == brute
+    assert all((masks[a] & masks[b]).bit_count() == s for a, b, s in report.overlaps.tolist())
+
+
+def test_near_duplicate_found_with_defaults():
+    cards = random_cards(5000, np.random.default_rng(1))
+    near = cards[4].ravel().copy()
+    near[0] = next(v for v in range(1, 91) if v not in near)
+    cards[4000] = near.reshape(3, 5)
+    report = audit_cards(cards)
+    assert [4, 4000, 14] in report.overlaps.tolist()
+    assert lsh_recall(14) > 0.999
+    for shared in (5, 8, 13):
+        bands, rows_per_band = lsh_banding(shared)
+        assert bands <= 1024 and lsh_recall(shared, bands=bands, rows_per_band=rows_per_band) >= 0.999
+
+
+def test_audit_bank_and_cli(tmp_path, capsys):
+    cards = generate_cards(300, rng=random.Random(8))
+    path = str(tmp_path / "cards.bnk")
+    write_card_bank(path, cards)
+    with CardBank(path) as bank:
+        assert audit_bank(bank).summary()["identical_groups"] == 0
+    write_card_bank(path, cards + [cards[0]])
+    assert main(["--bank", path]) == 1
+    assert "identical: cards 0, 300" in capsys.readouterr().out
+
+
+def test_rejects_bad_input():
+    with pytest.raises(ValueError):
+        audit_cards(np.zeros((2, 15), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        audit_cards(np.full((1, 3, 5), 200, dtype=np.uint8))
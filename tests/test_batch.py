@@ -0,0 +1,43 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.game.batch import NEVER, cards_to_array, random_cards, resolve_batch
+from src.game.bingo_card import complete_card, NUMBER_RANGE
+from src.game.number_draw import NumberDrawer
+from src.game.player import Player
+
+def test_matches_player_checks():
+    cards = [complete_card() for _ in range(50)]
+    draws = NumberDrawer(seed=7).sequence()
+    result = resolve_batch(cards_to_array(cards), draws)
+
+    for i, card in enumerate(cards):
+        p = Player("P", card)
+        line = bingo = NEVER
+        for turn, n in enumerate(draws, start=1):
+            p.mark_number(n)
+            if line == NEVER and p.check_line():
+                line = turn
+            if p.check_bingo():
+                bingo = turn
+                break
+        assert result.line_turns[i] == line
+        assert result.bingo_turns[i] == bingo
+
+def test_winners_and_ties():
+    card = [[1,2,3,4,5],[6,7,8,9,10],[11,12,13,14,15]]
+    other = [[16,17,18,19,20],[21,22,23,24,25],[26,27,28,29,30]]
+    result = resolve_batch(cards_to_array([card, other, card]), list(range(1, 16)))
+    assert result.line_turn == 5
+    assert result.bingo_turn == 15
+    assert list(result.bingo_winners) == [0, 2]
+    assert result.bingo_turns[1] == NEVER
+    assert list(result.line_groups()[5]) == [0, 2]
+
+def test_random_cards_valid():
+    low, high = NUMBER_RANGE
+    cards = random_cards(100, np.random.default_rng(1))
+    flat = cards.reshape(100, -1)
+    assert flat.min() >= low and flat.max() <= high
+    assert all(len(set(row)) == 15 for row in flat.tolist())
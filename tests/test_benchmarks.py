@@ -0,0 +1,18 @@
+import json
+from pathlib import Path
+
+from benchmarks.run import DEFAULT_SIZES, compare, game_benchmark
+
+def test_compare_flags_only_real_regressions():
+    baseline = {"a": 1.0, "b": 1.0, "c": 1.0}
+    results = {"a": 1.1, "b": 1.5, "d": 9.0}
+    regressions = compare(results, baseline, threshold=0.2)
+    assert len(regressions) == 1 and regressions[0].startswith("b:")
+
+def test_game_benchmark_runs():
+    assert game_benchmark(5, repeat=1) > 0
+
+def test_committed_baseline_covers_the_defaults():
+    results = json.loads((Path(__file__).parent.parent / "benchmarks" / "baseline.json").read_text())["results"]
+    assert {f"game[{n}]" for n in DEFAULT_SIZES} <= set(results)
+    assert "Player.mark_number" in results and all(v > 0 for v in results.values())
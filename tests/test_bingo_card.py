@@ -1,4 +1,11 @@
-from src.game.bingo_card import complete_card, BOARD_ROWS, BOARD_COLS, NUMBER_RANGE
+import random
+from itertools import combinations
+
+import pytest
+
+from src.game.bingo_card import (
+    complete_card, generate_cards, card_key, derive_card, verify_card, BOARD_ROWS, BOARD_COLS, NUMBER_RANGE,
+)
 
 def test_complete_card_dimensions():
     card = complete_card()
@@ -16,3 +23,36 @@ def test_complete_card_range():
     for row in card:
         for n in row:
             assert low <= n <= high
+
+def test_complete_card_reproducible_with_rng():
+    assert complete_card(random.Random(9)) == complete_card(random.Random(9))
+
+def test_generate_cards_unique():
+    cards = generate_cards(500, rng=random.Random(1))
+    assert len(cards) == 500
+    assert len({card_key(c) for c in cards}) == 500
+    for card in cards[:20]:
+        assert len(card) == BOARD_ROWS and all(len(row) == BOARD_COLS for row in card)
+
+def test_generate_cards_max_overlap():
+    pytest.importorskip("numpy")
+    # Batched path (>= BATCH_MIN cards): no duplicates and the cap holds for every pair.
+    cards = generate_cards(300, rng=random.Random(2), max_overlap=7)
+    keys = [card_key(c) for c in cards]
+    low, high = NUMBER_RANGE
+    assert len(cards) == 300 and len(set(keys)) == 300
+    assert all(low <= n <= high for c in cards for row in c for n in row)
+    assert max((a & b).bit_count() for a, b in combinations(keys, 2)) <= 7
+    # Without the cap, 300 independent cards do have pairs above it.
+    free = [card_key(c) for c in generate_cards(300, rng=random.Random(2))]
+    assert max((a & b).bit_count() for a, b in combinations(free, 2)) > 7
+
+def test_derive_and_verify_card():
+    card = derive_card(2024, 123456789)
+    assert card == derive_card(2024, 123456789)
+    assert card != derive_card(2024, 123456790)
+    assert verify_card(card, 2024, 123456789)
+    assert not verify_card(card, 2024, 1)
+    tampered = [row[:] for row in card]
+    tampered[0][0], tampered[0][1] = tampered[0][1], tampered[0][0]
+    assert not verify_card(tampered, 2024, 123456789)
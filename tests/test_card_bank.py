@@ -0,0 +1,38 @@
+import random
+
+from src.game.bingo_card import generate_cards
+from src.game.card_bank import CardBank, write_card_bank
+from src.game.hall import Hall
+from src.game.player import Player
+
+def test_roundtrip(tmp_path):
+    cards = generate_cards(50, rng=random.Random(3))
+    path = str(tmp_path / "cards.bank")
+    assert write_card_bank(path, cards) == 50
+    bank = CardBank(path)
+    assert len(bank) == 50
+    assert bank[7].tolist() == cards[7]
+    assert bank[7][2][4] == cards[7][2][4]
+
+def test_views_work_with_player(tmp_path):
+    cards = generate_cards(3, rng=random.Random(4))
+    path = str(tmp_path / "cards.bank")
+    write_card_bank(path, cards)
+    bank = CardBank(path)
+    p = Player("P", bank[1], is_bot=True)
+    hall = Hall([p])
+    for n in cards[1][0]:
+        hall.dispatch(n)
+    assert p.check_line() is True
+    assert p.marked == set(cards[1][0])
+
+def test_close_with_live_views(tmp_path):
+    cards = generate_cards(3, rng=random.Random(5))
+    path = str(tmp_path / "cards.bank")
+    write_card_bank(path, cards)
+    with CardBank(path) as bank:
+        p = Player("P", bank[2])
+        array = bank.as_array()
+    # The player's view and the array outlive the bank and still read the file.
+    assert p.card.tolist() == cards[2] and p.has_number(cards[2][0][0])
+    assert array[2].tolist() == cards[2]
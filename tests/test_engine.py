@@ -0,0 +1,45 @@
+import random
+
+from src.game import rules
+from src.game.bingo_card import generate_cards
+from src.game.engine import GameEngine, ListSink, ReplayProvider, ScriptedProvider
+from src.game.number_draw import NumberDrawer
+from src.game.player import Player
+
+def _players(n_bots, seed):
+    cards = generate_cards(n_bots + 1, rng=random.Random(seed))
+    human = Player("You", cards[0], points=100)
+    return [human] + [Player(f"Bot-{i}", c, is_bot=True, points=100) for i, c in enumerate(cards[1:])]
+
+def test_scripted_game_runs_to_the_end():
+    players = _players(4, 1)
+    sink = ListSink()
+    engine = GameEngine(players, NumberDrawer(seed=1), providers={0: ScriptedProvider()}, sink=sink)
+    winner = engine.run()
+    assert winner is not None and winner.has_bingo
+    assert sink.events[-1].kind == "game_over"
+    answers = [e for e in sink.events if e.kind == "answer"]
+    assert all(e.outcome in (rules.MARKED, rules.CORRECT_NO) for e in answers)
+    assert players[0].points >= 100
+
+def test_replay_provider_penalties():
+    players = _players(0, 2)
+    sink = ListSink()
+    engine = GameEngine(players, NumberDrawer(seed=2), providers={0: ReplayProvider(["?", "Y", "x"])}, sink=sink)
+    engine.step()
+    engine.step()
+    kinds = [e.kind for e in sink.events]
+    assert kinds.count("invalid_answer") == 1
+    assert "invalid_claim" in kinds
+    assert players[0].points < 100
+
+def test_precomputed_bots_same_result():
+    a = GameEngine(_players(9, 3), NumberDrawer(seed=3), providers={0: ScriptedProvider()})
+    b = GameEngine(_players(9, 3), NumberDrawer(seed=3), providers={0: ScriptedProvider()}, precompute_bots=True)
+    assert a.run().name == b.run().name
+    assert [p.points for p in a.players] == [p.points for p in b.players]
+
+def test_missing_provider_rejected():
+    import pytest
+    with pytest.raises(ValueError):
+        GameEngine(_players(1, 4), NumberDrawer(seed=4))
@@ -0,0 +1,31 @@
+from src.game.hall import Hall
+from src.game.player import Player
+
+CARD_A = [
+    [1,2,3,4,5],
+    [10,11,12,13,14],
+    [20,21,22,23,24],
+]
+CARD_B = [
+    [1,30,31,32,33],
+    [40,41,42,43,44],
+    [50,51,52,53,54],
+]
+
+def test_index_hits_only_holders():
+    a = Player("A", CARD_A, is_bot=True)
+    b = Player("B", CARD_B, is_bot=True)
+    hall = Hall([a, b])
+    assert hall.hits(1) == [(a, 0), (b, 0)]
+    assert hall.hits(40) == [(b, 1)]
+    assert hall.hits(89) == []
+
+def test_dispatch_matches_bot_play_turn():
+    human = Player("You", CARD_B, is_bot=False)
+    bot = Player("A", CARD_A, is_bot=True)
+    hall = Hall([human, bot])
+    for n in [1,2,3,4]:
+        assert hall.dispatch(n) == []
+    assert hall.dispatch(5) == [(bot, "L")]
+    assert human.marked == set()
+    assert bot.marked == {1,2,3,4,5}
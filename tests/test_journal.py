@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from src.game.bingo_card import generate_cards
+from src.game.engine import GameEngine, ReplayProvider
+from src.game.journal import GameJournal, JournalError, read_journal, replay, resume
+from src.game.number_draw import NumberDrawer
+from src.game.player import Player
+
+INPUTS = ["Y", "N", "?", "Y", "L", "N", "Y", "B", "N", "N", "Y", "N"] * 20
+
+def _engine(journal=None, inputs=INPUTS):
+    cards = generate_cards(5, rng=random.Random(8))
+    players = [Player("You", cards[0], points=100)] + [
+        Player(f"Bot-{i}", c, is_bot=True, points=100) for i, c in enumerate(cards[1:])
+    ]
+    return GameEngine(players, NumberDrawer(seed=2), providers={0: ReplayProvider(inputs)}, journal=journal)
+
+def _state(engine):
+    return [(p.points, p.marked, p.has_line, p.has_bingo) for p in engine.players]
+
+def test_replay_rebuilds_every_turn(tmp_path):
+    path = str(tmp_path / "g.jnl")
+    live = _engine(GameJournal(path, seed=2, sync_every=4))
+    states = [_state(live)]
+    while live.step():
+        states.append(_state(live))
+    states.append(_state(live))
+    live.journal.close()
+
+    log = read_journal(path)
+    assert log.ended and log.durable_turns == live.drawer.turn
+    for turn in (0, 1, 7, log.durable_turns):
+        assert _state(replay(log, turn)) == states[turn]
+    with pytest.raises(JournalError):
+        replay(log, log.durable_turns + 1)
+
+def test_resume_after_torn_write(tmp_path):
+    path = str(tmp_path / "g.jnl")
+    full = _engine()
+    full.run()
+
+    crashed = _engine(GameJournal(path, sync_every=3))
+    for _ in range(9):
+        crashed.step()
+    crashed.journal._f.flush()
+    with open(path, "ab") as f:
+        f.write(b"\x40\x00\x00\x00\x03partial")  # half a record, as after a crash
+    crashed.journal._f.close()
+
+    assert read_journal(path).durable_turns == 9
+    consumed = len(read_journal(path).inputs(9)[0])
+    resumed = resume(path, {0: ReplayProvider(INPUTS[consumed:])})
+    resumed.run()
+    resumed.journal.close()
+    assert _state(resumed) == _state(full)
+    assert read_journal(path).ended
+    with pytest.raises(JournalError):
+        resume(path, {0: ReplayProvider([])})
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "x.jnl"
+    path.write_bytes(b"not a journal")
+    with pytest.raises(JournalError):
+        read_journal(str(path))
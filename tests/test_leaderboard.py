@@ -0,0 +1,55 @@
+import random
+
+from src.game.bingo_card import generate_cards
+from src.game.engine import GameEngine, ScriptedProvider
+from src.game.leaderboard import BINGO, LINE, Leaderboard
+from src.game.number_draw import NumberDrawer
+from src.game.player import Player
+
+CARD = [
+    [1,2,3,4,5],
+    [6,7,8,9,10],
+    [11,12,13,14,15],
+]
+
+def test_player_to_go_counters():
+    p = Player("P", CARD)
+    assert (p.line_to_go(), p.bingo_to_go()) == (5, 15)
+    for n in [1,2,3,4,4,6]:
+        p.mark_number(n)
+    assert p.row_to_go(0) == 1
+    assert (p.line_to_go(), p.bingo_to_go()) == (1, 10)
+    p.marked = {11}
+    assert (p.row_to_go(0), p.row_to_go(2)) == (5, 4)
+
+def test_buckets_follow_marks():
+    a, b = Player("A", CARD), Player("B", [[r + 20 for r in row] for row in CARD])
+    lb = Leaderboard([a, b])
+    for n in [1,2,3,4]:
+        a.mark_number(n)
+    lb.update(a)
+    assert lb.one_away(LINE) == [a]
+    assert lb.closest(BINGO, 2) == [(a, 11), (b, 15)]
+    assert lb.count(BINGO, 15) == 1
+
+def test_ties_come_out_in_arrival_order():
+    a, b = Player("A", CARD), Player("B", [[r + 20 for r in row] for row in CARD])
+    lb = Leaderboard([a, b])
+    assert lb.closest(BINGO) == [(a, 15), (b, 15)]
+    for p, n in ((b, 21), (a, 1)):
+        p.mark_number(n)
+        lb.update(p)
+    assert lb.closest(BINGO) == [(b, 14), (a, 14)]
+
+def test_engine_keeps_hall_leaderboard_exact():
+    cards = generate_cards(30, rng=random.Random(5))
+    players = [Player("You", cards[0])] + [Player(f"Bot-{i}", c, is_bot=True) for i, c in enumerate(cards[1:])]
+    engine = GameEngine(players, NumberDrawer(seed=5), providers={0: ScriptedProvider()}, leaderboard=True)
+    lb = engine.hall.leaderboard
+    for _ in range(40):
+        if not engine.step():
+            break
+        for kind, to_go in ((LINE, Player.line_to_go), (BINGO, Player.bingo_to_go)):
+            top = lb.closest(kind, 5)
+            expected = sorted(to_go(p) for p in players)[:5]
+            assert [n for _, n in top] == expected
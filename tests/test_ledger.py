@@ -0,0 +1,98 @@
+import random
+import sqlite3
+
+import pytest
+
+from src.game.bingo_card import generate_cards
+from src.game.engine import GameEngine, ScriptedProvider
+from src.game.ledger import OPENING, LedgerSink, PointsLedger, PointsStore
+from src.game.number_draw import NumberDrawer
+from src.game.player import Player
+from src.main import play_game
+from src.server import Room
+
+def test_engine_game_reconciles_and_persists(tmp_path):
+    cards = generate_cards(6, rng=random.Random(3))
+    players = [Player("You", cards[0], points=100)] + [
+        Player(f"Bot-{i}", c, is_bot=True, points=100) for i, c in enumerate(cards[1:])
+    ]
+    with PointsStore(str(tmp_path / "points.db")) as store:
+        ledger = PointsLedger("g1", store, batch_size=4)
+        ledger.open_balances(players)
+        engine = GameEngine(players, NumberDrawer(seed=3), sink=LedgerSink(ledger),
+                            providers={0: ScriptedProvider(0.2, random.Random(1))})
+        engine.run()
+        ledger.close()
+
+        report = ledger.reconcile(engine.pool_total, players)
+        assert report["ok"] and report["opening_total"] == 600
+        assert store.balances("g1") == {p.name: p.points for p in players}
+        assert store.balance("You") == players[0].points
+        rows = store.entries("g1")
+        assert [r[1] for r in rows] == list(range(len(ledger.entries)))
+        assert rows[0][4] == OPENING
+
+def test_reconcile_reports_mismatch():
+    p = Player("P", [[1,2,3,4,5],[6,7,8,9,10],[11,12,13,14,15]], points=100)
+    ledger = PointsLedger("g")
+    ledger.open_balances([p])
+    p.penalize_wrong_number()  # not recorded
+    report = ledger.reconcile(100, [p])
+    assert not report["ok"] and report["mismatches"] == {"P": {"ledger": 100, "points": 99}}
+
+def test_record_never_waits_for_sqlite(tmp_path):
+    path = str(tmp_path / "bulk.db")
+    with PointsStore(path) as store:
+        ledgers = [PointsLedger(f"room-{i}", store) for i in range(20)]
+        # Hold the write lock: a record() that wrote to SQLite itself would block here.
+        lock = sqlite3.connect(path, isolation_level=None)
+        lock.execute("BEGIN IMMEDIATE")
+        try:
+            for k in range(20_000):
+                ledgers[k % 20].record(f"P{k % 7}", 1, "line", k)
+            assert store.balances("room-0") == {}  # queued, nothing committed yet
+        finally:
+            lock.execute("ROLLBACK")
+            lock.close()
+        for ledger in ledgers:
+            ledger.close()
+        assert sum(store.balances(f"room-{i}").get("P0", 0) for i in range(20)) == sum(
+            1 for k in range(20_000) if k % 7 == 0
+        )
+
+def test_failed_begin_is_reported(tmp_path):
+    class LockedConnection(sqlite3.Connection):
+        def execute(self, sql, *args):
+            if sql == "BEGIN":
+                raise sqlite3.OperationalError("database is locked")
+            return super().execute(sql, *args)
+
+    class LockedStore(PointsStore):
+        def _connect(self):
+            return sqlite3.connect(self.path, check_same_thread=False, isolation_level=None,
+                                   factory=LockedConnection)
+
+    with LockedStore(str(tmp_path / "locked.db")) as store:
+        PointsLedger("g", store, batch_size=1).record("P", 1, "line")
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            store.flush()
+
+def test_room_ledger_matches_points(tmp_path):
+    with PointsStore(str(tmp_path / "rooms.db")) as store:
+        room = Room("r", bots=5, rng=random.Random(2), store=store)
+        room.start()
+        while room.step():
+            pass
+        room.ledger.close()
+        assert room.ledger.reconcile(room.pool_total, room.players)["ok"]
+        assert store.balances(room.ledger.game_id) == {p.name: p.points for p in room.players}
+
+def test_exit_mid_game_persists_the_ledger(tmp_path, monkeypatch):
+    path = str(tmp_path / "points.db")
+    answers = iter(["1", "N", "N", "N", "N", "exit"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+    with pytest.raises(SystemExit):
+        play_game(seed=5, ledger_path=path, quiet=True)
+    with sqlite3.connect(path) as db:
+        rows = db.execute("SELECT player, delta, reason FROM ledger ORDER BY seq").fetchall()
+    assert rows[:5] == [("You", 100, OPENING)] + [(f"Bot-{i}", 100, OPENING) for i in range(1, 5)]
@@ -0,0 +1,38 @@
+import asyncio
+
+from src.loadtest import percentiles, run_load, run_rooms
+from src.server import BingoServer, Room
+
+def test_percentiles():
+    p = percentiles(list(range(1, 1001)))
+    assert p == {"p50": 500, "p99": 990, "p999": 999}
+    assert percentiles([])["p99"] == 0.0
+
+def test_small_load_run():
+    report = run_load(rooms=3, clients_per_room=2, bots=2, interval=0.001, strategy="noisy", error_rate=0.2)
+    assert report["rooms_completed"] == 3
+    assert report["errors"] == 0
+    assert report["samples"]["draws"] > 0
+    assert report["draw_latency_ms"]["p50"] >= 0
+
+def test_refused_join_does_not_stall_the_room(monkeypatch):
+    join = Room.join
+
+    def refuse_c0(self, name, writer=None):
+        if name == "c0":
+            raise ValueError("name taken")
+        return join(self, name, writer)
+
+    monkeypatch.setattr(Room, "join", refuse_c0)
+
+    async def scenario():
+        server = BingoServer(bots=2, interval=0.001, seed=4)
+        srv = await server.start_tcp("127.0.0.1", 0)
+        port = srv.sockets[0].getsockname()[1]
+        stats = await asyncio.wait_for(run_rooms(("tcp", "127.0.0.1", port), ["a", "b"], 3), 10)
+        srv.close()
+        await srv.wait_closed()
+        return stats
+
+    stats = asyncio.run(scenario())
+    assert stats.errors == 2 and stats.rooms_completed == 2
@@ -0,0 +1,69 @@
+import json
+import random
+import time
+
+from src.game.bingo_card import generate_cards
+from src.game.engine import GameEngine, ScriptedProvider
+from src.game.hall import CountingHall, Hall
+from src.game.metrics import GameMetrics, Histogram
+from src.game.number_draw import NumberDrawer
+from src.game.player import Player
+
+def test_histogram_buckets():
+    h = Histogram((1, 10))
+    for v in (0.5, 1, 5, 50):
+        h.observe(v)
+    assert h.cumulative() == [("1", 2), ("10", 3), ("+Inf", 4)]
+    assert h.count == 4 and h.sum == 56.5
+
+def test_engine_records_and_exports(tmp_path):
+    cards = generate_cards(6, rng=random.Random(1))
+    players = [Player("You", cards[0])] + [Player(f"Bot-{i}", c, is_bot=True) for i, c in enumerate(cards[1:])]
+    metrics = GameMetrics()
+    engine = GameEngine(players, NumberDrawer(seed=1), providers={0: ScriptedProvider()}, metrics=metrics)
+    engine.run()
+
+    turns = metrics.histograms["turn_seconds"].count
+    assert turns == metrics.counters[("draws_total", ())]
+    # Human answers are counted as well as the bots' dispatch.
+    assert metrics.histograms["marks_per_draw"].sum == sum(len(p.marked) for p in players)
+    assert metrics.histograms["checks_per_draw"].sum >= metrics.histograms["marks_per_draw"].sum - len(players[0].marked)
+    assert type(engine.hall) is CountingHall
+    assert type(GameEngine(players, NumberDrawer(seed=1), providers={0: ScriptedProvider()}).hall) is Hall
+    text = metrics.to_prometheus()
+    assert "# TYPE bingo_turn_seconds histogram" in text
+    assert 'bingo_claims_total{kind="bot_bingo"}' in text or 'bingo_claims_total{kind="bingo"}' in text
+
+    path = tmp_path / "m.json"
+    metrics.write(str(path))
+    assert "turn_seconds" in json.loads(path.read_text())["histograms"]
+
+def test_precompute_counts_only_human_work():
+    cards = generate_cards(6, rng=random.Random(1))
+    players = [Player("You", cards[0])] + [Player(f"Bot-{i}", c, is_bot=True) for i, c in enumerate(cards[1:])]
+    metrics = GameMetrics()
+    GameEngine(players, NumberDrawer(seed=1), providers={0: ScriptedProvider()}, metrics=metrics,
+               precompute_bots=True).run()
+    assert metrics.histograms["marks_per_draw"].sum == len(players[0].marked) > 0
+
+def test_sink_flush_counts_as_render_time():
+    class SlowFlushSink:
+        flushes = 0
+
+        def emit(self, event):
+            pass
+
+        def flush(self):
+            SlowFlushSink.flushes += 1
+            time.sleep(0.002)
+
+    cards = generate_cards(4, rng=random.Random(2))
+    players = [Player("You", cards[0])] + [Player(f"Bot-{i}", c, is_bot=True) for i, c in enumerate(cards[1:])]
+    metrics = GameMetrics()
+    GameEngine(players, NumberDrawer(seed=2), providers={0: ScriptedProvider()},
+               sink=SlowFlushSink(), metrics=metrics).run()
+
+    assert SlowFlushSink.flushes >= metrics.counters[("draws_total", ())]
+    slept = 0.002 * SlowFlushSink.flushes
+    assert metrics.histograms["render_seconds"].sum >= slept
+    assert metrics.histograms["human_wait_seconds"].sum < slept
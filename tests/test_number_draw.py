@@ -1,4 +1,9 @@
-from src.game.number_draw import NumberDrawer
+import random
+
+import pytest
+
+from src.game.number_draw import CounterDrawer, DrawFeed, NumberDrawer, check_card
+from src.game.rng import rng_stream
 
 def test_draw_no_repetition():
     d = NumberDrawer(seed=123)
@@ -8,3 +13,72 @@ def test_draw_no_repetition():
         assert n not in seen
         seen.add(n)
     assert d.draw_next() is None
+
+def test_seed_is_private():
+    random.seed(0)
+    expected = random.random()
+    random.seed(0)
+    a = NumberDrawer(seed=5)
+    assert random.random() == expected
+    assert a.sequence() == NumberDrawer(seed=5).sequence()
+
+def test_rng_streams_independent():
+    a = NumberDrawer(rng=rng_stream(1, "game", 1)).sequence()
+    b = NumberDrawer(rng=rng_stream(1, "game", 1)).sequence()
+    c = NumberDrawer(rng=rng_stream(1, "game", 2)).sequence()
+    assert a == b
+    assert a != c
+
+def test_counter_drawer_random_access():
+    d = CounterDrawer(key=99, game_id=7)
+    seq = d.sequence()
+    assert sorted(seq) == list(range(1, 91))
+    assert seq == CounterDrawer(key=99, game_id=7).sequence()
+    assert seq != CounterDrawer(key=99, game_id=8).sequence()
+    assert d.number_at(42) == seq[41]
+
+    assert [d.draw_next() for _ in range(5)] == seq[:5]
+    d.seek(60)
+    assert d.draw_next() == seq[60]
+    d.seek(2)
+    assert d.drawn == set(seq[:2]) and d.turn == 2
+    d.seek(90)
+    assert d.draw_next() is None
+
+def test_check_card_yields_shared_history_views():
+    card = [[1, 2, 3, 4, 5], [6, 7, 8, 9, 10], [11, 12, 13, 14, 15]]
+    steps = list(check_card(card, turns=10, seed=4, echo=False))
+    seq = NumberDrawer(seed=4).sequence()
+    assert [n for n, _ in steps] == seq[:10]
+    n3, view3 = steps[2]
+    # Earlier views stay frozen while the feed keeps drawing.
+    assert view3 == set(seq[:3]) and list(view3) == seq[:3] and view3.last == n3
+    assert seq[5] not in view3 and seq[5] in steps[-1][1]
+    assert steps[-1][1]._order is view3._order
+    assert view3.mask == sum(1 << n for n in seq[:3])
+    assert steps[-1][1].turn_of(seq[4]) == 5 and view3.turn_of(seq[4]) is None
+    assert list(steps[-1][1].since(7)) == seq[7:10]
+    # Only drawn ints are members; negative indices do not wrap around.
+    assert all(-n not in steps[-1][1] for n in seq[:10])
+    assert 1000 not in view3 and "1" not in view3 and float(n3) not in view3
+    with pytest.raises(AttributeError):
+        view3.turn = 90
+    with pytest.raises(AttributeError):
+        view3.mask = 0
+
+def test_draw_feed_subscribers():
+    drawer = NumberDrawer(seed=9)
+    drawer.draw_next()
+    feed = DrawFeed(drawer)
+    assert feed.view.turn == 1 and drawer.sequence()[0] in feed.view
+    seen_a, seen_b = [], []
+    feed.subscribe(lambda n, view: seen_a.append((n, view)))
+    stop_b = feed.subscribe(lambda n, view: seen_b.append((n, view)))
+    feed.advance()
+    stop_b()
+    for _ in feed:
+        pass
+    assert len(seen_a) == 89 and len(seen_b) == 1
+    assert seen_a[0][1] is seen_b[0][1]
+    assert feed.view.mask == sum(1 << n for n in range(1, 91))
+    assert feed.advance() is None
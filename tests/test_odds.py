@@ -0,0 +1,36 @@
+from fractions import Fraction
+from itertools import permutations
+from math import comb
+
+from src.game import odds
+from src.simulate import cross_check, run_simulation, summarize
+
+def test_closed_forms():
+    assert odds.bingo_cdf()[15] == Fraction(1, comb(90, 15))
+    assert odds.bingo_cdf()[90] == 1
+    assert odds.line_cdf()[5] == Fraction(3, comb(90, 5))
+    assert odds.line_cdf()[4] == 0 and odds.line_cdf()[88] == 1 > odds.line_cdf()[87]
+
+def test_line_cdf_matches_enumeration():
+    # Pool 1..6, card rows {1} and {2, 3}: enumerate every draw order.
+    rows = [{1}, {2, 3}]
+    counts = [0] * 7
+    orders = list(permutations(range(1, 7)))
+    for order in orders:
+        t = min(max(order.index(n) + 1 for n in row) for row in rows)
+        counts[t] += 1
+    cdf = odds.line_cdf(6, (1, 2))
+    running = 0
+    for t in range(7):
+        running += counts[t]
+        assert cdf[t] == Fraction(running, len(orders))
+
+def test_exact_report_agrees_with_simulation():
+    exact = odds.exact_report(5, line_percent=0.10, bingo_percent=0.50, starting_points=100)
+    sim = summarize(run_simulation(3000, 5, seed=11, workers=1), 5,
+                    line_percent=0.10, bingo_percent=0.50, starting_points=100)
+    check = cross_check(sim, exact)
+    assert abs(check["line_turn.mean"][0] - check["line_turn.mean"][1]) < 0.6
+    assert abs(check["bingo_turn.mean"][0] - check["bingo_turn.mean"][1]) < 0.4
+    assert abs(check["line_awards_per_game"][0] - check["line_awards_per_game"][1]) < 0.1
+    assert abs(sum(exact["bingo_turn"]["histogram"].values()) - 1) < 1e-9
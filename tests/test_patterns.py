@@ -0,0 +1,89 @@
+import random
+
+import pytest
+
+from src.game import patterns as pt
+from src.game.bingo_card import generate_cards
+from src.game.engine import GameEngine, ListSink, ScriptedProvider
+from src.game.number_draw import NumberDrawer
+from src.game.player import Player
+
+CARD = [
+    [1,2,3,4,5],
+    [6,7,8,9,10],
+    [11,12,13,14,15],
+]
+
+def test_stock_shapes():
+    assert pt.four_corners().number_mask(CARD) == sum(1 << n for n in (1, 5, 11, 15))
+    assert sorted(pt.diagonal().cells) == [(0, 0), (1, 2), (2, 4)]
+    assert sorted(pt.anti_diagonal().cells) == [(0, 4), (1, 2), (2, 0)]
+    t = pt.from_shape("T", "XXXXX\n..X..\n..X..")
+    assert len(t.cells) == 7
+    with pytest.raises(ValueError):
+        pt.from_shape("bad", "XX\nXX")
+
+def test_index_reports_each_completion_once():
+    p = Player("P", CARD)
+    index = pt.PatternIndex([p], [*pt.rows(), *pt.columns(), pt.four_corners(), pt.full_house()])
+    seen = []
+    for n in [1, 5, 11, 6, 15, 6, 2, 3, 4]:
+        seen += [pat.name for _, pat in index.draw(n)]
+    assert seen == ["column-1", "four-corners", "row-1"]
+    assert index.won(p) == ["row-1", "column-1", "four-corners"]
+
+def test_index_matches_brute_force():
+    rng = random.Random(3)
+    cards = generate_cards(50, rng=rng)
+    players = [Player(f"P{i}", c) for i, c in enumerate(cards)]
+    pats = [*pt.rows(), *pt.columns(), pt.four_corners(), pt.diagonal(), pt.anti_diagonal(), pt.full_house()]
+    index = pt.PatternIndex(players, pats)
+    won = set()
+    for n in NumberDrawer(seed=3).sequence():
+        for p in players:
+            p.mark_number(n)
+        got = {(p.name, pat.name) for p, pat in index.draw(n)}
+        now = {(p.name, pat.name) for p in players for pat in pats if p.check_pattern(pat)}
+        assert got == now - won
+        won = now
+
+def test_engine_emits_pattern_events():
+    cards = generate_cards(4, rng=random.Random(7))
+    players = [Player("You", cards[0])] + [Player(f"Bot-{i}", c, is_bot=True) for i, c in enumerate(cards[1:])]
+    sink = ListSink()
+    GameEngine(players, NumberDrawer(seed=1), providers={0: ScriptedProvider()}, sink=sink,
+               patterns=[pt.four_corners()]).run()
+    events = [e for e in sink.events if e.kind == "pattern"]
+    assert events
+    assert len({e.player.name for e in events}) == len(events)
+    for e in events:
+        assert e.claim == "four-corners" and e.player.check_pattern(pt.four_corners())
+
+def test_index_covers_extra_cards():
+    extra = [[21, 22, 23, 24, 25], [26, 27, 28, 29, 30], [31, 32, 33, 34, 35]]
+    bot = Player.with_cards("Bot", [CARD, extra], is_bot=True)
+    index = pt.PatternIndex([bot], [pt.four_corners()])
+    assert index.slots == {(0, 0): 0, (0, 1): 1}
+    seen = []
+    for n in (21, 25, 31, 35):
+        bot.mark_number(n)
+        seen += index.draw(n)
+    assert seen == [(bot, pt.four_corners())]
+    assert bot.check_pattern(pt.four_corners()) and index.won(bot) == ["four-corners"]
+
+def test_seventy_five_ball_geometry():
+    from src.game.variants import CLASSIC, SEVENTY_FIVE_BALL
+    card = SEVENTY_FIVE_BALL.generate_card(random.Random(2))
+    p = Player("P", card)
+    index = pt.PatternIndex([p], pt.stock(SEVENTY_FIVE_BALL))
+    assert index.compiled.variant is SEVENTY_FIVE_BALL
+    seen = []
+    for n in (card[0][0], card[0][4], card[4][0], card[4][4]):
+        seen += [pat.name for _, pat in index.draw(n)]
+    assert seen == ["four-corners"]
+    for n in (card[1][1], card[3][3]):  # centre is free
+        seen += [pat.name for _, pat in index.draw(n)]
+    assert seen[-1] == "diagonal"
+    assert "row-3" not in seen and "column-5" not in seen
+    with pytest.raises(ValueError):
+        pt.PatternIndex([p], pt.stock(), variant=CLASSIC)
@@ -1,4 +1,9 @@
+import random
+
+import pytest
+
 from src.game.player import Player
+from src.game.variants import CLASSIC
 
 def test_line_check():
     card = [
@@ -22,3 +27,42 @@ def test_bingo_check():
     for n in range(1,16):
         p.mark_number(n)
     assert p.check_bingo() is True
+
+def test_marking_and_views():
+    card = [
+        [1,2,3,4,5],
+        [6,7,8,9,10],
+        [11,12,13,14,15],
+    ]
+    p = Player("P", card, points=0)
+    assert p.has_number(7) and not p.has_number(90)
+    assert not p.has_number(0) and not p.has_number(-1)
+    assert p.mark_number(7) is True
+    assert p.mark_number(90) is False and p.mark_number(-1) is False
+    assert p.marked == {7}
+    with pytest.raises(AttributeError):
+        p.marked.add(8)
+    assert p.row_complete(1) is False
+    assert not hasattr(p, "__dict__")
+
+def test_multi_card_player_uses_one_index():
+    strip = CLASSIC.generate_strip(random.Random(5))
+    p = Player.with_cards("P", strip)
+    assert len(p.cards) == 6 and p.card_numbers() == set(range(1, 91))
+    first = strip[3][1]
+    for n in first:
+        p.mark_number(n)
+    assert p.line_through(first[0]) and p.check_line() and not p.check_bingo()
+    assert p.locate(first[0]) == [(3, 1)]
+    assert p.line_to_go() == 0
+    for n in strip[2][0] + strip[2][1] + strip[2][2]:
+        p.mark_number(n)
+    assert p.check_bingo() and p.bingo_to_go() == 0
+
+def test_repeated_number_marks_every_card():
+    a = [[1,2,3,4,5],[6,7,8,9,10],[11,12,13,14,15]]
+    b = [[1,20,30,40,50],[60,61,62,63,64],[70,71,72,73,74]]
+    p = Player.with_cards("P", [a, b])
+    p.mark_number(1)
+    assert p.locate(1) == [(0, 0), (1, 0)]
+    assert p.row_to_go(0) == 4 and p.row_to_go(3) == 4
@@ -0,0 +1,65 @@
+import io
+
+from src.game.engine import GameEvent
+from src.game.player import Player
+from src.game.render import SNAPSHOT, BoardView, card_text, frame
+from src.main import PrintSink
+
+CARD = [[1, 22, 43, 64, 85], [7, 18, 39, 50, 71], [3, 14, 25, 36, 90]]
+
+
+def test_card_text_grid():
+    text = card_text(CARD, {22, 90}, title="Card:")
+    lines = text.split("\n")
+    assert lines[:3] == ["", "Card:", "┌────┬────┬────┬────┬────┐"]
+    assert lines[3] == "│  1 │[22]│ 43 │ 64 │ 85 │"
+    assert lines[7] == "│  3 │ 14 │ 25 │ 36 │[90]│"
+    assert text.endswith("└────┴────┴────┴────┴────┘\n")
+
+
+def test_card_text_snapshot_and_blanks():
+    assert card_text(CARD, {1}, style=SNAPSHOT).split("\n")[1] == " │ [ 1] │  22  │  43  │  64  │  85  │"
+    assert card_text([[None, 5]]).split("\n")[1] == "│    │  5 │"
+    assert frame(3, 5) is frame(3, 5)
+
+
+def test_cell_positions_match_text():
+    for style in ("grid", SNAPSHOT):
+        f = frame(3, 5, style)
+        lines = f.lines(CARD, {50})
+        line, col = f.cell_pos[1][3]
+        assert lines[line][col:col + 4] == "[50]"
+
+
+def test_board_view_diff_only_rewrites_changed_cells():
+    out = io.StringIO()
+    view = BoardView([CARD, CARD], stream=out, ansi=True)
+    view.draw([set(), set()])
+    first = view.bytes_written
+    view.draw([{22}, set()])
+    update = out.getvalue()[len(out.getvalue()) - (view.bytes_written - first):]
+    assert update.count("[22]") == 1 and "┌" not in update
+    assert view.bytes_written - first < first / 20
+    before = view.bytes_written
+    view.draw([{22, 99}, {99}])  # nothing visible changed
+    assert view.bytes_written == before
+
+
+def test_board_view_plain_reprints_changed_cards():
+    out = io.StringIO()
+    view = BoardView([CARD, CARD], titles=["A", "B"], stream=out, ansi=False)
+    view.draw([set(), set()])
+    out.truncate(0), out.seek(0)
+    view.draw([set(), {7}])
+    assert out.getvalue() == card_text(CARD, {7}, title="B")
+
+
+def test_print_sink_buffers_and_quiet(capsys):
+    bot = Player("Bot-1", CARD, is_bot=True)
+    sink = PrintSink(quiet=True)
+    sink.emit(GameEvent("draw", turn=1, number=22))
+    sink.emit(GameEvent("bot_claim", turn=1, player=bot, claim="L", delta=10))
+    assert capsys.readouterr().out == ""
+    sink.flush()
+    out = capsys.readouterr().out
+    assert "Number drawn: 22" in out and "claims" not in out
@@ -0,0 +1,44 @@
+import random
+
+from src.game.bingo_card import generate_cards
+from src.game.hall import Hall
+from src.game.number_draw import NumberDrawer
+from src.game.player import Player
+from src.game.schedule import ClaimSchedule
+
+def _players(cards):
+    return [Player(f"Bot-{i}", card, is_bot=True) for i, card in enumerate(cards)]
+
+def test_schedule_matches_dispatch():
+    cards = generate_cards(40, rng=random.Random(11))
+    sequence = NumberDrawer(seed=11).sequence()
+    hall = Hall(_players(cards))
+    scheduled = _players(cards)
+    schedule = ClaimSchedule(scheduled, sequence)
+
+    for turn, n in enumerate(sequence, start=1):
+        claims = hall.dispatch(n)
+        for p, c in claims:
+            p.award_line(0) if c == "L" else p.award_bingo(0)
+        expected = [(p.name, c) for p, c in claims]
+        got = [(p.name, c) for p, c in schedule.pop_due(turn)]
+        assert got == expected
+    assert len(schedule) == 0
+
+def test_humans_not_scheduled():
+    card = [[1,2,3,4,5],[6,7,8,9,10],[11,12,13,14,15]]
+    schedule = ClaimSchedule([Player("You", card)], list(range(1, 91)))
+    assert schedule.next_turn() is None
+
+def test_multi_card_bots_schedule_matches_dispatch():
+    rng = random.Random(4)
+    cards = generate_cards(60, rng=rng)
+    def seat():
+        return [Player.with_cards(f"Bot-{i}", cards[i * 6:(i + 1) * 6], is_bot=True) for i in range(10)]
+    sequence = NumberDrawer(seed=4).sequence()
+    hall, schedule = Hall(seat()), ClaimSchedule(seat(), sequence)
+    for turn, n in enumerate(sequence, start=1):
+        claims = hall.dispatch(n)
+        for p, c in claims:
+            p.award_line(0) if c == "L" else p.award_bingo(0)
+        assert [(p.name, c) for p, c in schedule.pop_due(turn)] == [(p.name, c) for p, c in claims]
@@ -0,0 +1,153 @@
+import asyncio
+import random
+
+from src.server import BingoServer, Room
+
+def test_room_rules_without_sockets():
+    room = Room("r1", bots=3, rng=random.Random(5))
+    seat = room.join("alice")
+    assert room.handle(seat, "Y") == "ERR no draw in progress"
+    assert room.handle(seat, "START") == "OK"
+    assert room.pool_total == 400
+
+    while room.step():
+        me = room.players[seat]
+        reply = room.handle(seat, "Y" if me.has_number(room.current) else "N")
+        assert reply in ("MARKED", "OK")
+        assert room.handle(seat, "Y") == "ERR already answered"
+        if me.check_bingo():
+            assert room.handle(seat, "B").startswith("BINGO")
+            break
+    assert room.finished and room.winner is not None
+    assert room.players[seat].points >= 100
+
+def test_client_plays_over_tcp():
+    async def scenario():
+        server = BingoServer(bots=2, interval=0.001, seed=1)
+        srv = await server.start_tcp("127.0.0.1", 0)
+        port = srv.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        async def send(line):
+            writer.write((line + "\n").encode())
+            await writer.drain()
+
+        async def recv():
+            return (await asyncio.wait_for(reader.readline(), 5)).decode().split()
+
+        await send("JOIN room-a bob")
+        assert (await recv())[0] == "WELCOME"
+        card = {int(v) for row in (await recv())[1].split(";") for v in row.split(",")}
+        await send("START")
+        lines = []
+        while True:
+            msg = await recv()
+            lines.append(msg[0])
+            if msg[0] == "DRAW":
+                await send("Y" if int(msg[2]) in card else "N")
+            if msg[0] == "END":
+                break
+        writer.close()
+        srv.close()
+        await srv.wait_closed()
+        return lines
+
+    lines = asyncio.run(scenario())
+    assert "START" in lines and "DRAW" in lines
+    assert "MARKED" in lines and "OK" in lines
+    assert lines[-1] == "END"
+
+def test_rooms_pick_their_variant_on_join():
+    async def scenario():
+        server = BingoServer(bots=2, interval=0.001, seed=2)
+        srv = await server.start_tcp("127.0.0.1", 0)
+        port = srv.sockets[0].getsockname()[1]
+
+        async def play(room, name, variant):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+            async def recv():
+                return (await asyncio.wait_for(reader.readline(), 5)).decode().split()
+
+            writer.write(f"JOIN {room} {name} {variant}\nSTART\n".encode())
+            welcome, card = await recv(), await recv()
+            rows = card[1].split(";")
+            numbers = {int(v) for row in rows for v in row.split(",") if v != "-"}
+            while (msg := await recv())[0] != "END":
+                if msg[0] == "DRAW":
+                    writer.write(("Y\n" if int(msg[2]) in numbers else "N\n").encode())
+            writer.close()
+            return welcome, len(rows), len(rows[0].split(","))
+
+        async def mismatch():
+            while "room-a" not in server.rooms:
+                await asyncio.sleep(0.001)
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"JOIN room-a carol 90-ball\n")
+            line = (await asyncio.wait_for(reader.readline(), 5)).decode()
+            writer.close()
+            return line
+
+        results = await asyncio.gather(
+            play("room-a", "alice", "75-ball"), play("room-b", "bob", "90-ball"), mismatch()
+        )
+        srv.close()
+        await srv.wait_closed()
+        return results
+
+    (welcome_a, rows_a, cols_a), (welcome_b, rows_b, cols_b), err = asyncio.run(scenario())
+    assert welcome_a[-1] == "75-ball" and (rows_a, cols_a) == (5, 5)
+    assert welcome_b[-1] == "90-ball" and (rows_b, cols_b) == (3, 9)
+    assert err.startswith("ERR room room-a plays 75-ball")
+
+def test_empty_room_is_removed_before_start():
+    async def scenario():
+        server = BingoServer(bots=2, interval=0.001, seed=3)
+        srv = await server.start_tcp("127.0.0.1", 0)
+        port = srv.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"JOIN room-x dave\n")
+        await asyncio.wait_for(reader.readline(), 5)
+        joined = "room-x" in server.rooms
+        writer.write(b"QUIT\n")
+        await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+        srv.close()
+        await srv.wait_closed()
+        return joined, "room-x" in server.rooms
+
+    assert asyncio.run(scenario()) == (True, False)
+
+def test_stuck_client_is_dropped():
+    class StuckWriter:
+        """A client whose socket never takes more data."""
+
+        def __init__(self):
+            self.transport = self
+            self.aborted = False
+
+        def is_closing(self):
+            return self.aborted
+
+        def write(self, data):
+            pass
+
+        def get_write_buffer_size(self):
+            return 1
+
+        async def drain(self):
+            await asyncio.Event().wait()
+
+        def abort(self):
+            self.aborted = True
+
+    async def scenario():
+        room = Room("r1", bots=1, rng=random.Random(1), drain_timeout=0.01)
+        stuck = StuckWriter()
+        seat = room.join("slow", stuck)
+        room.start()
+        await room.drain()
+        return room, seat, stuck
+
+    room, seat, stuck = asyncio.run(scenario())
+    assert stuck.aborted and seat not in room.writers
@@ -0,0 +1,15 @@
+from src.simulate import run_simulation, summarize
+
+def test_deterministic_across_workers():
+    a = run_simulation(60, 5, seed=3, workers=1, chunk=20)
+    b = run_simulation(60, 5, seed=3, workers=2, chunk=20)
+    assert a == b
+    assert a.games == 60
+    assert sum(a.bingo_turns.values()) == 60
+
+def test_summary_payout():
+    stats = run_simulation(40, 5, seed=1, workers=1)
+    report = summarize(stats, 5, line_percent=0.10, bingo_percent=0.50, starting_points=100)
+    assert report["pool_total"] == 500
+    assert 15 <= report["bingo_turn"]["mean"] <= 90
+    assert report["expected_payout"] >= 250
@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from src.game.bingo_card import complete_card
+from src.game.number_draw import NumberDrawer
+from src.game.player import Player
+from src.game import variants
+from src.game.variants import CLASSIC, NINETY_BALL, SEVENTY_FIVE_BALL, Variant, get_variant
+from src.server import Room
+
+def test_classic_matches_complete_card():
+    assert CLASSIC.generate_card(random.Random(4)) == complete_card(random.Random(4))
+
+def test_stock_variants_deal_valid_cards():
+    rng = random.Random(1)
+    for v in (CLASSIC, NINETY_BALL, SEVENTY_FIVE_BALL):
+        for _ in range(200):
+            v.validate(v.generate_card(rng))
+    card = SEVENTY_FIVE_BALL.generate_card(rng)
+    assert card[2][2] is None
+    assert all(16 <= card[r][1] <= 30 for r in range(5))
+    assert NINETY_BALL.column_of[90] == 8 and NINETY_BALL.column_of[9] == 0
+
+def test_free_and_blank_cells_play_like_marked():
+    card = SEVENTY_FIVE_BALL.generate_card(random.Random(2))
+    p = Player("P", card)
+    assert p.line_to_go() == 4 and p.bingo_to_go() == 24
+    for n in card[2]:
+        if n is not None:
+            p.mark_number(n)
+    assert p.check_line() and not p.check_bingo()
+    for n in NumberDrawer(seed=2, number_range=(1, 75)).sequence():
+        p.mark_number(n)
+    assert p.check_bingo()
+
+def test_invalid_geometry_and_names():
+    with pytest.raises(ValueError):
+        Variant("tiny", 3, 5, (1, 10))
+    with pytest.raises(ValueError):
+        Variant("cols", 2, 2, (1, 10), column_ranges=[(1, 1), (2, 10)])
+    with pytest.raises(ValueError):
+        get_variant("nope")
+
+def test_impossible_row_geometry_is_rejected(monkeypatch):
+    # Column 0 can hold one number but every row needs all 5 columns.
+    with pytest.raises(ValueError, match="cannot hold"):
+        Variant("x", 3, 5, (1, 20), column_ranges=[(1, 1), (2, 5), (6, 10), (11, 15), (16, 20)],
+                numbers_per_row=5)
+
+    class SameColumns(random.Random):
+        def sample(self, population, k):
+            return list(population)[:k]
+
+    # A generator that never yields a valid layout hits the retry cap instead of spinning.
+    monkeypatch.setattr(variants, "MAX_ATTEMPTS", 50)
+    with pytest.raises(ValueError, match="attempts"):
+        NINETY_BALL.generate_card(SameColumns())
+
+def test_rooms_of_different_variants_side_by_side():
+    classic = Room("a", bots=3, rng=random.Random(1))
+    big = Room("b", bots=3, rng=random.Random(1), variant=NINETY_BALL)
+    assert len(classic.players[0].card[0]) == 5 and len(big.players[0].card[0]) == 9
+    for room in (classic, big):
+        room.start()
+        while room.step():
+            pass
+        assert room.winner is not None
+
+def test_strips_cover_the_pool_once():
+    rng = random.Random(6)
+    for v in (CLASSIC, NINETY_BALL):
+        strip = v.generate_strip(rng)
+        assert len(strip) == 6
+        for card in strip:
+            v.validate(card)
+        assert sorted(n for card in strip for row in card for n in row if n is not None) == list(v.pool)
+    with pytest.raises(ValueError):
+        SEVENTY_FIVE_BALL.generate_strip(rng)